@@ -8,6 +8,7 @@ import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
+import gammapy.utils.parallel as parallel
 import gammapy.utils.time as tu
 from gammapy.utils.pbar import progress_bar
 from gammapy.utils.scripts import make_path
@@ -46,6 +47,10 @@ class DataStore:
         HDU index table.
     obs_table : `~gammapy.data.ObservationTable`
         Observation index table.
+    events_cache_dir : str or `~pathlib.Path`, optional
+        Directory of an on-disk columnar cache of the event lists, see
+        `~gammapy.data.EventList.read`. Cached events are used as long as the
+        events files are unchanged. Default is None.
 
     Examples
     --------
@@ -77,9 +82,10 @@ class DataStore:
     DEFAULT_OBS_TABLE = "obs-index.fits.gz"
     """Default observation table filename."""
 
-    def __init__(self, hdu_table=None, obs_table=None):
+    def __init__(self, hdu_table=None, obs_table=None, events_cache_dir=None):
         self.hdu_table = hdu_table
         self.obs_table = obs_table
+        self.events_cache_dir = events_cache_dir
 
     def __str__(self):
         return self.info(show=False)
@@ -96,7 +102,9 @@ class DataStore:
         return np.unique(self.hdu_table["OBS_ID"].data)
 
     @classmethod
-    def from_file(cls, filename, hdu_hdu="HDU_INDEX", hdu_obs="OBS_INDEX"):
+    def from_file(
+        cls, filename, hdu_hdu="HDU_INDEX", hdu_obs="OBS_INDEX", events_cache_dir=None
+    ):
         """Create a Datastore from a FITS file.
 
         The FITS file must contain both index files.
@@ -109,6 +117,9 @@ class DataStore:
             FITS HDU name or number for the HDU index table. Default is "HDU_INDEX".
         hdu_obs : str or int, optional
             FITS HDU name or number for the observation index table. Default is "OBS_INDEX".
+        events_cache_dir : str or `~pathlib.Path`, optional
+            Directory of an on-disk columnar cache of the event lists, see
+            `~gammapy.data.EventList.read`. Default is None.
 
         Returns
         -------
@@ -123,10 +134,18 @@ class DataStore:
         if hdu_obs:
             obs_table = ObservationTable.read(filename, hdu=hdu_obs, format="fits")
 
-        return cls(hdu_table=hdu_table, obs_table=obs_table)
+        return cls(
+            hdu_table=hdu_table, obs_table=obs_table, events_cache_dir=events_cache_dir
+        )
 
     @classmethod
-    def from_dir(cls, base_dir, hdu_table_filename=None, obs_table_filename=None):
+    def from_dir(
+        cls,
+        base_dir,
+        hdu_table_filename=None,
+        obs_table_filename=None,
+        events_cache_dir=None,
+    ):
         """Create from a directory.
 
         Parameters
@@ -139,6 +158,9 @@ class DataStore:
         obs_table_filename : str or `~pathlib.Path`, optional
             Filename of the observation index file. May be specified either relative
             to `base_dir` or as an absolute path. If None, default is obs-index.fits.gz.
+        events_cache_dir : str or `~pathlib.Path`, optional
+            Directory of an on-disk columnar cache of the event lists, see
+            `~gammapy.data.EventList.read`. Default is None.
 
         Returns
         -------
@@ -181,10 +203,19 @@ class DataStore:
             log.debug(f"Reading {obs_table_filename}")
             obs_table = ObservationTable.read(obs_table_filename, format="fits")
 
-        return cls(hdu_table=hdu_table, obs_table=obs_table)
+        return cls(
+            hdu_table=hdu_table, obs_table=obs_table, events_cache_dir=events_cache_dir
+        )
 
     @classmethod
-    def from_events_files(cls, events_paths, irfs_paths=None):
+    def from_events_files(
+        cls,
+        events_paths,
+        irfs_paths=None,
+        n_jobs=None,
+        parallel_backend=None,
+        events_cache_dir=None,
+    ):
         """Create from a list of event filenames.
 
         HDU and observation index tables will be created from the EVENTS header.
@@ -205,6 +236,14 @@ class DataStore:
             as `events_paths`. If None the events files have to contain CALDB and
             IRF header keywords to locate the IRF files, otherwise the IRFs are
             assumed to be contained in the events files.
+        n_jobs : int, optional
+            Number of processes used to read the events file headers.
+            Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+        parallel_backend : {'multiprocessing', 'ray'}, optional
+            Which backend to use for multiprocessing. Default is None.
+        events_cache_dir : str or `~pathlib.Path`, optional
+            Directory of an on-disk columnar cache of the event lists, see
+            `~gammapy.data.EventList.read`. Default is None.
 
         Returns
         -------
@@ -242,7 +281,15 @@ class DataStore:
         >>> data_store.hdu_table.write("hdu-index.fits.gz") # doctest: +SKIP
         >>> data_store.obs_table.write("obs-index.fits.gz") # doctest: +SKIP
         """
-        return DataStoreMaker(events_paths, irfs_paths).run()
+        maker = DataStoreMaker(
+            events_paths,
+            irfs_paths,
+            n_jobs=n_jobs,
+            parallel_backend=parallel_backend,
+        )
+        data_store = maker.run()
+        data_store.events_cache_dir = events_cache_dir
+        return data_store
 
     def info(self, show=True):
         """Print some info."""
@@ -320,6 +367,7 @@ class DataStore:
                 warn_missing=False,
             )
             if hdu_location is not None:
+                hdu_location.events_cache_dir = self.events_cache_dir
                 kwargs[hdu] = hdu_location
             elif hdu in required_hdus:
                 missing_hdus.append(hdu)
@@ -348,6 +396,7 @@ class DataStore:
         skip_missing=False,
         required_irf="full-enclosure",
         require_events=True,
+        prefetch=None,
     ):
         """Generate a `~gammapy.data.Observations`.
 
@@ -386,6 +435,11 @@ class DataStore:
             Default is `"full-enclosure"`.
         require_events : bool, optional
             Require events and gti table or not. Default is True.
+        prefetch : int, optional
+            Number of upcoming observations whose HDUs are read ahead in a thread
+            pool when iterating with `~gammapy.data.Observations.in_memory_generator`,
+            as done by `~gammapy.makers.DatasetsMaker` when running in a single process.
+            Default is None, which disables prefetching.
 
         Returns
         -------
@@ -413,7 +467,7 @@ class DataStore:
             obs_list.append(obs)
 
         log.info(f"Observations selected: {len(obs_list)} out of {len(obs_id)}.")
-        return Observations(obs_list)
+        return Observations(obs_list, prefetch=prefetch)
 
     def copy_obs(self, obs_id, outdir, hdu_class=None, verbose=False, overwrite=False):
         """Create a new `~gammapy.data.DataStore` containing a subset of observations.
@@ -546,14 +600,29 @@ class DataStoreChecker(Checker):
             yield from ObservationChecker(obs).run()
 
 
-class DataStoreMaker:
+class DataStoreMaker(parallel.ParallelMixin):
     """Create data store index tables.
 
     This is a multistep process coded as a class.
     Users will usually call this via `DataStore.from_events_files`.
+
+    Parameters
+    ----------
+    events_paths : list of str or `~pathlib.Path`
+        List of paths to the events files.
+    irfs_paths : str or `~pathlib.Path`, or list of str or list of `~pathlib.Path`, optional
+        Path to the IRFs file. If a list is provided it must be the same length
+        as `events_paths`. Default is None.
+    n_jobs : int, optional
+        Number of processes used to read the events file headers.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray'}, optional
+        Which backend to use for multiprocessing. Default is None.
     """
 
-    def __init__(self, events_paths, irfs_paths=None):
+    def __init__(
+        self, events_paths, irfs_paths=None, n_jobs=None, parallel_backend=None
+    ):
         if isinstance(events_paths, (str, Path)):
             raise TypeError("Need list of paths, not a single string or Path object.")
 
@@ -565,9 +634,12 @@ class DataStoreMaker:
 
         # Cache for EVENTS file header information, to avoid multiple reads
         self._events_info = {}
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
     def run(self):
         """Run all steps."""
+        self.read_all_events_info()
         hdu_table = self.make_hdu_table()
         obs_table = self.make_obs_table()
         return DataStore(hdu_table=hdu_table, obs_table=obs_table)
@@ -586,13 +658,35 @@ class DataStoreMaker:
         # We could add or remove info here depending on what we want in the obs table
         return self.get_events_info(events_path, irf_path)
 
+    def read_all_events_info(self):
+        """Read the header information of all events files not read yet.
+
+        The headers are read in parallel according to ``n_jobs``.
+        """
+        paths = [
+            (events_path, irf_path)
+            for events_path, irf_path in zip(self.events_paths, self.irfs_paths)
+            if events_path not in self._events_info
+        ]
+
+        infos = parallel.run_multiprocessing(
+            self.read_events_info,
+            paths,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="Events headers",
+        )
+
+        for (events_path, _), info in zip(paths, infos):
+            self._events_info[events_path] = info
+
     @staticmethod
     def read_events_info(events_path, irf_path=None):
         """Read mandatory events header information."""
         log.debug(f"Reading {events_path}")
 
-        with fits.open(events_path, memmap=False) as hdu_list:
-            header = hdu_list["EVENTS"].header
+        # only the header is needed, the event data is not read
+        header = fits.getheader(events_path, extname="EVENTS", memmap=False)
 
         na_int, na_str = -1, "NOT AVAILABLE"
 
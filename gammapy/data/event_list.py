@@ -1,21 +1,30 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import collections
 import copy
+import hashlib
 import html
+import json
 import logging
+import os
+import shutil
+import tempfile
 import warnings
+from pathlib import Path
 import numpy as np
 from astropy import units as u
 from astropy.coordinates import AltAz, Angle, SkyCoord, angular_separation
 from astropy.io import fits
-from astropy.table import Table
+from astropy.table import Column, MaskedColumn, Table
 from astropy.table import vstack as vstack_tables
+from astropy.time import Time
 from astropy.visualization import quantity_support
 import matplotlib.pyplot as plt
 from gammapy.maps import MapAxis, MapCoord, RegionGeom, WcsNDMap
 from gammapy.maps.axes import UNIT_STRING_FORMAT
 from gammapy.utils.fits import earth_location_from_dict
+from gammapy.utils.regions import compound_region_to_regions
 from gammapy.utils.scripts import make_path
+from gammapy.utils.table import _cached_from_column_buffers
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
 from .metadata import EventListMetaData
@@ -27,6 +36,243 @@ __all__ = ["EventList"]
 log = logging.getLogger(__name__)
 
 
+def _convert_column(column):
+    """Mask invalid values and decode strings of a column, as done by `~astropy.table.Table.read`."""
+    if isinstance(column, MaskedColumn):
+        return column
+
+    dtype = column.dtype.subdtype[0] if column.dtype.subdtype else column.dtype
+
+    if issubclass(dtype.type, np.inexact):
+        mask, fill_value = np.isnan(column), np.nan
+    elif issubclass(dtype.type, np.character):
+        mask, fill_value = np.asarray(column) == b"", b""
+    else:
+        return column
+
+    if np.any(mask):
+        column = MaskedColumn(column, mask=mask, fill_value=fill_value, copy=False)
+
+    if dtype.kind == "S":
+        column = column.astype(dtype.str.replace("S", "U"))
+
+    return column
+
+
+# Zenithal projections, for which the angular distance to the reference point
+# grows monotonically with the distance to the reference pixel
+ZENITHAL_PROJECTIONS = ["TAN", "SIN", "ARC", "ZEA", "STG"]
+
+# Margin in rad added to cone queries to absorb rounding errors
+SPATIAL_INDEX_MARGIN = 1e-7
+
+
+def _region_bounding_cone(geom):
+    """Cone containing all positions that ``geom.contains`` can select.
+
+    The pixel bounding box of the region is transformed to the sky. For
+    zenithal projections the separation to the projection reference point is
+    largest at one of the box corners, which bounds the region exactly.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.RegionGeom`
+        Region geometry.
+
+    Returns
+    -------
+    cone : tuple of (`~astropy.coordinates.SkyCoord`, `~astropy.coordinates.Angle`) or None
+        Cone center and radius. None if no bounding cone can be derived.
+    """
+    wcs = geom.wcs
+
+    if geom.region is None or geom.is_all_point_sky_regions:
+        return None
+
+    if wcs.wcs.ctype[0][-3:] not in ZENITHAL_PROJECTIONS:
+        return None
+
+    regions = compound_region_to_regions(geom.region)
+    bbox = regions[0].to_pixel(wcs).bounding_box
+
+    for region in regions[1:]:
+        bbox = bbox.union(region.to_pixel(wcs).bounding_box)
+
+    x = np.array([bbox.ixmin - 1, bbox.ixmax + 1])
+    y = np.array([bbox.iymin - 1, bbox.iymax + 1])
+    corners = wcs.pixel_to_world(*np.meshgrid(x, y))
+    center = wcs.pixel_to_world(*(wcs.wcs.crpix - 1))
+    radius = center.separation(corners).max()
+
+    if not np.isfinite(radius):
+        return None
+
+    return center, radius
+
+
+class _EventSpatialIndex:
+    """Spatial index of event positions.
+
+    The unit vectors of the event positions are sorted by their z component,
+    so that a cone query only tests the events in the declination band
+    covered by the cone.
+
+    Parameters
+    ----------
+    lon, lat : `~numpy.ndarray`
+        Event RA and DEC in degrees.
+    """
+
+    def __init__(self, lon, lat):
+        lon, lat = np.deg2rad(lon, dtype=float), np.deg2rad(lat, dtype=float)
+        xyz = np.stack(
+            [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+        )
+        self.order = np.argsort(xyz[2], kind="stable")
+        self.xyz = xyz[:, self.order]
+
+    def query_cone(self, center, radius):
+        """Indices of the events that may lie within a cone.
+
+        Parameters
+        ----------
+        center : `~astropy.coordinates.SkyCoord`
+            Cone center.
+        radius : `~astropy.coordinates.Angle`
+            Cone radius.
+
+        Returns
+        -------
+        idx : `~numpy.ndarray`
+            Sorted indices of the candidate events, a superset of the events
+            within the cone.
+        """
+        center = center.icrs
+        lon, lat = center.ra.rad, center.dec.rad
+        radius = Angle(radius).rad + SPATIAL_INDEX_MARGIN
+
+        if radius >= np.pi:
+            return np.arange(len(self.order))
+
+        z_min = np.sin(max(lat - radius, -np.pi / 2))
+        z_max = np.sin(min(lat + radius, np.pi / 2))
+        i_min = np.searchsorted(self.xyz[2], z_min, side="left")
+        i_max = np.searchsorted(self.xyz[2], z_max, side="right")
+
+        vector = np.array(
+            [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+        )
+        selected = vector @ self.xyz[:, i_min:i_max] >= np.cos(radius)
+        return np.sort(self.order[i_min:i_max][selected])
+
+
+def _file_signature(filename):
+    stat = filename.stat()
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _event_cache_path(cache_dir, filename, hdu):
+    """Directory of the on-disk cache of an events HDU.
+
+    The name depends on the modification time and size of the events file, so
+    that a modified file is cached under a new name instead of replacing a cache
+    that might be in use.
+    """
+    signature = _file_signature(filename)
+    key = (
+        f"{filename.resolve().as_posix()}[{str(hdu).upper()}]"
+        f"-{signature['mtime_ns']}-{signature['size']}"
+    )
+    sha = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return make_path(cache_dir) / f"{filename.name}-{sha}"
+
+
+def _write_event_cache(path, filename, source):
+    """Write the columns of an events table as ``.npy`` files and the metadata as JSON.
+
+    The cache is written to a temporary directory first and renamed, so that
+    concurrent readers never see a partially written cache. If another process
+    published the cache first, its version is kept.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}-"))
+
+    try:
+        columns = []
+        for idx, name in enumerate(source.colnames):
+            column = source[name]
+            data = np.asarray(column)
+            data = data.astype(data.dtype.newbyteorder("="), copy=False)
+            np.save(tmp_path / f"{idx}.npy", data)
+
+            if isinstance(column, MaskedColumn):
+                np.save(tmp_path / f"{idx}.mask.npy", np.asarray(column.mask))
+
+            columns.append(
+                {
+                    "name": name,
+                    "unit": None if column.unit is None else column.unit.to_string(),
+                    "description": column.description,
+                    "masked": isinstance(column, MaskedColumn),
+                }
+            )
+
+        info = {"filename": filename.resolve().as_posix(), "columns": columns}
+        info.update(_file_signature(filename))
+        info["meta"] = dict(source.meta)
+
+        with (tmp_path / "meta.json").open("w") as f:
+            json.dump(info, f, default=str)
+
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            if not path.exists():
+                raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def _read_event_cache(path, filename):
+    """Open the columns of a cached events table memory-mapped.
+
+    Returns None if the cache does not exist, is incomplete or is older than
+    the events file.
+    """
+    try:
+        with (path / "meta.json").open() as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    signature = _file_signature(filename)
+
+    if any(info.get(key) != value for key, value in signature.items()):
+        return None
+
+    columns = []
+    for idx, column in enumerate(info["columns"]):
+        kwargs = dict(
+            name=column["name"], unit=column["unit"], description=column["description"]
+        )
+
+        try:
+            data = np.load(path / f"{idx}.npy", mmap_mode="r")
+
+            if column["masked"]:
+                mask = np.load(path / f"{idx}.mask.npy", mmap_mode="r")
+        except OSError:
+            return None
+
+        if column["masked"]:
+            columns.append(MaskedColumn(data, mask=mask, copy=False, **kwargs))
+        else:
+            columns.append(Column(data, copy=False, **kwargs))
+
+    meta = collections.OrderedDict(info["meta"])
+    return Table(columns, meta=meta, copy=False)
+
+
 class EventList:
     """Event list.
 
@@ -57,6 +303,10 @@ class EventList:
     - `energy` for ``ENERGY``
     - `galactic` for ``GLON``, ``GLAT``
 
+    Event lists read with ``lazy=True`` memory-map the events HDU. Their columns
+    are read on first access and row selections are stored as index arrays. The
+    full ``table`` is only created when it is accessed.
+
     Parameters
     ----------
     table : `~astropy.table.Table`
@@ -95,6 +345,109 @@ class EventList:
         self.table = table
         self.meta = meta or EventListMetaData()
 
+    @classmethod
+    def _from_source(cls, source, idx=None, columns=None, meta=None):
+        """Create a lazy event list from a memory-mapped table and row indices."""
+        events = cls.__new__(cls)
+        events._table = None
+        events._source = source
+        events._idx = idx
+        events._columns = columns or {}
+        events._cache = {}
+        events.meta = meta or EventListMetaData()
+        return events
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+
+        if self._table is None:
+            state.update(_table=self._to_table(), _source=None, _idx=None, _columns={})
+
+        state["_cache"] = {}
+        return state
+
+    @property
+    def table(self):
+        """Event list table as an `~astropy.table.Table`.
+
+        Quantities derived from the event positions, such as the spatial index
+        and transformed coordinates, are cached until a column is replaced.
+        After editing column values in place, re-assign the table with
+        ``events.table = events.table`` to drop them.
+        """
+        if self._table is None:
+            self.table = self._to_table()
+
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        self._table = value
+        self._source = None
+        self._idx = None
+        self._columns = {}
+        self._cache = {}
+
+    def _to_table(self):
+        columns = [self._get_column(name) for name in self._source.colnames]
+        meta = copy.deepcopy(self._source.meta)
+        return Table(columns, meta=meta, copy=self._idx is None)
+
+    @property
+    def _table_meta(self):
+        if self._table is None:
+            return self._source.meta
+
+        return self._table.meta
+
+    @property
+    def _colnames(self):
+        if self._table is None:
+            return self._source.colnames
+
+        return self._table.colnames
+
+    @property
+    def _n_events(self):
+        if self._table is None:
+            return len(self._source) if self._idx is None else len(self._idx)
+
+        return len(self._table)
+
+    def _get_column(self, name):
+        """Get a table column, read on first access for lazy event lists."""
+        if self._table is not None:
+            return self._table[name]
+
+        if name not in self._columns:
+            column = self._source[name]
+
+            if self._idx is not None:
+                column = column[self._idx]
+
+            self._columns[name] = _convert_column(column)
+
+        return self._columns[name]
+
+    def _get_cached(self, name, colnames, compute):
+        """Get a quantity derived from columns, cached until the columns are replaced."""
+        columns = [self._get_column(_) for _ in colnames]
+        return _cached_from_column_buffers(self._cache, name, columns, compute)
+
+    @property
+    def _spatial_index(self):
+        """Spatial index of the event positions, built on first access."""
+        return self._get_cached(
+            "spatial_index",
+            ["RA", "DEC"],
+            lambda: _EventSpatialIndex(*self.get_lonlat(frame="icrs")),
+        )
+
+    def _radec_subset(self, idx):
+        """Event RA / DEC sky coordinates for a subset of the events."""
+        lon, lat = self._get_column("RA")[idx], self._get_column("DEC")[idx]
+        return SkyCoord(lon, lat, unit="deg", frame="icrs")
+
     def _repr_html_(self):
         try:
             return self.to_html()
@@ -102,7 +455,15 @@ class EventList:
             return f"<pre>{html.escape(str(self))}</pre>"
 
     @classmethod
-    def read(cls, filename, hdu="EVENTS", checksum=False, **kwargs):
+    def read(
+        cls,
+        filename,
+        hdu="EVENTS",
+        checksum=False,
+        lazy=False,
+        cache_dir=None,
+        **kwargs,
+    ):
         """Read from FITS file.
 
         Format specification: :ref:`gadf:iact-events`
@@ -115,23 +476,67 @@ class EventList:
             Name of events HDU. Default is "EVENTS".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        lazy : bool
+            If True, memory-map the events HDU and read the columns on first access.
+            Default is False.
+        cache_dir : `pathlib.Path` or str, optional
+            Directory of an on-disk cache of the events. On first read the columns
+            are stored as ``.npy`` files, later reads memory-map them as long as the
+            events file is unchanged, i.e. its modification time and size are the same.
+            A modified file is cached again under a new name, outdated caches are not
+            removed. The events are read lazily. Default is None.
         """
         filename = make_path(filename)
 
+        if lazy or cache_dir is not None:
+            if checksum:
+                with fits.open(filename) as hdulist:
+                    cls._verify_checksum(hdulist[hdu], filename, hdu)
+
+            if cache_dir is not None:
+                source = cls._read_cached(filename, hdu=hdu, cache_dir=cache_dir)
+            else:
+                source = Table.read(filename, hdu=hdu, memmap=True)
+
+            meta = EventListMetaData.from_header(source.meta)
+            return cls._from_source(source, meta=meta)
+
         with fits.open(filename) as hdulist:
             events_hdu = hdulist[hdu]
             if checksum:
-                if events_hdu.verify_checksum() != 1:
-                    warnings.warn(
-                        f"Checksum verification failed for HDU {hdu} of {filename}.",
-                        UserWarning,
-                    )
+                cls._verify_checksum(events_hdu, filename, hdu)
 
             table = Table.read(events_hdu)
             meta = EventListMetaData.from_header(table.meta)
 
         return cls(table=table, meta=meta)
 
+    @staticmethod
+    def _read_cached(filename, hdu, cache_dir):
+        """Read the events table from the on-disk cache, writing it if needed."""
+        path = _event_cache_path(cache_dir, filename, hdu)
+        source = _read_event_cache(path, filename)
+
+        if source is None:
+            log.debug(f"Writing events cache for {filename} to {path}")
+            table = Table.read(filename, hdu=hdu, memmap=True)
+            _write_event_cache(path, filename, table)
+            source = _read_event_cache(path, filename)
+
+            # the events file changed while the cache was written
+            if source is None:
+                source = table
+
+        return source
+
+    @staticmethod
+    def _verify_checksum(events_hdu, filename, hdu):
+        if events_hdu.verify_checksum() != 1:
+            warnings.warn(
+                f"Checksum verification failed for HDU {hdu} of {filename}.",
+                UserWarning,
+            )
+
     def to_table_hdu(self, format="gadf"):
         """
         Convert event list to a `~astropy.io.fits.BinTableHDU`.
@@ -196,18 +601,18 @@ class EventList:
         info = self.__class__.__name__ + "\n"
         info += "-" * len(self.__class__.__name__) + "\n\n"
 
-        instrument = self.table.meta.get("INSTRUME")
+        instrument = self._table_meta.get("INSTRUME")
         info += f"\tInstrument       : {instrument}\n"
 
-        telescope = self.table.meta.get("TELESCOP")
+        telescope = self._table_meta.get("TELESCOP")
         info += f"\tTelescope        : {telescope}\n"
 
-        obs_id = self.table.meta.get("OBS_ID", "")
+        obs_id = self._table_meta.get("OBS_ID", "")
         info += f"\tObs. ID          : {obs_id}\n\n"
 
-        info += f"\tNumber of events : {len(self.table)}\n"
+        info += f"\tNumber of events : {self._n_events}\n"
 
-        rate = len(self.table) / self.observation_time_duration
+        rate = self._n_events / self.observation_time_duration
         info += f"\tEvent rate       : {rate:.3f}\n\n"
 
         info += f"\tTime start       : {self.observation_time_start}\n"
@@ -225,7 +630,7 @@ class EventList:
     @property
     def time_ref(self):
         """Time reference as a `~astropy.time.Time` object."""
-        return time_ref_from_dict(self.table.meta)
+        return time_ref_from_dict(self._table_meta)
 
     @property
     def time(self):
@@ -237,23 +642,37 @@ class EventList:
         With 32-bit floats times will be incorrect by a few seconds
         when e.g. adding them to the reference time.
         """
-        met = u.Quantity(self.table["TIME"].astype("float64"), "second")
+        met = u.Quantity(self._get_column("TIME").astype("float64"), "second")
         return self.time_ref + met
 
+    @property
+    def time_met(self):
+        """Event times in seconds since the reference time as a `~numpy.ndarray`."""
+        return np.asarray(self._get_column("TIME"), dtype="float64")
+
+    @property
+    def time_mjd(self):
+        """Event times in MJD as a `~numpy.ndarray`.
+
+        The times are given in the time scale of the reference time.
+        """
+        time_ref = self.time_ref
+        return (time_ref.jd1 - 2400000.5) + (time_ref.jd2 + self.time_met / 86400)
+
     @property
     def observation_time_start(self):
         """Observation start time as a `~astropy.time.Time` object."""
-        return self.time_ref + u.Quantity(self.table.meta["TSTART"], "second")
+        return self.time_ref + u.Quantity(self._table_meta["TSTART"], "second")
 
     @property
     def observation_time_stop(self):
         """Observation stop time as a `~astropy.time.Time` object."""
-        return self.time_ref + u.Quantity(self.table.meta["TSTOP"], "second")
+        return self.time_ref + u.Quantity(self._table_meta["TSTOP"], "second")
 
     @property
     def radec(self):
         """Event RA / DEC sky coordinates as a `~astropy.coordinates.SkyCoord` object."""
-        lon, lat = self.table["RA"], self.table["DEC"]
+        lon, lat = self._get_column("RA"), self._get_column("DEC")
         return SkyCoord(lon, lat, unit="deg", frame="icrs")
 
     @property
@@ -264,10 +683,44 @@ class EventList:
         """
         return self.radec.galactic
 
+    def get_lonlat(self, frame="icrs"):
+        """Event sky coordinates as plain arrays.
+
+        Transformations to other frames than ICRS are computed once and
+        cached on the event list, until the columns they depend on are
+        replaced (see `~gammapy.data.EventList.table`).
+
+        Parameters
+        ----------
+        frame : {"icrs", "galactic", "altaz"}
+            Coordinate frame. "altaz" uses `~gammapy.data.EventList.altaz_frame`.
+            Any other frame name supported by `~astropy.coordinates.SkyCoord` is
+            accepted as well. Default is "icrs".
+
+        Returns
+        -------
+        lon, lat : `~numpy.ndarray`
+            Longitude and latitude in degrees, azimuth and altitude for "altaz".
+        """
+        if frame == "icrs":
+            lon = np.asarray(self._get_column("RA"), dtype="float64") % 360
+            lat = np.asarray(self._get_column("DEC"), dtype="float64")
+            return lon, lat
+
+        colnames = ["RA", "DEC", "TIME"] if frame == "altaz" else ["RA", "DEC"]
+
+        def compute():
+            skycoord = (
+                self.altaz if frame == "altaz" else self.radec.transform_to(frame)
+            )
+            return skycoord.data.lon.deg, skycoord.data.lat.deg
+
+        return self._get_cached(f"lonlat_{frame}", colnames, compute)
+
     @property
     def energy(self):
         """Event energies as a `~astropy.units.Quantity`."""
-        return self.table["ENERGY"].quantity
+        return self._get_column("ENERGY").quantity
 
     @property
     def galactic_median(self):
@@ -308,6 +761,15 @@ class EventList:
         >>> print(len(events2.table))
         97978
         """
+        if self._table is None:
+            idx = np.arange(len(self._source)) if self._idx is None else self._idx
+            columns = {
+                name: column[row_specifier] for name, column in self._columns.items()
+            }
+            return self._from_source(
+                self._source, idx=np.atleast_1d(idx[row_specifier]), columns=columns
+            )
+
         table = self.table[row_specifier]
         return self.__class__(table=table)
 
@@ -351,10 +813,14 @@ class EventList:
         events : `EventList`
             Copy of event list with selection applied.
         """
-        time = self.time
-        mask = time_interval[0] <= time
-        mask &= time < time_interval[1]
-        return self.select_row_subset(mask)
+        # compare in seconds since the reference time to avoid building a
+        # `~astropy.time.Time` object for all events
+        met = self._get_column("TIME").astype("float64")
+        met_start, met_stop = (Time(time_interval) - self.time_ref).to_value("s")
+
+        mask = met_start <= met
+        mask &= met < met_stop
+        return self.select_row_subset(np.asarray(mask))
 
     def select_region(self, regions, wcs=None):
         """Select events in given region.
@@ -374,7 +840,15 @@ class EventList:
             Copy of event list with selection applied.
         """
         geom = RegionGeom.from_regions(regions, wcs=wcs)
-        mask = geom.contains(self.radec)
+        cone = _region_bounding_cone(geom)
+
+        if cone is None:
+            mask = geom.contains(self.radec)
+        else:
+            idx = self._spatial_index.query_cone(*cone)
+            mask = np.zeros(self._n_events, dtype=bool)
+            mask[idx] = geom.contains(self._radec_subset(idx))
+
         return self.select_row_subset(mask)
 
     @deprecated_renamed_argument("band", "values", "2.0")
@@ -412,7 +886,7 @@ class EventList:
         >>> print(len(event_list_id.table))
         38
         """
-        col_data = self.table[parameter]
+        col_data = self._get_column(parameter)
 
         if is_range:
             # Handle numerical range case
@@ -489,7 +963,7 @@ class EventList:
         ax = plt.gca() if ax is None else ax
 
         # Note the events are not necessarily in time order
-        time = self.table["TIME"]
+        time = self._get_column("TIME")
         time = time - np.min(time)
 
         ax.set_xlabel(f"Time [{u.s.to_string(UNIT_STRING_FORMAT)}]")
@@ -654,18 +1128,20 @@ class EventList:
         coord : `~gammapy.maps.MapCoord`
             Coordinates.
         """
-        coord = {"skycoord": self.radec}
+        frame = geom.frame if geom.frame in ["icrs", "galactic"] else "icrs"
+        lon, lat = self.get_lonlat(frame=frame)
+        coord = {"lon": lon, "lat": lat}
 
-        cols = {k.upper(): v for k, v in self.table.columns.items()}
+        cols = {name.upper(): name for name in self._colnames}
 
         for axis in geom.axes:
             try:
-                col = cols[axis.name.upper()]
+                col = self._get_column(cols[axis.name.upper()])
                 coord[axis.name] = u.Quantity(col).to(axis.unit)
             except KeyError:
                 raise KeyError(f"Column not found in event list: {axis.name!r}")
 
-        return MapCoord.create(coord)
+        return MapCoord.create(coord, frame=frame)
 
     def select_mask(self, mask):
         """Select events inside a mask (`EventList`).
@@ -700,7 +1176,7 @@ class EventList:
     @property
     def observatory_earth_location(self):
         """Observatory location as an `~astropy.coordinates.EarthLocation` object."""
-        return earth_location_from_dict(self.table.meta)
+        return earth_location_from_dict(self._table_meta)
 
     @property
     def observation_time_duration(self):
@@ -721,7 +1197,7 @@ class EventList:
         - In Fermi-LAT it is automatically provided in the header of the event list.
         - In IACTs is computed as ``t_live = t_observation * (1 - f_dead)`` where ``f_dead`` is the dead-time fraction.
         """
-        return u.Quantity(self.table.meta["LIVETIME"], "second")
+        return u.Quantity(self._table_meta["LIVETIME"], "second")
 
     @property
     def observation_dead_time_fraction(self):
@@ -738,7 +1214,7 @@ class EventList:
         The dead-time fraction is used in the live-time computation,
         which in turn is used in the exposure and flux computation.
         """
-        return 1 - self.table.meta["DEADC"]
+        return 1 - self._table_meta["DEADC"]
 
     @property
     def altaz_frame(self):
@@ -753,14 +1229,14 @@ class EventList:
     @property
     def altaz_from_table(self):
         """ALT / AZ position from table as a `~astropy.coordinates.SkyCoord` object."""
-        lon = self.table["AZ"]
-        lat = self.table["ALT"]
+        lon = self._get_column("AZ")
+        lat = self._get_column("ALT")
         return SkyCoord(lon, lat, unit="deg", frame=self.altaz_frame)
 
     @property
     def pointing_radec(self):
         """Pointing RA / DEC sky coordinates as a `~astropy.coordinates.SkyCoord` object."""
-        info = self.table.meta
+        info = self._table_meta
         lon, lat = info["RA_PNT"], info["DEC_PNT"]
         return SkyCoord(lon, lat, unit="deg", frame="icrs")
 
@@ -772,6 +1248,36 @@ class EventList:
         offset = center.separation(position)
         return Angle(offset, unit="deg")
 
+    def get_offset(self, position=None):
+        """Event offsets as a `~numpy.ndarray`.
+
+        Parameters
+        ----------
+        position : `~astropy.coordinates.SkyCoord`, optional
+            Position to compute the offsets from. Default is the pointing position.
+
+        Returns
+        -------
+        offset : `~numpy.ndarray`
+            Offsets in degrees.
+        """
+        return self._get_separation(position)
+
+    def _get_separation(self, position=None, idx=Ellipsis):
+        """Separation in degrees between a position and a subset of the events."""
+        if position is None:
+            position = self.pointing_radec
+
+        position = position.icrs
+        lon, lat = self.get_lonlat(frame="icrs")
+        separation = angular_separation(
+            position.ra.rad,
+            position.dec.rad,
+            np.deg2rad(lon[idx]),
+            np.deg2rad(lat[idx]),
+        )
+        return np.rad2deg(separation)
+
     @property
     def offset_from_median(self):
         """Event offset from the median position as an `~astropy.coordinates.Angle`."""
@@ -804,9 +1310,12 @@ class EventList:
         12688
 
         """
-        offset = self.offset
-        mask = offset_band[0] <= offset
-        mask &= offset < offset_band[1]
+        center = self.pointing_radec
+        idx = self._spatial_index.query_cone(center, offset_band[1])
+        offset = u.Quantity(self._get_separation(center, idx=idx), "deg")
+
+        mask = np.zeros(self._n_events, dtype=bool)
+        mask[idx] = (offset_band[0] <= offset) & (offset < offset_band[1])
         return self.select_row_subset(mask)
 
     def select_rad_max(self, rad_max, position=None):
@@ -828,19 +1337,24 @@ class EventList:
             position = self.pointing_radec
 
         offset = position.separation(self.pointing_radec)
-        separation = position.separation(self.radec)
+        selected = np.zeros(self._n_events, dtype=bool)
 
-        rad_max_for_events = rad_max.evaluate(
-            method="nearest", energy=self.energy, offset=offset
-        )
+        # nearest neighbour evaluation never exceeds the largest tabulated value
+        idx = self._spatial_index.query_cone(position, np.nanmax(rad_max.quantity))
+
+        if len(idx) > 0:
+            separation = u.Quantity(self._get_separation(position, idx=idx), "deg")
+            rad_max_for_events = rad_max.evaluate(
+                method="nearest", energy=self.energy[idx], offset=offset
+            )
+            selected[idx] = separation <= rad_max_for_events
 
-        selected = separation <= rad_max_for_events
         return self.select_row_subset(selected)
 
     @property
     def is_pointed_observation(self):
         """Whether observation is pointed."""
-        return "RA_PNT" in self.table.meta
+        return "RA_PNT" in self._table_meta
 
     def peek(self, allsky=False):
         """Quick look plots.
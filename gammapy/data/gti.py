@@ -2,7 +2,6 @@
 import copy
 import html
 import warnings
-from operator import le, lt
 import numpy as np
 import astropy.units as u
 from astropy.io import fits
@@ -16,6 +15,124 @@ from .metadata import GTIMetaData
 __all__ = ["GTI"]
 
 
+def _union_intervals(start, stop, merge_equal=True):
+    """Union of time intervals given as float arrays.
+
+    Parameters
+    ----------
+    start, stop : `~numpy.ndarray`
+        Interval start and stop times.
+    merge_equal : bool, optional
+        Whether to merge touching intervals. Default is True.
+
+    Returns
+    -------
+    idx_start, idx_stop : `~numpy.ndarray`
+        Indices of the start and stop times of the merged intervals,
+        sorted by start time.
+    """
+    if len(start) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+    order = np.argsort(start, kind="stable")
+    start, stop = start[order], stop[order]
+
+    stop_max = np.maximum.accumulate(stop)
+    idx = np.arange(len(stop))
+    idx_stop_max = np.maximum.accumulate(np.where(stop == stop_max, idx, 0))
+
+    compare = np.less if merge_equal else np.less_equal
+    is_first = np.ones(len(start), dtype=bool)
+    is_first[1:] = compare(stop_max[:-1], start[1:])
+
+    first = np.flatnonzero(is_first)
+    last = np.append(first[1:] - 1, len(start) - 1)
+    return order[first], order[idx_stop_max[last]]
+
+
+def _complement_intervals(start, stop, time_min=-np.inf, time_max=np.inf):
+    """Complement of sorted, disjoint time intervals given as float arrays.
+
+    Parameters
+    ----------
+    start, stop : `~numpy.ndarray`
+        Sorted and disjoint interval start and stop times.
+    time_min, time_max : float, optional
+        Range in which the complement is computed. Default is unbounded.
+
+    Returns
+    -------
+    start, stop : `~numpy.ndarray`
+        Start and stop times of the complement intervals.
+    """
+    start_complement = np.append(time_min, stop)
+    stop_complement = np.append(start, time_max)
+    valid = start_complement < stop_complement
+    return start_complement[valid], stop_complement[valid]
+
+
+def _intersect_intervals(start, stop, start_other, stop_other):
+    """Find the pairs of overlapping time intervals given as float arrays.
+
+    Parameters
+    ----------
+    start, stop : `~numpy.ndarray`
+        Interval start and stop times.
+    start_other, stop_other : `~numpy.ndarray`
+        Sorted and disjoint interval start and stop times.
+
+    Returns
+    -------
+    idx, idx_other : `~numpy.ndarray`
+        Indices of the overlapping interval pairs, ordered like the first
+        set of intervals. The intersection of each pair is given by the
+        maximum of the start times and the minimum of the stop times.
+        Zero length intervals are kept if they lie within the other intervals.
+    """
+    idx_min = np.searchsorted(stop_other, start, side="right")
+    idx_max = np.searchsorted(start_other, stop, side="left")
+    n_overlap = np.clip(idx_max - idx_min, 0, None)
+
+    idx = np.repeat(np.arange(len(start)), n_overlap)
+    offset = np.arange(len(idx)) - np.repeat(
+        np.cumsum(n_overlap) - n_overlap, n_overlap
+    )
+    idx_other = idx_min[idx] + offset
+    return idx, idx_other
+
+
+def _interval_index(time, start, stop):
+    """Index of the time interval containing each time, -1 if none.
+
+    Parameters
+    ----------
+    time : `~numpy.ndarray`
+        Times to look up.
+    start, stop : `~numpy.ndarray`
+        Interval start (inclusive) and stop (exclusive) times.
+
+    Returns
+    -------
+    idx : `~numpy.ndarray`
+        Interval indices. For overlapping intervals the one extending
+        furthest is returned.
+    """
+    order = np.argsort(start, kind="stable")
+    stop_sorted = stop[order]
+    stop_max = np.maximum.accumulate(stop_sorted)
+    idx_stop_max = np.maximum.accumulate(
+        np.where(stop_sorted == stop_max, np.arange(len(order)), 0)
+    )
+
+    idx = np.searchsorted(start[order], time, side="right") - 1
+    contained = idx >= 0
+    contained[contained] = time[contained] < stop_max[idx[contained]]
+
+    result = np.full(np.shape(time), -1)
+    result[contained] = order[idx_stop_max[idx[contained]]]
+    return result
+
+
 class GTI:
     """Good time intervals (GTI) `~astropy.table.Table`.
 
@@ -277,6 +394,18 @@ class GTI:
         """GTI start time difference with reference time in seconds, MET as a `~astropy.units.Quantity`."""
         return (self.time_stop - self.time_ref).to("s")
 
+    @property
+    def _met_intervals(self):
+        """GTI start and stop times in seconds since the reference time as float arrays."""
+        if len(self.table) == 0:
+            return np.zeros(0), np.zeros(0)
+
+        return self._to_met(self.time_start), self._to_met(self.time_stop)
+
+    def _to_met(self, time):
+        """Convert times to float seconds since the reference time."""
+        return np.atleast_1d((Time(time) - self.time_ref).to_value("s"))
+
     @property
     def time_intervals(self):
         """List of time intervals."""
@@ -327,17 +456,16 @@ class GTI:
         interval_start.format = self.time_start.format
         interval_stop.format = self.time_stop.format
 
+        start, stop = self._met_intervals
+        met_start, met_stop = self._to_met([interval_start, interval_stop])
+
         # get GTIs that fall within the time_interval
-        mask = self.time_start < interval_stop
-        mask &= self.time_stop > interval_start
+        mask = (start < met_stop) & (stop > met_start)
         gti_within = self.table[mask]
 
         # crop the GTIs
-        gti_within["START"] = np.clip(
-            gti_within["START"], interval_start, interval_stop
-        )
-
-        gti_within["STOP"] = np.clip(gti_within["STOP"], interval_start, interval_stop)
+        gti_within["START"][start[mask] < met_start] = interval_start
+        gti_within["STOP"][stop[mask] > met_stop] = interval_stop
 
         return self.__class__(gti_within)
 
@@ -358,17 +486,17 @@ class GTI:
         interval_start.format = self.time_start.format
         interval_stop.format = self.time_stop.format
 
-        trim_table = self.table.copy()
+        start, stop = self._met_intervals
+        met_start, met_stop = self._to_met([interval_start, interval_stop])
+        start_keep, stop_keep = _complement_intervals([met_start], [met_stop])
+
+        idx, idx_keep = _intersect_intervals(start, stop, start_keep, stop_keep)
+        trim_table = self.table[idx]
 
-        trim_table["STOP"][
-            (self.time_start < interval_start) & (self.time_stop > interval_start)
-        ] = interval_start
-        trim_table["START"][
-            (self.time_start < interval_stop) & (self.time_stop > interval_stop)
-        ] = interval_stop
-        mask = (self.time_stop > interval_stop) | (self.time_start < interval_start)
+        trim_table["STOP"][stop[idx] > stop_keep[idx_keep]] = interval_start
+        trim_table["START"][start[idx] < start_keep[idx_keep]] = interval_stop
 
-        return self.__class__(trim_table[mask])
+        return self.__class__(trim_table)
 
     def stack(self, other):
         """Stack with another GTI in place.
@@ -418,29 +546,65 @@ class GTI:
             Whether to merge touching time bins e.g. ``(1, 2)`` and ``(2, 3)``
             will result in ``(1, 3)``. Default is True.
         """
-        # Algorithm to merge overlapping intervals is well-known,
-        # see e.g. https://stackoverflow.com/a/43600953/498873
+        start, stop = self._met_intervals
+        idx_start, idx_stop = _union_intervals(start, stop, merge_equal=merge_equal)
 
-        table = self.table.copy()
-        table.sort("START")
+        if not overlap_ok and len(idx_start) < len(start):
+            raise ValueError("Overlapping time bins")
 
-        compare = lt if merge_equal else le
+        merged = Table(
+            {"START": self.time_start[idx_start], "STOP": self.time_stop[idx_stop]},
+            meta=self.table.meta,
+        )
+        return self.__class__(merged, reference_time=self.time_ref)
 
-        # We use Python dict instead of astropy.table.Row objects,
-        # because on some versions modifying Row entries doesn't behave as expected
-        merged = [{"START": table[0]["START"], "STOP": table[0]["STOP"]}]
-        for row in table[1:]:
-            interval = {"START": row["START"], "STOP": row["STOP"]}
-            if compare(merged[-1]["STOP"], interval["START"]):
-                merged.append(interval)
-            else:
-                if not overlap_ok:
-                    raise ValueError("Overlapping time bins")
+    def intersection(self, other):
+        """Intersection with another GTI.
 
-                merged[-1]["STOP"] = max(interval["STOP"], merged[-1]["STOP"])
+        Parameters
+        ----------
+        other : `~gammapy.data.GTI`
+            GTI to intersect with.
 
-        merged = Table(rows=merged, names=["START", "STOP"], meta=self.table.meta)
-        return self.__class__(merged, reference_time=self.time_ref)
+        Returns
+        -------
+        gti : `~gammapy.data.GTI`
+            Time intervals covered by both GTIs, sorted by start time.
+        """
+        gti, other = self.union(), other.union()
+        start, stop = gti._met_intervals
+        start_other = gti._to_met(other.time_start)
+        stop_other = gti._to_met(other.time_stop)
+
+        idx, idx_other = _intersect_intervals(start, stop, start_other, stop_other)
+        table = gti.table[idx]
+
+        mask = start[idx] < start_other[idx_other]
+        table["START"][mask] = other.time_start[idx_other[mask]]
+
+        mask = stop[idx] > stop_other[idx_other]
+        table["STOP"][mask] = other.time_stop[idx_other[mask]]
+
+        return self.__class__(table, reference_time=self.time_ref)
+
+    def time_to_idx(self, time):
+        """Index of the GTI containing each given time.
+
+        Parameters
+        ----------
+        time : `~astropy.time.Time`
+            Times to look up.
+
+        Returns
+        -------
+        idx : `~numpy.ndarray`
+            Index of the GTI row containing each time, with the start time
+            inclusive and the stop time exclusive. -1 if the time is not
+            covered by any GTI.
+        """
+        start, stop = self._met_intervals
+        met = self._to_met(time)
+        return _interval_index(met, start, stop).reshape(np.shape(time))
 
     def group_table(self, time_intervals, atol="1e-6 s"):
         """Compute the table with the info on the group to which belong each time interval.
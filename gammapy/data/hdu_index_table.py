@@ -1,10 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+from collections import defaultdict
 import numpy as np
 from astropy.table import Table
 from astropy.utils import lazyproperty
 from gammapy.utils.fits import HDULocation
 from gammapy.utils.scripts import make_path
+from gammapy.utils.table import _cached_from_column_buffers
 
 __all__ = ["HDUIndexTable"]
 
@@ -91,7 +93,12 @@ class HDUIndexTable(Table):
         """
         self._validate_selection(obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
 
-        idx = self.row_idx(obs_id=obs_id, hdu_type=hdu_type, hdu_class=hdu_class)
+        index = self._hdu_index
+
+        if obs_id not in index:
+            raise IndexError(f"No entry available with OBS_ID = {obs_id}")
+
+        idx = self._select_rows(index[obs_id], hdu_type=hdu_type, hdu_class=hdu_class)
 
         if len(idx) == 1:
             idx = idx[0]
@@ -131,9 +138,6 @@ class HDUIndexTable(Table):
                 f"Invalid hdu_class: {hdu_class}. Valid values are: {valid}"
             )
 
-        if obs_id not in self["OBS_ID"]:
-            raise IndexError(f"No entry available with OBS_ID = {obs_id}")
-
     def row_idx(self, obs_id, hdu_type=None, hdu_class=None):
         """Table row indices for a given selection.
 
@@ -151,19 +155,68 @@ class HDUIndexTable(Table):
         idx : list of int
             List of row indices matching the selection.
         """
-        selection = self["OBS_ID"] == obs_id
-
-        if hdu_class:
-            is_hdu_class = self._hdu_class_stripped == hdu_class
-            selection &= is_hdu_class
+        idx = self._hdu_index.get(obs_id, [])
+        return self._select_rows(idx, hdu_type=hdu_type, hdu_class=hdu_class)
 
+    def _select_rows(self, idx, hdu_type=None, hdu_class=None):
+        """Select the rows matching the HDU type and class among the given rows."""
         if hdu_type:
-            is_hdu_type = self._hdu_type_stripped == hdu_type
-            selection &= is_hdu_type
+            column = self["HDU_TYPE"]
+            idx = [_ for _ in idx if column[_].strip() == hdu_type]
+
+        if hdu_class:
+            column = self["HDU_CLASS"]
+            idx = [_ for _ in idx if column[_].strip() == hdu_class]
 
-        idx = np.where(selection)[0]
         return list(idx)
 
+    @property
+    def _hdu_index(self):
+        """Row indices per `OBS_ID`.
+
+        The index is built lazily on first access and rebuilt when the `OBS_ID`
+        column is replaced or resized, or when rows are assigned, sorted or
+        reversed. In-place edits of single `OBS_ID` values, e.g.
+        ``table["OBS_ID"][idx] = value``, require a call to
+        `_invalidate_hdu_index`.
+        """
+
+        def compute():
+            self._invalidate_hdu_index()
+
+            index = defaultdict(list)
+
+            for idx, obs_id in enumerate(self["OBS_ID"].tolist()):
+                index[obs_id].append(idx)
+
+            return dict(index)
+
+        return _cached_from_column_buffers(
+            self.__dict__, "_hdu_index_cache", [self["OBS_ID"]], compute
+        )
+
+    def _invalidate_hdu_index(self):
+        """Remove the index and the quantities derived from the key columns."""
+        for name in [
+            "_hdu_index_cache",
+            "obs_id_unique",
+            "hdu_type_unique",
+            "hdu_class_unique",
+        ]:
+            self.__dict__.pop(name, None)
+
+    def __setitem__(self, item, value):
+        super().__setitem__(item, value)
+        self._invalidate_hdu_index()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_hdu_index()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_hdu_index()
+
     def location_info(self, idx):
         """Create `HDULocation` for a given row index."""
         row = self[idx]
@@ -175,14 +228,6 @@ class HDUIndexTable(Table):
             hdu_name=row["HDU_NAME"].strip(),
         )
 
-    @lazyproperty
-    def _hdu_class_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_CLASS"]])
-
-    @lazyproperty
-    def _hdu_type_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_TYPE"]])
-
     @lazyproperty
     def obs_id_unique(self):
         """Observation IDs (unique)."""
@@ -3,14 +3,19 @@ from collections import namedtuple
 import numpy as np
 from astropy.coordinates import Angle, SkyCoord
 from astropy.table import Table
+from astropy.time import Time
 from astropy.units import Quantity, Unit
 from gammapy.utils.regions import SphericalCircleSkyRegion
 from gammapy.utils.scripts import make_path
+from gammapy.utils.table import _cached_from_columns
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
 
 __all__ = ["ObservationTable"]
 
+# Margin in rad added to the cone pre-selection to absorb rounding errors
+SKY_INDEX_MARGIN = 1e-7
+
 
 class ObservationTable(Table):
     """Observation table.
@@ -43,6 +48,35 @@ class ObservationTable(Table):
             self["GLON_PNT"], self["GLAT_PNT"], unit="deg", frame="galactic"
         )
 
+    @property
+    def _sky_index(self):
+        """Unit vectors of the pointing positions in ICRS, shape ``(3, n_obs)``."""
+
+        def compute():
+            lon = np.deg2rad(Quantity(self["RA_PNT"], "deg").value)
+            lat = np.deg2rad(Quantity(self["DEC_PNT"], "deg").value)
+            return np.stack(
+                [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+            )
+
+        return _cached_from_columns(
+            self, "_sky_index_cache", ["RA_PNT", "DEC_PNT"], compute
+        )
+
+    @property
+    def _time_index(self):
+        """Sorting order and sorted start times, and stop times, in seconds."""
+
+        def compute():
+            tstart = Quantity(self["TSTART"], "second").value
+            tstop = Quantity(self["TSTOP"], "second").value
+            order = np.argsort(tstart, kind="stable")
+            return order, tstart[order], tstop
+
+        return _cached_from_columns(
+            self, "_time_index_cache", ["TSTART", "TSTOP"], compute
+        )
+
     @property
     def time_ref(self):
         """Time reference as a `~astropy.time.Time` object."""
@@ -161,17 +195,20 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
-        tstart = self.time_start
-        tstop = self.time_stop
+        order, tstart_sorted, tstop = self._time_index
+        time_min, time_max = (Time(time_range) - self.time_ref).to_value("s")
 
+        # binary search on the start times, then check the stop times
+        # of the remaining candidates only
         if not partial_overlap:
-            mask1 = time_range[0] <= tstart
-            mask2 = time_range[1] >= tstop
+            idx = order[np.searchsorted(tstart_sorted, time_min, side="left") :]
+            selected = time_max >= tstop[idx]
         else:
-            mask1 = time_range[0] <= tstop
-            mask2 = time_range[1] >= tstart
+            idx = order[: np.searchsorted(tstart_sorted, time_max, side="right")]
+            selected = time_min <= tstop[idx]
 
-        mask = mask1 & mask2
+        mask = np.zeros(len(self), dtype=bool)
+        mask[idx[selected]] = True
 
         if inverted:
             mask = np.invert(mask)
@@ -203,7 +240,24 @@ class ObservationTable(Table):
             Observation table after selection.
         """
         region = SphericalCircleSkyRegion(center=center, radius=radius)
-        mask = region.contains(self.pointing_radec)
+
+        # pre-select candidates with a dot product of unit vectors and
+        # compute exact separations for those only
+        lon, lat = center.icrs.ra.rad, center.icrs.dec.rad
+        vector = [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+        radius_max = Angle(radius).rad + SKY_INDEX_MARGIN
+
+        if radius_max < np.pi:
+            idx = np.flatnonzero(vector @ self._sky_index >= np.cos(radius_max))
+        else:
+            idx = np.arange(len(self))
+
+        pointing = SkyCoord(
+            self["RA_PNT"][idx], self["DEC_PNT"][idx], unit="deg", frame="icrs"
+        )
+        mask = np.zeros(len(self), dtype=bool)
+        mask[idx] = region.contains(pointing)
+
         if inverted:
             mask = np.invert(mask)
         return self[mask]
@@ -15,6 +15,7 @@ from astropy.time import Time
 from astropy.units import Quantity
 from astropy.utils import lazyproperty
 import matplotlib.pyplot as plt
+import gammapy.utils.parallel as parallel
 from gammapy.utils.deprecation import GammapyDeprecationWarning
 from gammapy.utils.fits import LazyFitsData, earth_location_to_dict
 from gammapy.utils.metadata import CreatorMetaData, TargetMetaData, TimeInfoMetaData
@@ -650,9 +651,14 @@ class Observations(collections.abc.MutableSequence):
     ----------
     observations : list
         A list of `~gammapy.data.Observation`.
+    prefetch : int, optional
+        Number of upcoming observations read ahead in a thread pool when
+        iterating with `~gammapy.data.Observations.in_memory_generator`.
+        Default is None, which disables prefetching.
     """
 
-    def __init__(self, observations=None):
+    def __init__(self, observations=None, prefetch=None):
+        self.prefetch = prefetch
         self._observations = []
 
         if observations is None:
@@ -665,9 +671,14 @@ class Observations(collections.abc.MutableSequence):
         if isinstance(item, (list, np.ndarray)) and all(
             isinstance(x, str) for x in item
         ):
-            return self.__class__([self._observations[self.index(_)] for _ in item])
+            return self.__class__(
+                [self._observations[self.index(_)] for _ in item],
+                prefetch=self.prefetch,
+            )
         elif isinstance(item, (slice, list, np.ndarray)):
-            return self.__class__(list(np.array(self._observations)[item]))
+            return self.__class__(
+                list(np.array(self._observations)[item]), prefetch=self.prefetch
+            )
         else:
             return self._observations[self.index(item)]
 
@@ -742,7 +753,7 @@ class Observations(collections.abc.MutableSequence):
                     new_obs = obs.select_time(time_interval)
                     new_obs_list.append(new_obs)
 
-        return self.__class__(new_obs_list)
+        return self.__class__(new_obs_list, prefetch=self.prefetch)
 
     def _ipython_key_completions_(self):
         return self.ids
@@ -763,7 +774,8 @@ class Observations(collections.abc.MutableSequence):
         obs_groups = {}
         for label in np.unique(labels):
             observations = self.__class__(
-                [obs for k, obs in enumerate(self) if labels[k] == label]
+                [obs for k, obs in enumerate(self) if labels[k] == label],
+                prefetch=self.prefetch,
             )
             obs_groups[f"group_{label}"] = observations
         return obs_groups
@@ -786,11 +798,28 @@ class Observations(collections.abc.MutableSequence):
         obs = itertools.chain(*observations_list)
         return cls(list(obs))
 
-    def in_memory_generator(self):
-        """A generator that iterates over observation. Yield an in memory copy of the observation."""
-        for obs in self:
-            obs_copy = obs.copy(in_memory=True)
-            yield obs_copy
+    def in_memory_generator(self, prefetch=None):
+        """A generator that iterates over observation. Yield an in memory copy of the observation.
+
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of upcoming observations read ahead in a thread pool, while the
+            current one is processed. Default is None, which uses the ``prefetch``
+            attribute of the container.
+        """
+        if prefetch is None:
+            prefetch = self.prefetch
+
+        if not prefetch:
+            for obs in self:
+                obs_copy = obs.copy(in_memory=True)
+                yield obs_copy
+            return
+
+        yield from parallel.prefetch_generator(
+            lambda obs: obs.copy(in_memory=True), self, max_in_flight=prefetch
+        )
 
 
 class ObservationChecker(Checker):
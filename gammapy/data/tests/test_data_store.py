@@ -171,6 +171,80 @@ def test_data_store_from_events(data_store_dc1):
         _ = DataStore.from_events_files([path, path2])
 
 
+@pytest.fixture()
+def events_paths(tmp_path):
+    paths = []
+    for obs_id in range(1, 5):
+        header = fits.Header()
+        header.update(
+            OBS_ID=obs_id,
+            TSTART=1000.0 * obs_id,
+            TSTOP=1000.0 * obs_id + 600,
+            ONTIME=600.0,
+            LIVETIME=550.0,
+            DEADC=0.92,
+            RA_PNT=83.6,
+            DEC_PNT=22.0,
+            MJDREFI=51910,
+            MJDREFF=7.428703703703703e-4,
+            TIMESYS="TT",
+            TIMEUNIT="s",
+            TIMEREF="LOCAL",
+        )
+        hdu = fits.BinTableHDU.from_columns(
+            [fits.Column("TIME", "D", array=[0.0])], header=header, name="EVENTS"
+        )
+        path = tmp_path / f"events_{obs_id}.fits"
+        fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(path)
+        paths.append(path)
+
+    return paths
+
+
+def test_data_store_maker_parallel(events_paths):
+    data_store = DataStore.from_events_files(
+        events_paths, irfs_paths=events_paths[0], n_jobs=2
+    )
+    expected = DataStore.from_events_files(events_paths, irfs_paths=events_paths[0])
+
+    assert data_store.obs_table["OBS_ID"].tolist() == [1, 2, 3, 4]
+    assert_allclose(data_store.obs_table["TSTART"], expected.obs_table["TSTART"])
+    assert data_store.obs_table.meta["MJDREFI"] == 51910
+    assert len(data_store.hdu_table) == 4 * 6
+
+
+def test_data_store_events_cache_dir(events_paths, tmp_path):
+    data_store = DataStore.from_events_files(events_paths, irfs_paths=events_paths[0])
+    data_store.hdu_table.meta["BASE_DIR"] = str(tmp_path)
+    data_store.hdu_table.write(tmp_path / "hdu-index.fits.gz")
+    data_store.obs_table.write(tmp_path / "obs-index.fits.gz")
+
+    hdulist = fits.HDUList(
+        [
+            fits.PrimaryHDU(),
+            fits.table_to_hdu(data_store.hdu_table),
+            fits.table_to_hdu(data_store.obs_table),
+        ]
+    )
+    hdulist[1].name, hdulist[2].name = "HDU_INDEX", "OBS_INDEX"
+    hdulist.writeto(tmp_path / "index.fits")
+
+    cache_dir = tmp_path / "cache"
+    data_stores = [
+        DataStore.from_dir(tmp_path, events_cache_dir=cache_dir),
+        DataStore.from_file(tmp_path / "index.fits", events_cache_dir=cache_dir),
+        DataStore.from_events_files(
+            events_paths, irfs_paths=events_paths[0], events_cache_dir=cache_dir
+        ),
+    ]
+
+    for data_store in data_stores:
+        assert data_store.events_cache_dir == cache_dir
+        assert_allclose(data_store.obs(1).events.table["TIME"], 0)
+
+    assert len(list(cache_dir.glob("events_1.fits-*"))) == 1
+
+
 @requires_data()
 def test_data_store_maker_obs_table(data_store_dc1):
     table = data_store_dc1.obs_table
@@ -1,4 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import os
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
@@ -7,7 +9,7 @@ from astropy.coordinates import SkyCoord
 from astropy.table import Table
 from regions import CircleSkyRegion, RectangleSkyRegion
 from gammapy.data import GTI, EventList, Observation, FixedPointingInfo
-from gammapy.maps import MapAxis, WcsGeom
+from gammapy.maps import MapAxis, RegionGeom, WcsGeom
 from gammapy.utils.testing import mpl_plot_check, requires_data
 
 
@@ -258,3 +260,155 @@ class TestEventSelection:
         energy_range = u.Quantity([1, 10], "TeV")
         new_list = self.events.select_energy(energy_range)
         assert len(new_list.table) == 3
+
+
+def test_event_list_read_lazy(tmp_path):
+    table = Table()
+    table["RA"] = [0.0, 0.0, 0.0, 10.0] * u.deg
+    table["DEC"] = [0.0, 0.9, 10.0, 10.0] * u.deg
+    table["ENERGY"] = [1.0, 1.5, np.nan, 10.0] * u.TeV
+    table["LABEL"] = ["a", "b", "", "d"]
+    table.meta["RA_PNT"] = 0.0
+    table.meta["DEC_PNT"] = 0.5
+    table.meta["EXTNAME"] = "EVENTS"
+    table.write(tmp_path / "events.fits")
+
+    events = EventList.read(tmp_path / "events.fits")
+    events_lazy = EventList.read(tmp_path / "events.fits", lazy=True)
+
+    region = CircleSkyRegion(SkyCoord(0.0, 0.0, unit="deg"), radius=1.0 * u.deg)
+    selected = events.select_region(region).select_energy([1.2, 20] * u.TeV)
+    selected_lazy = events_lazy.select_region(region).select_energy([1.2, 20] * u.TeV)
+
+    assert_allclose(selected_lazy.energy, [1.5] * u.TeV)
+    assert_allclose(selected_lazy.offset, selected.offset)
+    assert selected_lazy._table is None
+
+    assert selected_lazy.table.colnames == selected.table.colnames
+    assert selected_lazy.table["LABEL"][0] == "b"
+    assert selected_lazy.table.meta == selected.table.meta
+
+    assert events_lazy.table["ENERGY"].mask[2]
+    assert events_lazy.table["LABEL"].mask[2]
+
+
+def test_event_list_spatial_index():
+    rng = np.random.default_rng(42)
+    table = Table()
+    table["RA"] = rng.uniform(-5, 5, 10000) % 360 * u.deg
+    table["DEC"] = rng.uniform(-5, 5, 10000) * u.deg
+    table["ENERGY"] = 10 ** rng.uniform(-1, 1, 10000) * u.TeV
+    table.meta["RA_PNT"] = 0.0
+    table.meta["DEC_PNT"] = 0.0
+    events = EventList(table)
+
+    center = SkyCoord(0.5, -0.5, unit="deg")
+    region = RectangleSkyRegion(center, width=2 * u.deg, height=1 * u.deg)
+    selected = events.select_region(region)
+    mask = RegionGeom.from_regions(region).contains(events.radec)
+    assert_allclose(selected.table["ENERGY"], table["ENERGY"][mask])
+
+    selected = events.select_offset([1, 2] * u.deg)
+    offset = events.pointing_radec.separation(events.radec)
+    mask = (offset >= 1 * u.deg) & (offset < 2 * u.deg)
+    assert_allclose(selected.table["ENERGY"], table["ENERGY"][mask])
+
+    idx = events._spatial_index.query_cone(center, 1 * u.deg)
+    separation = center.separation(events.radec)
+    assert np.all(np.isin(np.where(separation < 1 * u.deg)[0], idx))
+
+    events.table["RA"] = (table["RA"] + 1 * u.deg) % (360 * u.deg)
+    idx_shifted = events._spatial_index.query_cone(center, 1 * u.deg)
+    assert not np.array_equal(idx, idx_shifted)
+
+    region = CircleSkyRegion(SkyCoord(80, 0, unit="deg"), 1 * u.deg)
+    assert len(events.select_region(region).table) == 0
+
+    events.table["RA"][0] = 80.0
+    events.table["DEC"][0] = 0.0
+    events.table = events.table
+    assert len(events.select_region(region).table) == 1
+
+    events.table.remove_row(0)
+    assert len(events.select_region(region).table) == 0
+
+
+def test_event_list_ndarray_accessors():
+    table = Table()
+    table["RA"] = [83.6, 84.0] * u.deg
+    table["DEC"] = [22.0, 22.5] * u.deg
+    table["TIME"] = [10.0, 20.0] * u.s
+    table.meta.update(
+        RA_PNT=83.6, DEC_PNT=22.0, MJDREFI=51910, MJDREFF=7.4287e-4, TIMESYS="TT"
+    )
+    events = EventList(table)
+
+    assert_allclose(events.time_met, [10.0, 20.0])
+    assert_allclose(events.time_mjd, events.time.mjd, rtol=1e-12)
+
+    lon, lat = events.get_lonlat(frame="galactic")
+    assert_allclose(lon, events.radec.galactic.l.deg)
+    assert_allclose(lat, events.radec.galactic.b.deg)
+
+    events.table["RA"][0] = 80.0
+    expected = SkyCoord(80.0, 22.0, unit="deg").galactic
+    assert_allclose(events.galactic[0].l.deg, expected.l.deg)
+
+    events.table = events.table
+    lon, lat = events.get_lonlat(frame="galactic")
+    assert_allclose(lon[0], expected.l.deg)
+    assert_allclose(lat[0], expected.b.deg)
+
+    assert_allclose(events.get_offset(), events.offset.deg, atol=1e-6)
+
+
+def test_event_list_read_cache(tmp_path):
+    table = Table()
+    table["RA"] = [0.0, 1.0, 2.0] * u.deg
+    table["DEC"] = [0.0, 0.5, 1.0] * u.deg
+    table["ENERGY"] = [1.0, np.nan, 10.0] * u.TeV
+    table.meta["RA_PNT"] = 0.0
+    table.meta["DEC_PNT"] = 0.5
+    table.meta["EXTNAME"] = "EVENTS"
+    filename = tmp_path / "events.fits"
+    table.write(filename)
+
+    cache_dir = tmp_path / "cache"
+    events = EventList.read(filename, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("events.fits-*/*.npy"))) == 3
+
+    events_cached = EventList.read(filename, cache_dir=cache_dir)
+    base = events_cached._get_column("RA")
+    while base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
+    assert events_cached._get_column("ENERGY").mask[1]
+    assert_allclose(events_cached.radec.dec, events.radec.dec)
+    assert events_cached.table.meta["RA_PNT"] == 0.0
+
+    table["DEC"] = [1.0, 1.5, 2.0] * u.deg
+    table.write(filename, overwrite=True)
+    stat = filename.stat()
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    events_updated = EventList.read(filename, cache_dir=cache_dir)
+    assert_allclose(events_updated.radec.dec.deg, [1.0, 1.5, 2.0])
+    assert_allclose(events_cached.radec.dec.deg, [0.0, 0.5, 1.0])
+    assert len(list(cache_dir.glob("events.fits-*"))) == 2
+
+    cache_dir = tmp_path / "cache-threads"
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: EventList.read(filename, cache_dir=cache_dir), range(8)
+            )
+        )
+
+    for events in results:
+        assert_allclose(events.radec.dec.deg, [1.0, 1.5, 2.0])
+
+    assert len(list(cache_dir.iterdir())) == 1
+
+    path = next(cache_dir.iterdir())
+    (path / "1.npy").unlink()
+    events = EventList.read(filename, cache_dir=cache_dir)
+    assert_allclose(events.radec.dec.deg, [1.0, 1.5, 2.0])
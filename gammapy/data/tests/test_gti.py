@@ -228,6 +228,54 @@ def test_gti_union():
     assert_allclose(gti.met_start.value, [1, 5])
     assert_allclose(gti.met_stop.value, [4, 8])
 
+    assert len(gti.union().table) == 2
+
+    gti.table["STOP"][0] = gti.time_ref + 6 * u.s
+    gti = gti.union()
+
+    assert_allclose(gti.met_start.value, [1])
+    assert_allclose(gti.met_stop.value, [8])
+
+
+def test_gti_union_overlap():
+    gti = make_gti({"START": [1, 3, 5] * u.s, "STOP": [3, 4, 6] * u.s})
+
+    gti_union = gti.union(merge_equal=False)
+    assert_allclose(gti_union.met_start.value, [1, 3, 5])
+    assert_allclose(gti_union.met_stop.value, [3, 4, 6])
+
+    with pytest.raises(ValueError):
+        gti.union(overlap_ok=False)
+
+
+def test_gti_intersection():
+    gti = make_gti({"START": [0, 10, 20] * u.s, "STOP": [5, 15, 30] * u.s})
+    other = make_gti({"START": [3, 12] * u.s, "STOP": [11, 25] * u.s})
+
+    gti_intersection = gti.intersection(other)
+
+    assert_allclose(gti_intersection.met_start.value, [3, 10, 12, 20])
+    assert_allclose(gti_intersection.met_stop.value, [5, 11, 15, 25])
+
+
+def test_gti_time_to_idx():
+    gti = make_gti({"START": [10, 0, 20] * u.s, "STOP": [15, 5, 30] * u.s})
+    time = gti.time_ref + [-1, 0, 5, 12, 15, 29] * u.s
+
+    idx = gti.time_to_idx(time)
+
+    assert idx.tolist() == [-1, 1, -1, 0, -1, 2]
+
+
+def test_gti_delete_interval_split():
+    gti = make_gti({"START": [0] * u.s, "STOP": [10] * u.s})
+    interval = gti.time_ref + [2, 4] * u.s
+
+    gti_trim = gti.delete_interval(interval)
+
+    assert_allclose((gti_trim.time_start - gti.time_ref).to_value("s"), [0, 4])
+    assert_allclose((gti_trim.time_stop - gti.time_ref).to_value("s"), [2, 10])
+
 
 def test_gti_create():
     start = u.Quantity([1, 2], "min")
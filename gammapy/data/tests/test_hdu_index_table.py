@@ -48,6 +48,53 @@ def test_hdu_index_table(hdu_index_table):
     assert hdu_index_table.summary().startswith("HDU index table")
 
 
+def test_hdu_index_table_row_idx():
+    table = HDUIndexTable(
+        rows=[
+            (obs_id, hdu_type, hdu_class, "a", "b", "c")
+            for obs_id in [1, 2]
+            for hdu_type, hdu_class in [("events", "events"), ("psf ", "psf_table")]
+        ],
+        names=["OBS_ID", "HDU_TYPE", "HDU_CLASS", "FILE_DIR", "FILE_NAME", "HDU_NAME"],
+    )
+
+    assert table.row_idx(obs_id=2, hdu_type="psf") == [3]
+    assert table.row_idx(obs_id=2, hdu_type="psf", hdu_class="psf_table") == [3]
+    assert table.row_idx(obs_id=2, hdu_type="psf", hdu_class="events") == []
+    assert table.row_idx(obs_id=1) == [0, 1]
+
+    table.add_row((3, "aeff", "aeff_2d", "a", "b", "c"))
+    assert table.row_idx(obs_id=3, hdu_class="aeff_2d") == [4]
+
+    table.reverse()
+    assert table.row_idx(obs_id=3, hdu_type="aeff") == [0]
+
+    table[0] = (4, "aeff", "aeff_2d", "a", "b", "c")
+    assert table.row_idx(obs_id=4, hdu_type="aeff") == [0]
+
+    with pytest.raises(IndexError):
+        table.hdu_location(obs_id=3, hdu_type="aeff")
+
+    table["OBS_ID"][1] = 5
+    table._invalidate_hdu_index()
+    assert table.row_idx(obs_id=5) == [1]
+    assert table.row_idx(obs_id=2) == [2]
+
+    table[0]["OBS_ID"] = 7
+    table._invalidate_hdu_index()
+    assert table.row_idx(obs_id=7, hdu_type="aeff") == [0]
+    assert table.row_idx(obs_id=4) == []
+
+    table["HDU_TYPE"][0] = "bkg"
+    assert table.row_idx(obs_id=7, hdu_type="bkg") == [0]
+
+    table.sort("OBS_ID")
+    assert table.row_idx(obs_id=7) == [4]
+
+    table["OBS_ID"] = [8, 1, 2, 2, 7]
+    assert table.row_idx(obs_id=8) == [0]
+
+
 @requires_data()
 def test_hdu_index_table_hd_hap(capfd):
     """Test HESS HAP-HD data access."""
@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
+from numpy.testing import assert_equal
+import astropy.units as u
 from astropy.coordinates import AltAz, Angle, SkyCoord
 from astropy.time import Time, TimeDelta
 from astropy.units import Quantity
@@ -313,6 +315,32 @@ def test_select_sky_regions():
     assert len(obs_table) == 30
 
 
+def test_select_sky_circle_index():
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=100, random_state=random_state)
+    center = SkyCoord(0, 0, unit="deg", frame="galactic")
+
+    selected = obs_table.select_sky_circle(center, Angle(50, "deg"))
+    separation = center.separation(obs_table.pointing_radec)
+    assert_equal(selected["OBS_ID"], obs_table["OBS_ID"][separation < 50 * u.deg])
+
+    obs_table["RA_PNT"] = Angle(obs_table["RA_PNT"]) + Angle(180, "deg")
+    selected = obs_table.select_sky_circle(center, Angle(50, "deg"))
+    separation = center.separation(obs_table.pointing_radec)
+    assert_equal(selected["OBS_ID"], obs_table["OBS_ID"][separation < 50 * u.deg])
+
+    idx = np.argmax(separation)
+    obs_table["RA_PNT"][idx] = center.icrs.ra.deg
+    obs_table["DEC_PNT"][idx] = center.icrs.dec.deg
+    selected = obs_table.select_sky_circle(center, Angle(50, "deg"))
+    assert obs_table["OBS_ID"][idx] in selected["OBS_ID"]
+
+    time_range = obs_table.time_start[[idx]]
+    obs_table["TSTOP"][idx] = obs_table["TSTART"][idx] + 1
+    selected = obs_table.select_time_range(time_range + [-1, 2] * u.s)
+    assert_equal(selected["OBS_ID"], obs_table["OBS_ID"][[idx]])
+
+
 @requires_data()
 def test_observation_table_checker():
     path = "$GAMMAPY_DATA/cta-1dc/index/gps/obs-index.fits.gz"
@@ -196,6 +196,34 @@ def test_empty_observations():
     assert len(observations) == 0
 
 
+def test_observations_keep_prefetch():
+    observations = Observations(
+        [
+            Observation.create(
+                pointing=FixedPointingInfo(fixed_icrs=SkyCoord(0, 0, unit="deg")),
+                obs_id=obs_id,
+                livetime=1 * u.h,
+                tstart=obs_id * u.h,
+                irfs={},
+            )
+            for obs_id in range(3)
+        ],
+        prefetch=2,
+    )
+
+    assert observations[1:].prefetch == 2
+    assert observations[[0, 2]].prefetch == 2
+    assert observations[["0", "2"]].prefetch == 2
+
+    selected = observations.select_time(
+        observations[0].gti.time_start[0] + [0, 2] * u.h
+    )
+    assert selected.prefetch == 2
+
+    groups = observations.group_by_label(np.array([0, 1, 1]))
+    assert groups["group_1"].prefetch == 2
+
+
 @requires_data()
 def test_observations_str(data_store):
     obs_ids = data_store.obs_table["OBS_ID"][:4]
@@ -592,6 +620,20 @@ def test_observations_generator(data_store):
         assert isinstance(obs.psf, PSF3D)
 
 
+@requires_data()
+def test_observations_generator_prefetch(data_store):
+    observations = data_store.get_observations([20136, 20137, 20151], prefetch=2)
+    assert observations.prefetch == 2
+
+    obs_ids = []
+    for obs in observations.in_memory_generator():
+        assert isinstance(obs.events, EventList)
+        assert isinstance(obs.psf, PSF3D)
+        obs_ids.append(obs.obs_id)
+
+    assert obs_ids == [20136, 20137, 20151]
+
+
 @requires_data()
 def test_event_setter():
     irfs = load_irf_dict_from_file(
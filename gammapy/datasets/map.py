@@ -1,17 +1,26 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import numpy as np
+from scipy.sparse import csr_matrix
 from scipy.stats import median_abs_deviation as mad
 import astropy.units as u
 from astropy.io import fits
 from astropy.table import Table
-from regions import CircleSkyRegion, RectangleSkyRegion
+from regions import CircleSkyRegion, PointSkyRegion, RectangleSkyRegion
 import matplotlib.pyplot as plt
 from matplotlib.colors import LogNorm
 import gammapy.datasets.evaluator as meval
 from gammapy.data import GTI, PointingMode
 from gammapy.irf import EDispKernelMap, EDispMap, PSFKernel, PSFMap, RecoPSFMap
-from gammapy.maps import LabelMapAxis, Map, MapAxes, MapAxis, WcsGeom
+from gammapy.maps import (
+    LabelMapAxis,
+    Map,
+    MapAxes,
+    MapAxis,
+    RegionGeom,
+    RegionNDMap,
+    WcsGeom,
+)
 from gammapy.modeling.models import DatasetModels, FoVBackgroundModel, Models
 from gammapy.stats import (
     CashCountsStatistic,
@@ -22,7 +31,7 @@ from gammapy.utils.fits import HDULocation, LazyFitsData
 from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_name, make_path
 from gammapy.utils.table import hstack_columns
-from .core import Dataset
+from .core import Dataset, Datasets
 from .evaluator import MapEvaluator
 from .metadata import MapDatasetMetaData
 from .utils import get_axes
@@ -404,6 +413,119 @@ def create_map_dataset_from_observation(
     return dataset
 
 
+def _region_weights_matrix(geom, regions, check_contained=False):
+    """Compute the sparse region to pixel matrix of a WCS geometry.
+
+    The region masks are computed on a cutout enclosing each region, in the
+    same way as `~gammapy.maps.WcsNDMap.to_region_nd_map`.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.WcsGeom`
+        Map geometry. Only the spatial part is used.
+    regions : list of `~regions.SkyRegion`
+        Extended sky regions.
+    check_contained : bool, optional
+        Raise an error if a region is not fully contained inside the geometry.
+        Default is False.
+
+    Returns
+    -------
+    weights : `~scipy.sparse.csr_matrix`
+        Matrix of shape (n_regions, n_pix) with entries equal to one for the
+        pixels contained in each region.
+    """
+    image = geom.to_image()
+    shape = image.data_shape
+
+    if check_contained:
+        image = image.pad(1, axis_name=None)
+
+    rows, cols = [], []
+
+    for idx, region in enumerate(regions):
+        region_geom = RegionGeom.from_regions(regions=region, wcs=image.wcs)
+        cutout = image.cutout(
+            position=region_geom.center_skydir, width=region_geom.width
+        )
+        slices = cutout.cutout_slices(image, mode="trim")
+        mask = cutout.region_mask([region]).data[slices["cutout-slices"]]
+
+        iy, ix = np.nonzero(mask)
+        iy += slices["parent-slices"][0].start
+        ix += slices["parent-slices"][1].start
+
+        if check_contained:
+            not_fully_contained = np.any(
+                (iy == 0) | (ix == 0) | (iy == shape[0] + 1) | (ix == shape[1] + 1)
+            )
+            if not_fully_contained:
+                raise Exception(
+                    """`to_region_map_dataset` can only be applied if the region
+                    is fully contained inside the counts geom.
+                    """
+                )
+            iy, ix = iy - 1, ix - 1
+
+        cols.append(np.ravel_multi_index((iy, ix), shape))
+        rows.append(np.full(iy.size, idx))
+
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    return csr_matrix(
+        (np.ones(rows.size), (rows, cols)), shape=(len(regions), np.prod(shape))
+    )
+
+
+def _reduce_in_regions(m, regions, weights, func="sum", mask=None):
+    """Reduce a WCS map in several regions with a single matrix product.
+
+    Parameters
+    ----------
+    m : `~gammapy.maps.WcsNDMap`
+        Map to reduce.
+    regions : list of `~regions.SkyRegion`
+        Extended sky regions.
+    weights : `~scipy.sparse.csr_matrix`
+        Region to pixel matrix, see `_region_weights_matrix`.
+    func : {"sum", "mean", "any"}, optional
+        Reduction applied in each region. Default is "sum".
+    mask : `~gammapy.maps.WcsNDMap`, optional
+        Boolean mask applied to the map before the reduction. Default is None.
+
+    Returns
+    -------
+    maps : list of `~gammapy.maps.RegionNDMap`
+        Reduced maps, one per region.
+    """
+    shape = m.data.shape[:-2]
+    data = m.data.reshape((-1, weights.shape[1])).T
+
+    if mask is not None:
+        mask = mask.data.reshape(data.T.shape).T
+        data = np.where(mask, data, 0)
+
+    values = weights @ data.astype(float)
+
+    if func == "any":
+        values = values > 0
+    elif func == "mean":
+        if mask is not None:
+            npix = weights @ mask.astype(float)
+        else:
+            npix = np.asarray(weights.sum(axis=1))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values = values / npix
+
+    maps = []
+
+    for region, value in zip(regions, values):
+        geom = RegionGeom.from_regions(regions=region, axes=m.geom.axes, wcs=m.geom.wcs)
+        data = value.reshape(shape + (1, 1)).astype(m.data.dtype)
+        maps.append(RegionNDMap(geom=geom, data=data, unit=m.unit, meta=m.meta.copy()))
+
+    return maps
+
+
 class MapDataset(Dataset):
     """Main map dataset for likelihood fitting.
 
@@ -1873,9 +1995,54 @@ class MapDataset(Dataset):
         dataset : `~gammapy.datasets.SpectrumDataset`
             The resulting reduced dataset.
         """
-        from .spectrum import SpectrumDataset
-
         dataset = self.to_region_map_dataset(region=on_region, name=name)
+        return self._region_map_to_spectrum_dataset(
+            dataset=dataset,
+            on_region=on_region,
+            containment_correction=containment_correction,
+            name=name,
+        )
+
+    def to_spectrum_datasets(self, regions, containment_correction=False, names=None):
+        """Return a list of ~gammapy.datasets.SpectrumDataset from several regions.
+
+        This is equivalent to calling `to_spectrum_dataset` for each region,
+        but the data are reduced for all regions in one pass, see
+        `to_region_map_datasets`.
+
+        Parameters
+        ----------
+        regions : list of `~regions.SkyRegion`
+            The input ON regions on which to extract the spectra.
+        containment_correction : bool
+            Apply containment correction for point sources and circular on regions. Default is False.
+        names : list of str, optional
+            Names of the new datasets. Default is None.
+
+        Returns
+        -------
+        datasets : `~gammapy.datasets.Datasets`
+            The resulting reduced datasets.
+        """
+        datasets = self.to_region_map_datasets(regions=regions, names=names)
+
+        return Datasets(
+            [
+                self._region_map_to_spectrum_dataset(
+                    dataset=dataset,
+                    on_region=region,
+                    containment_correction=containment_correction,
+                    name=dataset.name,
+                )
+                for dataset, region in zip(datasets, regions)
+            ]
+        )
+
+    def _region_map_to_spectrum_dataset(
+        self, dataset, on_region, containment_correction=False, name=None
+    ):
+        """Convert a dataset reduced in a region to a ~gammapy.datasets.SpectrumDataset."""
+        from .spectrum import SpectrumDataset
 
         if containment_correction:
             if not isinstance(on_region, CircleSkyRegion):
@@ -1994,6 +2161,114 @@ class MapDataset(Dataset):
 
         return self.__class__(**kwargs)
 
+    def to_region_map_datasets(self, regions, names=None):
+        """Integrate the map dataset in several regions in one pass.
+
+        This is equivalent to calling `to_region_map_dataset` for each region.
+        However, the region masks are computed once and stored in a sparse
+        region to pixel matrix, so that the counts, background and exposure
+        of all regions are obtained with a single matrix product. The
+        background prediction is evaluated only once as well.
+
+        Parameters
+        ----------
+        regions : list of `~regions.SkyRegion`
+            Regions from which to extract the spectra.
+        names : list of str, optional
+            Names of the new datasets. Default is None.
+
+        Returns
+        -------
+        datasets : `~gammapy.datasets.Datasets`
+            The resulting reduced datasets.
+        """
+        if names is None:
+            names = [None] * len(regions)
+
+        if len(names) != len(regions):
+            raise ValueError(
+                f"Number of names ({len(names)}) does not match "
+                f"number of regions ({len(regions)})"
+            )
+
+        names = [make_name(name) for name in names]
+
+        is_supported = isinstance(self._geom, WcsGeom) and not any(
+            region is None or isinstance(region, PointSkyRegion) for region in regions
+        )
+
+        if not regions or not is_supported:
+            return Datasets(
+                [
+                    self.to_region_map_dataset(region=region, name=name)
+                    for region, name in zip(regions, names)
+                ]
+            )
+
+        weights = _region_weights_matrix(self._geom, regions, check_contained=True)
+
+        kwargs_list = [
+            {"gti": self.gti, "name": name, "meta_table": self.meta_table}
+            for name in names
+        ]
+
+        def set_maps(key, maps):
+            for kwargs, m in zip(kwargs_list, maps):
+                kwargs[key] = m
+
+        if self.mask and not self.mask.geom.is_region:
+            data = self.mask.data.reshape((-1, weights.shape[1])).T
+            n_true = weights @ data.astype(float)
+            npix = np.asarray(weights.sum(axis=1))
+            is_uniform = (n_true == 0) | (n_true == npix)
+            if not np.all(is_uniform):
+                raise Exception(
+                    """`to_region_map_dataset` can only be applied if the mask
+                    is spatially uniform within the region for each energy bin"""
+                )
+
+        if self.mask_safe:
+            maps = _reduce_in_regions(self.mask_safe, regions, weights, func="any")
+            set_maps("mask_safe", maps)
+
+        if self.mask_fit:
+            maps = _reduce_in_regions(self.mask_fit, regions, weights, func="any")
+            set_maps("mask_fit", maps)
+
+        if self.counts:
+            maps = _reduce_in_regions(
+                self.counts, regions, weights, func="sum", mask=self.mask_safe
+            )
+            set_maps("counts", maps)
+
+        if self.stat_type == "cash" and self.background:
+            maps = _reduce_in_regions(
+                self.npred_background(),
+                regions,
+                weights,
+                func="sum",
+                mask=self.mask_safe,
+            )
+            set_maps("background", maps)
+
+        if self.exposure:
+            geom = self.exposure.geom
+            if geom.to_image() != self._geom.to_image():
+                weights = _region_weights_matrix(geom, regions)
+
+            maps = _reduce_in_regions(self.exposure, regions, weights, func="mean")
+            set_maps("exposure", maps)
+
+        # TODO: Compute average psf and edisp in region
+        for kwargs, region in zip(kwargs_list, regions):
+            if self.psf:
+                kwargs["psf"] = self.psf.to_region_nd_map(region.center)
+
+            if self.edisp is not None:
+                kwargs["edisp"] = self.edisp.to_region_nd_map(region.center)
+
+        return Datasets([self.__class__(**kwargs) for kwargs in kwargs_list])
+
     def cutout(self, position, width, mode="trim", name=None):
         """Cutout map dataset.
 
@@ -3210,6 +3485,85 @@ class MapDatasetOnOff(MapDataset):
 
         return SpectrumDatasetOnOff.from_spectrum_dataset(dataset=dataset, **kwargs)
 
+    def to_spectrum_datasets(self, regions, containment_correction=False, names=None):
+        """Return a list of ~gammapy.datasets.SpectrumDatasetOnOff from several regions.
+
+        This is equivalent to calling `to_spectrum_dataset` for each region,
+        but the data are reduced for all regions in one pass, see
+        `~gammapy.datasets.MapDataset.to_region_map_datasets`.
+
+        Parameters
+        ----------
+        regions : list of `~regions.SkyRegion`
+            The input ON regions on which to extract the spectra.
+        containment_correction : bool
+            Apply containment correction for point sources and circular on regions. Default is False.
+        names : list of str, optional
+            Names of the new datasets. Default is None.
+
+        Returns
+        -------
+        datasets : `~gammapy.datasets.Datasets`
+            The resulting reduced datasets.
+        """
+        from .spectrum import SpectrumDatasetOnOff
+
+        datasets = super().to_spectrum_datasets(
+            regions=regions,
+            containment_correction=containment_correction,
+            names=names,
+        )
+
+        maps = {
+            "counts_off": (self.counts_off, "sum"),
+            "acceptance": (self.acceptance, "mean"),
+            "background": (self.background, "sum"),
+        }
+
+        is_supported = isinstance(self._geom, WcsGeom) and not any(
+            region is None or isinstance(region, PointSkyRegion) for region in regions
+        )
+
+        if is_supported and regions:
+            weights = _region_weights_matrix(self._geom, regions)
+
+        reduced = {}
+
+        for key, (m, func) in maps.items():
+            if m is None:
+                continue
+            elif is_supported:
+                reduced[key] = _reduce_in_regions(
+                    m, regions, weights, func=func, mask=self.mask_safe
+                )
+            else:
+                func = {"sum": np.sum, "mean": np.mean}[func]
+                reduced[key] = [
+                    m.get_spectrum(region, func, weights=self.mask_safe)
+                    for region in regions
+                ]
+
+        results = []
+
+        for idx, dataset in enumerate(datasets):
+            kwargs = {"name": dataset.name}
+
+            if self.counts_off is not None:
+                kwargs["counts_off"] = reduced["counts_off"][idx]
+
+            if self.acceptance is not None:
+                kwargs["acceptance"] = reduced["acceptance"][idx]
+                norm = reduced["background"][idx]
+                acceptance_off = kwargs["acceptance"] * kwargs["counts_off"] / norm
+                np.nan_to_num(acceptance_off.data, copy=False)
+                kwargs["acceptance_off"] = acceptance_off
+
+            results.append(
+                SpectrumDatasetOnOff.from_spectrum_dataset(dataset=dataset, **kwargs)
+            )
+
+        return Datasets(results)
+
     def cutout(self, position, width, mode="trim", name=None):
         """Cutout map dataset.
 
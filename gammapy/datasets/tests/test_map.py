@@ -400,6 +400,58 @@ def test_different_exposure_unit(sky_model, geom):
     assert_allclose(npred.data[0, 50, 50], 6.086019, rtol=1e-2)
 
 
+def test_to_region_map_datasets():
+    e_reco = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=2)
+    e_true = MapAxis.from_energy_bounds("0.1 TeV", "10 TeV", nbin=3, name="energy_true")
+    geom = WcsGeom.create(binsz=0.02, width=(2, 2), axes=[e_reco])
+    dataset = MapDataset.create(geom=geom, energy_axis_true=e_true, name="test")
+
+    random_state = np.random.RandomState(seed=0)
+    dataset.counts.data = random_state.poisson(3, size=dataset.counts.data.shape)
+    dataset.background.data += 2.0
+    dataset.exposure.data = random_state.uniform(1, 2, size=dataset.exposure.data.shape)
+    dataset.mask_safe.data[0] = False
+
+    center = geom.center_skydir
+    regions = [
+        CircleSkyRegion(center=center, radius=0.1 * u.deg),
+        CircleSkyRegion(
+            center=center.directional_offset_by(0 * u.deg, 0.4 * u.deg),
+            radius=0.2 * u.deg,
+        ),
+        CircleSkyRegion(
+            center=center.directional_offset_by(90 * u.deg, 0.3 * u.deg),
+            radius=0.05 * u.deg,
+        ),
+    ]
+
+    datasets = dataset.to_region_map_datasets(regions, names=["a", "b", "c"])
+
+    assert isinstance(datasets, Datasets)
+    assert datasets.names == ["a", "b", "c"]
+
+    for region, result in zip(regions, datasets):
+        expected = dataset.to_region_map_dataset(region)
+        assert result.counts.geom.region == expected.counts.geom.region
+        assert_allclose(result.counts.data, expected.counts.data)
+        assert_allclose(result.background.data, expected.background.data, rtol=1e-6)
+        assert_allclose(result.exposure.data, expected.exposure.data, rtol=1e-6)
+        assert_equal(result.mask_safe.data, expected.mask_safe.data)
+        assert result.exposure.unit == expected.exposure.unit
+
+    spectrum_datasets = dataset.to_spectrum_datasets(regions)
+    assert len(spectrum_datasets) == 3
+    assert_allclose(spectrum_datasets[1].counts.data, datasets[1].counts.data)
+
+    with pytest.raises(Exception):
+        dataset.to_region_map_datasets(
+            [CircleSkyRegion(center=center, radius=1.5 * u.deg)]
+        )
+
+    with pytest.raises(ValueError):
+        dataset.to_region_map_datasets(regions, names=["a"])
+
+
 @pytest.mark.parametrize(("edisp_mode"), ["edispmap", "edispkernelmap"])
 @requires_data()
 def test_to_spectrum_dataset(sky_model, geom, geom_etrue, edisp_mode):
@@ -1614,6 +1666,26 @@ def test_create_onoff(geom):
     assert_allclose(empty_dataset.gti.time_delta, 0.0 * u.s)
 
 
+def test_map_dataset_on_off_to_spectrum_datasets(geom):
+    dataset = MapDatasetOnOff.create(geom, name="test")
+    dataset.counts.data += 1
+    dataset.counts_off.data += 2
+    dataset.acceptance.data += 1
+    dataset.acceptance_off.data += 4
+
+    regions = [
+        CircleSkyRegion(center=geom.center_skydir, radius=r * u.deg) for r in [0.1, 0.5]
+    ]
+
+    datasets = dataset.to_spectrum_datasets(regions)
+
+    for region, result in zip(regions, datasets):
+        expected = dataset.to_spectrum_dataset(region)
+        assert_allclose(result.counts.data, expected.counts.data)
+        assert_allclose(result.counts_off.data, expected.counts_off.data)
+        assert_allclose(result.alpha.data, expected.alpha.data)
+
+
 @requires_data()
 def test_map_dataset_onoff_str(images):
     dataset = get_map_dataset_onoff(images)
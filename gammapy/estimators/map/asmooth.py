@@ -4,12 +4,12 @@
 import numpy as np
 from astropy.convolution import Gaussian2DKernel, Tophat2DKernel
 from astropy.coordinates import Angle
+import gammapy.utils.parallel as parallel
 from gammapy.datasets import MapDatasetOnOff
 from gammapy.maps import Map, Maps, WcsNDMap
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import CashCountsStatistic
-from gammapy.utils.array import scale_cube
-from gammapy.utils.pbar import progress_bar
+from gammapy.utils.array import _convolve_scales, _kernels_fft
 from ..core import Estimator
 from ..utils import estimate_exposure_reco_energy
 
@@ -21,7 +21,7 @@ def _sqrt_ts_asmooth(counts, background):
     return (counts - background) / np.sqrt(counts + background)
 
 
-class ASmoothMapEstimator(Estimator):
+class ASmoothMapEstimator(Estimator, parallel.ParallelMixin):
     """Adaptively smooth counts image.
 
     Achieves a roughly constant sqrt(TS) of features across the whole image.
@@ -48,6 +48,13 @@ class ASmoothMapEstimator(Estimator):
         but rather the closest values to the energy axis edges of the parent dataset.
         Default is None: apply the estimator in each energy bin of the parent dataset.
         For further explanation see :ref:`estimators`.
+    n_jobs : int, optional
+        Number of processes used in parallel for the computation of the energy bins.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+        The number of jobs is limited to the number of physical CPUs.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing.
+        Default is `~gammapy.utils.parallel.BACKEND_DEFAULT`.
 
     Examples
     --------
@@ -76,6 +83,8 @@ class ASmoothMapEstimator(Estimator):
         method="lima",
         threshold=5,
         energy_edges=None,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         if spectral_model is None:
             spectral_model = PowerLawSpectralModel(index=2)
@@ -90,6 +99,8 @@ class ASmoothMapEstimator(Estimator):
         self.threshold = threshold
         self.method = method
         self.energy_edges = energy_edges
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
     def selection_all(self):
         """Which quantities are computed."""
@@ -181,11 +192,9 @@ class ASmoothMapEstimator(Estimator):
         """
         energy_axis = self._get_energy_axis(dataset)
 
-        results = []
+        datasets = []
 
-        for energy_min, energy_max in progress_bar(
-            energy_axis.iter_by_edges, desc="Energy bins"
-        ):
+        for energy_min, energy_max in energy_axis.iter_by_edges:
             dataset_sliced = dataset.slice_by_energy(
                 energy_min=energy_min, energy_max=energy_max, name=dataset.name
             )
@@ -195,8 +204,15 @@ class ASmoothMapEstimator(Estimator):
                     energy_max=energy_max,
                 )
                 dataset_sliced.models = models_sliced
-            result = self.estimate_maps(dataset_sliced)
-            results.append(result)
+            datasets.append(dataset_sliced)
+
+        results = parallel.run_multiprocessing(
+            self.estimate_maps,
+            zip(datasets),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=self.n_jobs),
+            task_name="Energy bins",
+        )
 
         maps = Maps()
 
@@ -243,17 +259,13 @@ class ASmoothMapEstimator(Estimator):
         pixel_scale = dataset_image.counts.geom.pixel_scales.mean()
         kernels = self.get_kernels(pixel_scale)
 
-        cubes = {}
-        cubes["counts"] = scale_cube(counts, kernels)
-        cubes["background"] = scale_cube(background, kernels)
+        images = {"counts": counts, "background": background}
 
         if exposure is not None:
             flux = (dataset_image.counts - background) / exposure
-            cubes["flux"] = scale_cube(flux.data[0], kernels)
-
-        cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
+            images["flux"] = flux.data[0]
 
-        smoothed = self._reduce_cubes(cubes, kernels)
+        smoothed = self._reduce_scales(images, kernels)
 
         result = {}
 
@@ -277,41 +289,58 @@ class ASmoothMapEstimator(Estimator):
 
         return result
 
-    def _reduce_cubes(self, cubes, kernels):
-        """
-        Combine scale cube to image.
+    def _reduce_scales(self, images, kernels):
+        """Convolve images with increasing scales and combine them.
+
+        The FFT of each image and the spectra of the kernels are computed
+        once. The images are convolved one scale at a time, and only the
+        combined best-scale images are kept, so that the full scale cubes
+        are never stored in memory. The iteration stops as soon as all
+        pixels have been assigned a scale.
 
         Parameters
         ----------
-        cubes : dict
-            Data cubes.
+        images : dict of `~numpy.ndarray`
+            Images to smooth.
+        kernels : list of `~astropy.convolution.Kernel`
+            Smoothing kernels.
+
+        Returns
+        -------
+        smoothed : dict of `~numpy.ndarray`
+            Smoothed images.
         """
-        shape = cubes["counts"].shape[:2]
-        smoothed = {}
+        shape = images["counts"].shape
+        kernels_fft = _kernels_fft(kernels, shape)
+
+        convolved = {
+            key: _convolve_scales(data, kernels, kernels_fft)
+            for key, data in images.items()
+        }
 
         # Init smoothed data arrays
-        for key in ["counts", "background", "scale", "sqrt_ts"]:
-            smoothed[key] = np.tile(np.nan, shape)
+        smoothed = {}
 
-        if "flux" in cubes:
-            smoothed["flux"] = np.tile(np.nan, shape)
+        for key in ["counts", "background", "scale", "sqrt_ts", "flux"]:
+            if key in images or key in ["scale", "sqrt_ts"]:
+                smoothed[key] = np.tile(np.nan, shape)
 
-        for idx, scale in enumerate(self.scales):
-            # slice out 2D image at index idx out of cube
-            slice_ = np.s_[:, :, idx]
+        for scale, kernel in zip(self.scales, kernels):
+            images_scale = {key: next(value) for key, value in convolved.items()}
+            sqrt_ts = self._sqrt_ts_cube(images_scale, method=self.method)
 
             mask = np.isnan(smoothed["counts"])
-            mask = (cubes["sqrt_ts"][slice_] > self.threshold) & mask
+            mask &= sqrt_ts > self.threshold
 
             smoothed["scale"][mask] = scale
-            smoothed["sqrt_ts"][mask] = cubes["sqrt_ts"][slice_][mask]
+            smoothed["sqrt_ts"][mask] = sqrt_ts[mask]
 
             # renormalize smoothed data arrays
-            norm = kernels[idx].array.sum()
-            for key in ["counts", "background"]:
-                smoothed[key][mask] = cubes[key][slice_][mask] / norm
+            norm = kernel.array.sum()
+            for key, data in images_scale.items():
+                smoothed[key][mask] = data[mask] / norm
 
-            if "flux" in cubes:
-                smoothed["flux"][mask] = cubes["flux"][slice_][mask] / norm
+            if not np.isnan(smoothed["counts"]).any():
+                break
 
         return smoothed
@@ -156,8 +156,6 @@ class FluxMaps:
         Set fitted norm and error to NaN when the fit has not succeeded.
     """
 
-    _expand_slice = (slice(None), np.newaxis, np.newaxis)
-
     def __init__(
         self, data, reference_model, meta=None, gti=None, filter_success_nan=True
     ):
@@ -460,6 +458,12 @@ class FluxMaps:
             data = np.expand_dims(data, axis=idx)
         return data
 
+    @staticmethod
+    def _get_expand_slice(geom):
+        """Slice to broadcast an energy dependent array to the map data shape."""
+        n_spatial = 1 if geom.is_hpx else 2
+        return (slice(None),) + (np.newaxis,) * n_spatial
+
     @staticmethod
     def _use_center_as_labels(input_map):
         """Change the node_type of the input map."""
@@ -617,14 +621,14 @@ class FluxMaps:
     def dnde_ref(self):
         """Reference differential flux."""
         result = self.reference_spectral_model(self.energy_axis.center)
-        return result[self._expand_slice]
+        return result[self._get_expand_slice(self.geom)]
 
     @property
     def e2dnde_ref(self):
         """Reference differential flux * energy ** 2."""
         energy = self.energy_axis.center
         result = self.reference_spectral_model(energy) * energy**2
-        return result[self._expand_slice]
+        return result[self._get_expand_slice(self.geom)]
 
     @property
     def flux_ref(self):
@@ -637,7 +641,7 @@ class FluxMaps:
         energy_min = self.energy_axis.edges[:-1]
         energy_max = self.energy_axis.edges[1:]
         result = self.reference_spectral_model.integral(energy_min, energy_max)
-        return result[self._expand_slice]
+        return result[self._get_expand_slice(self.geom)]
 
     @property
     def eflux_ref(self):
@@ -650,7 +654,7 @@ class FluxMaps:
         energy_min = self.energy_axis.edges[:-1]
         energy_max = self.energy_axis.edges[1:]
         result = self.reference_spectral_model.energy_flux(energy_min, energy_max)
-        return result[self._expand_slice]
+        return result[self._get_expand_slice(self.geom)]
 
     @property
     def dnde(self):
@@ -967,7 +971,9 @@ class FluxMaps:
             )
 
         # TODO: handle reshaping in MapAxis
-        factor = fluxes[f"ref_{sed_type}"].to(map_ref.unit)[cls._expand_slice]
+        factor = fluxes[f"ref_{sed_type}"].to(map_ref.unit)[
+            cls._get_expand_slice(map_ref.geom)
+        ]
 
         data = {}
         data["norm"] = map_ref / factor
@@ -17,6 +17,30 @@ __all__ = ["ExcessMapEstimator"]
 log = logging.getLogger(__name__)
 
 
+def _convolve(m, kernel):
+    """Convolve a map with a kernel.
+
+    Parameters
+    ----------
+    m : `~gammapy.maps.Map`
+        Map to convolve.
+    kernel : `~numpy.ndarray` or `~scipy.sparse.csr_matrix`
+        Kernel array for WCS maps, or sparse correlation matrix of shape
+        (npix, npix) for HEALPix maps.
+
+    Returns
+    -------
+    convolved : `~gammapy.maps.Map`
+        Convolved map.
+    """
+    if m.geom.is_hpx:
+        data = m.data.reshape((-1, kernel.shape[1])).astype(float)
+        data = (kernel @ data.T).T.reshape(m.data.shape)
+        return Map.from_geom(m.geom, data=data, unit=m.unit)
+
+    return m.convolve(kernel)
+
+
 def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     """Return convolved maps.
 
@@ -24,8 +48,8 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     ----------
     dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
         Map dataset.
-    kernel : `~astropy.convolution.Kernel`
-        Kernel.
+    kernel : `~gammapy.maps.Map` or `~scipy.sparse.csr_matrix`
+        Kernel map, or sparse correlation matrix for HEALPix datasets.
     mask : `~gammapy.maps.Map`
         Mask map.
     correlate_off : bool
@@ -36,14 +60,17 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     convolved_maps : dict
         Dictionary of convolved maps.
     """
-    # Kernel is modified later make a copy here
-    kernel = copy.deepcopy(kernel)
-    kernel_data = kernel.data / kernel.data.max()
+    if isinstance(kernel, Map):
+        # Kernel is modified later make a copy here
+        kernel = copy.deepcopy(kernel)
+        kernel_data = kernel.data / kernel.data.max()
+    else:
+        kernel_data = kernel
 
     # fft convolution adds numerical noise, to ensure integer results we call
     # np.rint
     n_on = dataset.counts * mask
-    n_on_conv = np.rint(n_on.convolve(kernel_data).data)
+    n_on_conv = np.rint(_convolve(n_on, kernel_data).data)
 
     convolved_maps = {"n_on_conv": n_on_conv}
 
@@ -52,18 +79,18 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         npred_sig = dataset.npred_signal() * mask
         acceptance_on = dataset.acceptance * mask
         acceptance_off = dataset.acceptance_off * mask
-        npred_sig_convolve = npred_sig.convolve(kernel_data)
+        npred_sig_convolve = _convolve(npred_sig, kernel_data)
         if correlate_off:
             background = dataset.background * mask
             background.data[dataset.acceptance_off == 0] = 0.0
-            background_conv = background.convolve(kernel_data)
-            n_off = n_off.convolve(kernel_data)
+            background_conv = _convolve(background, kernel_data)
+            n_off = _convolve(n_off, kernel_data)
 
             with np.errstate(invalid="ignore", divide="ignore"):
                 alpha = background_conv / n_off
 
         else:
-            acceptance_on_convolve = acceptance_on.convolve(kernel_data)
+            acceptance_on_convolve = _convolve(acceptance_on, kernel_data)
 
             with np.errstate(invalid="ignore", divide="ignore"):
                 alpha = acceptance_on_convolve / acceptance_off
@@ -78,7 +105,7 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         )
     else:
         npred = dataset.npred() * mask
-        background_conv = npred.convolve(kernel_data)
+        background_conv = _convolve(npred, kernel_data)
         convolved_maps.update(
             {
                 "background_conv": background_conv,
@@ -321,6 +348,10 @@ class ExcessMapEstimator(Estimator):
     def estimate_kernel(self, dataset):
         """Get the convolution kernel for the input dataset.
 
+        For HEALPix datasets the correlation is done natively on the sphere:
+        the kernel is a sparse matrix summing, for each pixel, the pixels
+        whose centers lie within the correlation radius.
+
         Parameters
         ----------
         dataset : `~gammapy.datasets.MapDataset`
@@ -328,9 +359,14 @@ class ExcessMapEstimator(Estimator):
 
         Returns
         -------
-        kernel : `~astropy.convolution.Tophat2DKernel`
-            Kernel.
+        kernel : `~gammapy.maps.Map` or `~scipy.sparse.csr_matrix`
+            Kernel map, or sparse correlation matrix for HEALPix datasets.
         """
+        if dataset.counts.geom.is_hpx:
+            kernel = dataset.counts.geom.get_disc_neighbours(self.correlation_radius)
+            kernel.data[:] = 1.0
+            return kernel
+
         pixel_size = np.mean(np.abs(dataset.counts.geom.wcs.wcs.cdelt))
         size = self.correlation_radius.deg / pixel_size
         kernel = Tophat2DKernel(size)
@@ -368,8 +404,8 @@ class ExcessMapEstimator(Estimator):
         ----------
         dataset : `~gammapy.datasets.MapDataset`
             Map dataset.
-        kernel : `~astropy.convolution.Tophat2DKernel`
-            Kernel.
+        kernel : `~gammapy.maps.Map` or `~scipy.sparse.csr_matrix`
+            Kernel map, or sparse correlation matrix for HEALPix datasets.
         mask : `~gammapy.maps.Map`
             Mask map.
 
@@ -378,10 +414,13 @@ class ExcessMapEstimator(Estimator):
         reco_exposure : `~gammapy.maps.Map`
             Reconstructed exposure map.
         """
+        if isinstance(kernel, Map):
+            kernel = kernel.data
+
         if dataset.exposure:
             with np.errstate(invalid="ignore", divide="ignore"):
-                reco_exposure = reco_exposure.convolve(kernel.data) / mask.convolve(
-                    kernel.data
+                reco_exposure = _convolve(reco_exposure, kernel) / _convolve(
+                    mask, kernel
                 )
         else:
             reco_exposure = 1
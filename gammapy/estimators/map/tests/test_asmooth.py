@@ -118,3 +118,36 @@ def test_asmooth_map_dataset_on_off():
     assert_allclose(smoothed["counts"].data[0, 25, 25], 2)
     assert_allclose(smoothed["background"].data[0, 25, 25], 1)
     assert_allclose(smoothed["sqrt_ts"].data[0, 25, 25], 4.39, rtol=1e-2)
+
+
+def test_asmooth_parallel():
+    kernel = Tophat2DKernel
+    scales = ASmoothMapEstimator.get_scales(3, factor=2, kernel=kernel) * 0.1 * u.deg
+
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    counts = WcsNDMap.create(npix=(40, 30), binsz=0.02, unit="", axes=[axis])
+    counts.data += [[[3]], [[2]]]
+    background = WcsNDMap.create(npix=(40, 30), binsz=0.02, unit="", axes=[axis])
+    background += 1
+
+    dataset = MapDataset(counts=counts, background=background)
+
+    asmooth = ASmoothMapEstimator(
+        kernel=kernel,
+        scales=scales,
+        method="lima",
+        threshold=2.5,
+        energy_edges=axis.edges,
+    )
+    smoothed = asmooth.run(dataset)
+
+    asmooth.n_jobs = 2
+    smoothed_parallel = asmooth.run(dataset)
+
+    assert smoothed["counts"].data.shape == (2, 30, 40)
+
+    for name in smoothed:
+        assert_allclose(smoothed_parallel[name].data, smoothed[name].data)
+
+    assert_allclose(smoothed["counts"].data[:, 15, 20], [3, 2])
+    assert_allclose(smoothed["scale"].data[0, 15, 20], scales[0].value)
@@ -10,7 +10,7 @@ from gammapy.estimators.utils import (
     get_combined_significance_maps,
 )
 from gammapy.irf import PSFMap
-from gammapy.maps import Map, MapAxis, WcsGeom
+from gammapy.maps import HpxGeom, Map, MapAxis, WcsGeom
 from gammapy.modeling.models import (
     GaussianSpatialModel,
     PowerLawSpectralModel,
@@ -455,3 +455,27 @@ def test_maps_alpha(simple_dataset_on_off):
     assert_allclose(result["acceptance_on"].data[:, 10, 10], 2, atol=1e-3)
     assert_allclose(result["acceptance_off"].data[:, 10, 10], 2, atol=1e-3)
     assert_allclose(result["alpha"].data[:, 10, 10], 1, atol=1e-3)
+
+
+def test_excess_map_estimator_hpx():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = HpxGeom.create(nside=256, region="DISK(0,0,2)", axes=[axis])
+    dataset = MapDataset.create(geom, name="test")
+    dataset.mask_safe.data[...] = True
+    dataset.background.data += 1
+    dataset.exposure.data += 1e10
+    dataset.counts.data += np.random.RandomState(0).poisson(2, geom.data_shape)
+
+    estimator = ExcessMapEstimator(correlation_radius="0.5 deg")
+    result = estimator.run(dataset)
+
+    assert result["npred"].geom.is_hpx
+    assert result["npred"].data.shape == (1, 246)
+
+    neighbours = geom.to_image().get_disc_neighbours("0.5 deg")
+    counts = dataset.counts.data.sum(axis=0)
+    idx = neighbours[100].indices
+    assert_allclose(result["npred"].data[0, 100], counts[idx].sum())
+    assert_allclose(result["npred_background"].data[0, 100], 2 * len(idx))
+    assert np.all(np.isfinite(result["sqrt_ts"].data))
+    assert result["flux"].unit == "cm-2 s-1"
@@ -15,7 +15,7 @@ from gammapy.estimators.utils import (
     get_flux_map_from_profile,
 )
 from gammapy.irf import EDispKernelMap, PSFMap
-from gammapy.maps import Map, MapAxis, WcsGeom
+from gammapy.maps import HpxGeom, Map, MapAxis, WcsGeom
 from gammapy.modeling.models import (
     ConstantSpatialModel,
     GaussianSpatialModel,
@@ -624,6 +624,36 @@ def test_joint_ts_map(fake_dataset):
     assert_allclose(result["sqrt_ts"].data[0, 10, 10], 1.92364, rtol=1e-3)
 
 
+def test_ts_map_hpx():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    geom = HpxGeom.create(nside=512, region="DISK(0,0,2)", axes=[axis])
+    dataset = MapDataset.create(geom, energy_axis_true=axis_true)
+    dataset.psf = PSFMap.from_gauss(axis_true, sigma="0.1 deg")
+    dataset.mask_safe.data[...] = True
+    dataset.background.data += 1
+    dataset.exposure.data += 1e10
+    dataset.counts.data = np.random.RandomState(0).poisson(1, geom.data_shape)
+    dataset.counts.data[:, 30] += 30
+
+    estimator = TSMapEstimator(kernel_width="0.5 deg", selection_optional=[])
+    result = estimator.run(dataset)
+
+    assert result["ts"].geom.is_hpx
+    assert result["ts"].data.shape == (1, 960)
+    assert np.nanargmax(result["ts"].data) == 30
+    assert_allclose(result["ts"].data[0, 30], 199.031491, rtol=1e-3)
+    assert_allclose(result["flux"].data[0, 30], 5.871749e-13, rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        TSMapEstimator(selection_optional=[]).run(dataset)
+
+    with pytest.raises(ValueError):
+        TSMapEstimator(kernel_width="0.5 deg", downsampling_factor=2).run(dataset)
+
+
 @requires_data()
 def test_joint_ts_map_hawc():
     datasets = Datasets.read("$GAMMAPY_DATA/hawc/DL4/HAWC_pass4_public_Crab.yaml")
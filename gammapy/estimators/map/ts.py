@@ -12,7 +12,7 @@ import gammapy.utils.parallel as parallel
 from gammapy.datasets import Datasets
 from gammapy.datasets.map import MapEvaluator
 from gammapy.datasets.utils import get_nearest_valid_exposure_position
-from gammapy.maps import Map, MapAxis, Maps
+from gammapy.maps import Map, MapAxis, Maps, WcsGeom
 from gammapy.modeling.models import PointSpatialModel, PowerLawSpectralModel, SkyModel
 from gammapy.stats import cash, cash_sum_cython, f_cash_root_cython, norm_bounds_cython
 from gammapy.stats.utils import ts_to_sigma
@@ -56,6 +56,108 @@ def _extract_array(array, shape, position):
     return array[:, y_lo:y_hi, x_lo:x_hi]
 
 
+class _HpxSourceKernel:
+    """Source model kernel on a HEALPix geometry.
+
+    Parameters
+    ----------
+    neighbours : `~scipy.sparse.csr_matrix`
+        Neighbour pixels of each pixel, see `~gammapy.maps.HpxGeom.get_disc_neighbours`.
+    data : `~numpy.ndarray`
+        Kernel values with shape (n_energy, n_neighbours), ordered as the
+        indices of ``neighbours``.
+    """
+
+    def __init__(self, neighbours, data):
+        self.neighbours = neighbours
+        self.data = data
+
+    @classmethod
+    def from_wcs_kernel(cls, kernel, geom, radius):
+        """Create from the radial profile of a WCS kernel map.
+
+        Parameters
+        ----------
+        kernel : `~gammapy.maps.WcsNDMap`
+            Kernel map, centered on the source position.
+        geom : `~gammapy.maps.HpxGeom`
+            HEALPix geometry.
+        radius : `~astropy.coordinates.Angle`
+            Kernel radius.
+
+        Returns
+        -------
+        kernel : `_HpxSourceKernel`
+            HEALPix source kernel.
+        """
+        neighbours = geom.get_disc_neighbours(radius)
+
+        separation = kernel.geom.separation(kernel.geom.center_skydir).rad.ravel()
+        binsz = np.min(kernel.geom.pixel_scales.to_value("rad"))
+        idx = (separation / binsz).astype(int)
+
+        counts = np.bincount(idx)
+        valid = counts > 0
+        radii = np.bincount(idx, weights=separation)[valid] / counts[valid]
+
+        data = []
+
+        for values in kernel.data.reshape((kernel.data.shape[0], -1)):
+            profile = np.bincount(idx, weights=values)[valid] / counts[valid]
+            data.append(np.interp(neighbours.data, radii, profile, right=0))
+
+        data = np.array(data)
+
+        # normalise the kernel of each pixel, as done for WCS kernels
+        norm = np.add.reduceat(data.sum(axis=0), neighbours.indptr[:-1])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            data /= np.repeat(norm, np.diff(neighbours.indptr))
+
+        return cls(neighbours=neighbours, data=np.nan_to_num(data))
+
+    def cutout(self, idx):
+        """Neighbour indices and kernel values of a given pixel.
+
+        Parameters
+        ----------
+        idx : int
+            Pixel index.
+
+        Returns
+        -------
+        idx_nb, values : `~numpy.ndarray`
+            Neighbour indices and kernel values of shape (n_energy, n_neighbours).
+        """
+        slice_ = slice(self.neighbours.indptr[idx], self.neighbours.indptr[idx + 1])
+        return self.neighbours.indices[slice_], self.data[:, slice_]
+
+    def convolve(self, m):
+        """Convolve a map with the kernel normalised by its squared sum.
+
+        Parameters
+        ----------
+        m : `~gammapy.maps.HpxNDMap`
+            Map with the same number of energy bins as the kernel.
+
+        Returns
+        -------
+        convolved : `~gammapy.maps.HpxNDMap`
+            Convolved map.
+        """
+        data = np.zeros(m.data.shape)
+        matrix = self.neighbours.copy()
+        norm = np.add.reduceat((self.data**2).sum(axis=0), matrix.indptr[:-1])
+
+        for idx, values in enumerate(self.data):
+            matrix.data = values
+            data[idx] = matrix @ m.data[idx]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            data = np.nan_to_num(data / norm)
+
+        return Map.from_geom(m.geom, data=data, unit=m.unit)
+
+
 class TSMapEstimator(Estimator, parallel.ParallelMixin):
     r"""Compute test statistic map from a MapDataset using different optimization methods.
 
@@ -67,6 +169,10 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
     The main output of this estimator is a `~gammapy.estimators.FluxMaps` object, which provides
     access to all computed quantities (see the example below and the `TSMapEstimator.run` function).
 
+    HEALPix datasets are supported natively: the fit at each pixel uses the
+    pixels within half the kernel width, and the source kernel is obtained from
+    the radial profile of the model kernel, which is assumed to be symmetric.
+
     Parameters
     ----------
     model : `~gammapy.modeling.models.SkyModel`
@@ -74,7 +180,8 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         assume spatail model: point source model, PointSpatialModel.
         spectral model: PowerLawSpectral Model of index 2
     kernel_width : `~astropy.coordinates.Angle`
-        Width of the kernel to use: the kernel will be truncated at this size
+        Width of the kernel to use: the kernel will be truncated at this size.
+        Required for HEALPix datasets.
     n_sigma : int
         Number of sigma for flux error. Default is 1.
     n_sigma_ul : int
@@ -280,22 +387,40 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         Returns
         -------
         kernel : `~gammapy.maps.Map`
-            Kernel map.
+            Kernel map. For HEALPix datasets, a sparse kernel giving the model
+            weights of the neighbours of each pixel is returned instead.
 
         """
         geom = dataset.exposure.geom
+        position = get_nearest_valid_exposure_position(
+            dataset.exposure, geom.center_skydir
+        )
 
-        if self.kernel_width is not None:
-            geom = geom.to_odd_npix(max_radius=self.kernel_width / 2)
+        if geom.is_hpx:
+            if self.kernel_width is None:
+                raise ValueError("A kernel width is required for HEALPix datasets.")
+
+            # compute the kernel on a local WCS geometry oversampling the HEALPix pixels
+            geom = WcsGeom.create(
+                skydir=position,
+                binsz=np.min(geom.pixel_scales.to_value("deg")) / 4,
+                width=self.kernel_width,
+                frame=geom.frame,
+                axes=[geom.axes["energy_true"]],
+            ).to_odd_npix()
+            geom_counts = geom.to_image().to_cube([dataset.counts.geom.axes["energy"]])
+            mask = Map.from_geom(geom.to_image(), data=True, dtype=bool)
+        else:
+            if self.kernel_width is not None:
+                geom = geom.to_odd_npix(max_radius=self.kernel_width / 2)
+            geom_counts = dataset.counts.geom
+            mask = dataset.mask_image
 
         model = self.model.copy()
         model.spatial_model.position = geom.center_skydir
 
         # Creating exposure map with the mean non-null exposure
         exposure = Map.from_geom(geom, unit=dataset.exposure.unit)
-        position = get_nearest_valid_exposure_position(
-            dataset.exposure, geom.center_skydir
-        )
         exposure_position = dataset.exposure.to_region_nd_map(position)
         if not np.any(exposure_position.data):
             raise ValueError(
@@ -310,12 +435,20 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             exposure=exposure,
             psf=dataset.psf,
             edisp=dataset.edisp,
-            geom=dataset.counts.geom,
-            mask=dataset.mask_image,
+            geom=geom_counts,
+            mask=mask,
         )
 
         kernel = evaluator.compute_npred()
         kernel.data /= kernel.data.sum()
+
+        if dataset.counts.geom.is_hpx:
+            kernel = _HpxSourceKernel.from_wcs_kernel(
+                kernel=kernel,
+                geom=dataset.counts.geom,
+                radius=self.kernel_width / 2,
+            )
+
         return kernel
 
     def estimate_flux_default(self, dataset, kernel=None, exposure=None):
@@ -341,14 +474,16 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         if kernel is None:
             kernel = self.estimate_kernel(dataset=dataset)
 
-        kernel = kernel.data / np.sum(kernel.data**2)
-
         with np.errstate(invalid="ignore", divide="ignore"):
             flux = (dataset.counts - dataset.npred()) / exposure
             flux.data = np.nan_to_num(flux.data)
 
         flux.quantity = flux.quantity.to("1 / (cm2 s)")
-        flux = flux.convolve(kernel)
+
+        if isinstance(kernel, _HpxSourceKernel):
+            flux = kernel.convolve(flux)
+        else:
+            flux = flux.convolve(kernel.data / np.sum(kernel.data**2))
         if dataset.mask:
             flux *= dataset.mask
         return flux.sum_over_axes()
@@ -490,15 +625,20 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             """
             )
 
-        x, y = np.where(np.squeeze(mask_2d))
-        positions = list(zip(x, y))
+        if maps[0]["counts"].geom.is_hpx:
+            positions = [(idx,) for idx in np.flatnonzero(mask_2d)]
+            kernels = [_["kernel"] for _ in maps]
+        else:
+            x, y = np.where(np.squeeze(mask_2d))
+            positions = list(zip(x, y))
+            kernels = [_["kernel"].data for _ in maps]
 
         inputs = zip(
             positions,
             repeat([_["counts"].data.astype(float) for _ in maps]),
             repeat([_["exposure"].data.astype(float) for _ in maps]),
             repeat([_["background"].data.astype(float) for _ in maps]),
-            repeat([_["kernel"].data for _ in maps]),
+            repeat(kernels),
             repeat([_["norm"].data for _ in maps]),
             repeat([_["weights"] for _ in maps]),
             repeat(self._flux_estimator),
@@ -514,7 +654,7 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
 
         result = {}
 
-        j, i = zip(*positions)
+        idx = tuple(np.array(_) for _ in zip(*positions))
 
         geom = maps[0]["counts"].geom.squash(axis_name="energy")
         energy_axis = geom.axes["energy"]
@@ -540,11 +680,12 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
                     factor = 1
 
                 m = Map.from_geom(geom_scan, data=np.nan, unit=unit)
-                m.data[:, 0, j, i] = np.array([_[name] for _ in results]).T * factor
+                values = np.array([_[name] for _ in results]).T * factor
+                m.data[(slice(None), 0) + idx] = values
 
             else:
                 m = Map.from_geom(geom=geom, data=np.nan, unit="")
-                m.data[0, j, i] = [_[name] for _ in results]
+                m.data[(0,) + idx] = [_[name] for _ in results]
             result[name] = m
 
         return result
@@ -593,17 +734,24 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
 
         datasets_models = datasets.models
 
-        pad_width = (0, 0)
-        for dataset in datasets:
-            pad_width_dataset = self.estimate_pad_width(dataset=dataset)
-            pad_width = tuple(np.maximum(pad_width, pad_width_dataset))
-
-        datasets_padded = Datasets()
-        for dataset in datasets:
-            dataset = dataset.pad(pad_width, name=dataset.name)
-            dataset = dataset.downsample(self.downsampling_factor, name=dataset.name)
-            datasets_padded.append(dataset)
-        datasets = datasets_padded
+        if geom_ref.is_hpx:
+            if self.downsampling_factor and self.downsampling_factor > 1:
+                raise ValueError("Downsampling is not supported for HEALPix datasets.")
+            pad_width = None
+        else:
+            pad_width = (0, 0)
+            for dataset in datasets:
+                pad_width_dataset = self.estimate_pad_width(dataset=dataset)
+                pad_width = tuple(np.maximum(pad_width, pad_width_dataset))
+
+            datasets_padded = Datasets()
+            for dataset in datasets:
+                dataset = dataset.pad(pad_width, name=dataset.name)
+                dataset = dataset.downsample(
+                    self.downsampling_factor, name=dataset.name
+                )
+                datasets_padded.append(dataset)
+            datasets = datasets_padded
 
         energy_axis = self._get_energy_axis(dataset=datasets[0])
 
@@ -631,12 +779,14 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         for name in self.selection_all:
             m = Map.from_stack(maps=[_[name] for _ in results], axis_name="energy")
 
-            order = 0 if name in ["niter", "success"] else 1
-            m = m.upsample(
-                factor=self.downsampling_factor, preserve_counts=False, order=order
-            )
+            if pad_width is not None:
+                order = 0 if name in ["niter", "success"] else 1
+                m = m.upsample(
+                    factor=self.downsampling_factor, preserve_counts=False, order=order
+                )
+                m = m.crop(crop_width=pad_width)
 
-            maps[name] = m.crop(crop_width=pad_width)
+            maps[name] = m
 
         maps["success"].data = maps["success"].data.astype(bool)
 
@@ -705,19 +855,31 @@ class SimpleMapDataset:
     @classmethod
     def from_arrays(cls, counts, background, exposure, norm, position, kernel, weights):
         """"""
+        if isinstance(kernel, _HpxSourceKernel):
+            idx, kernel = kernel.cutout(position[0])
+
+            def extract(array):
+                return array[:, idx]
+
+        else:
+            shape = kernel.shape
+
+            def extract(array):
+                return _extract_array(array, shape, position)
+
         if weights:
             # compute mask weighted kernel for the sum_over_axes case
-            weights = _extract_array(weights.data, kernel.shape, position)
+            weights = extract(weights.data)
             kernel = (kernel * weights).sum(axis=0, keepdims=True)
             with np.errstate(invalid="ignore", divide="ignore"):
                 kernel /= weights.sum(axis=0, keepdims=True)
                 kernel[~np.isfinite(kernel)] = 0
 
-        counts_cutout = _extract_array(counts, kernel.shape, position)
-        background_cutout = _extract_array(background, kernel.shape, position)
-        exposure_cutout = _extract_array(exposure, kernel.shape, position)
+        counts_cutout = extract(counts)
+        background_cutout = extract(background)
+        exposure_cutout = extract(exposure)
         model = kernel * exposure_cutout
-        norm_guess = norm[0, position[0], position[1]]
+        norm_guess = norm[(0,) + tuple(position)]
         mask_invalid = (counts_cutout == 0) & (background_cutout == 0) & (model == 0)
         return cls(
             counts=counts_cutout[~mask_invalid],
@@ -8,8 +8,10 @@ from gammapy.datasets.actors import DatasetsActor
 from gammapy.modeling import Fit
 from gammapy.modeling.selection import TestStatisticNested
 from gammapy.modeling.parameter import restore_parameters_status
+from gammapy.stats import cash, get_wstat_mu_bkg, wstat
 from gammapy.stats.utils import ts_to_sigma
-from gammapy.utils.roots import find_roots
+from gammapy.utils.interpolation import interpolation_scale
+from gammapy.utils.roots import find_roots, find_roots_bracketed
 from .core import Estimator
 
 log = logging.getLogger(__name__)
@@ -456,8 +458,58 @@ class ParameterSensitivityEstimator:
         ts_asimov = self.test.ts_asimov(datasets)
         return ts_to_sigma(ts_asimov, ts_asimov=ts_asimov) - self.n_sigma
 
+    def _get_asimov_statistic(self, datasets):
+        """Asimov statistic of the datasets if they are linear in the parameter.
+
+        Returns None if the predicted counts are not linear in the parameter
+        or the fit statistic is not supported.
+        """
+        return _LinearAsimovStatistic.from_datasets(
+            datasets, self.parameter, self.test.null_values[0]
+        )
+
+    def _parameter_matching_significance_batched(self, statistic):
+        """Parameter values matching the target significance for all groups at once.
+
+        The search ranges are sampled with 100 bins as in
+        `parameter_matching_significance` and the first sign change of each group
+        is refined with a vectorized bracketing root finder.
+        """
+
+        def fcn(value, idx):
+            ts_asimov = statistic.ts(value, idx)
+            return ts_to_sigma(ts_asimov, ts_asimov=ts_asimov) - self.n_sigma
+
+        scale = interpolation_scale(self.parameter.interp)
+        values = scale.inverse(
+            np.linspace(scale(statistic.lower_bound), scale(statistic.upper_bound), 101)
+        )
+        idx = np.arange(statistic.n_groups)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            signs = np.sign([fcn(value, idx) for value in values])
+            is_bracket = (signs[:-1] != signs[1:]) & (values[1:] > 0)
+            is_bracket &= np.isfinite(signs[:-1]) & np.isfinite(signs[1:])
+
+            idx_bracket = np.argmax(is_bracket, axis=0)
+            roots = find_roots_bracketed(
+                fcn,
+                values[idx_bracket, idx],
+                values[idx_bracket + 1, idx],
+                args=(idx,),
+                maxiter=self.max_niter,
+            )
+
+        roots[~np.any(is_bracket, axis=0) | (roots <= 0)] = np.nan
+        return roots
+
     def parameter_matching_significance(self, datasets):
         """Parameter value  matching the target significance"""
+        statistic = self._get_asimov_statistic(datasets)
+
+        if statistic is not None:
+            return self._parameter_matching_significance_batched(statistic)[0]
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
@@ -496,3 +548,215 @@ class ParameterSensitivityEstimator:
             value = self.parameter_matching_significance(datasets)
 
         return value - self.test.null_values[0]
+
+
+class _LinearAsimovStatistic:
+    """Asimov test statistic of datasets with predicted counts linear in a parameter.
+
+    The bins are stored in arrays of shape (n_groups, n_bins), where each group is
+    an independent set of datasets, for example one energy bin of a flux points
+    estimation. Groups are padded to the same number of bins. Only the bins whose
+    predicted counts depend on the parameter are kept, as the others do not
+    contribute to the test statistic.
+
+    Parameters
+    ----------
+    cash : dict of `~numpy.ndarray`
+        Bins of the datasets using the Cash statistic, with the "npred_null",
+        "npred_unit" and "valid" entries.
+    wstat : dict of `~numpy.ndarray`
+        Bins of the datasets using the WStat statistic, with the "npred_null",
+        "npred_unit", "counts", "counts_off", "alpha" and "valid" entries.
+    null_value : float
+        Parameter value for the null hypothesis.
+    lower_bound, upper_bound : `~numpy.ndarray`
+        Search range of the parameter value for each group.
+    """
+
+    _names = {
+        "cash": ["npred_null", "npred_unit"],
+        "wstat": ["npred_null", "npred_unit", "counts", "counts_off", "alpha"],
+    }
+
+    def __init__(self, cash, wstat, null_value, lower_bound, upper_bound):
+        self.cash = cash
+        self.wstat = wstat
+        self.null_value = null_value
+        self.lower_bound = np.atleast_1d(lower_bound)
+        self.upper_bound = np.atleast_1d(upper_bound)
+
+    @property
+    def n_groups(self):
+        """Number of groups."""
+        return len(self.lower_bound)
+
+    @staticmethod
+    def _npred(dataset):
+        if dataset.stat_type == "wstat":
+            return dataset.npred_signal().data
+        return dataset.npred().data
+
+    @classmethod
+    def from_datasets(cls, datasets, parameter, null_value, rtol=1e-6):
+        """Create from datasets, as a single group.
+
+        The predicted counts are evaluated at the null value, at the current
+        parameter value and at twice its difference to the null value. The
+        parameter value is modified and should be restored by the caller.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Datasets.
+        parameter : `~gammapy.modeling.Parameter`
+            Tested parameter.
+        null_value : float
+            Parameter value for the null hypothesis.
+        rtol : float, optional
+            Relative tolerance of the linearity check. Default is 1e-6.
+
+        Returns
+        -------
+        statistic : `_LinearAsimovStatistic` or None
+            Asimov statistic, None if the datasets do not use the Cash or WStat
+            statistics or if the predicted counts are not linear in the parameter.
+        """
+        if isinstance(datasets, DatasetsActor):
+            return None
+
+        for dataset in datasets:
+            if dataset.stat_type not in cls._names or dataset.mask is None:
+                return None
+            if dataset.stat_type == "wstat" and dataset.counts_off is None:
+                return None
+
+        lower_bound, upper_bound = parameter.conf_min, parameter.conf_max
+        step = parameter.value - null_value
+        if step == 0:
+            step = upper_bound - null_value
+
+        npreds = []
+        for value in [null_value, null_value + step, null_value + 2 * step]:
+            parameter.value = value
+            npreds.append([cls._npred(dataset) for dataset in datasets])
+
+        bins = {"cash": [], "wstat": []}
+
+        for dataset, npred_null, npred_1, npred_2 in zip(datasets, *npreds):
+            npred_unit = (npred_1 - npred_null) / step
+
+            if not np.allclose(
+                npred_2 - npred_null, 2 * step * npred_unit, rtol=rtol, equal_nan=True
+            ):
+                return None
+
+            mask = dataset.mask.data & (npred_unit != 0)
+            data = {"npred_null": npred_null, "npred_unit": npred_unit}
+
+            if dataset.stat_type == "wstat":
+                data["counts"] = dataset.counts.data
+                data["counts_off"] = dataset.counts_off.data
+                data["alpha"] = dataset.alpha.data
+
+            bins[dataset.stat_type].append(
+                {name: np.nan_to_num(value[mask]) for name, value in data.items()}
+            )
+
+        kwargs = {}
+
+        for stat_type, names in cls._names.items():
+            kwargs[stat_type] = {
+                name: np.concatenate(
+                    [np.zeros(0)] + [_[name] for _ in bins[stat_type]]
+                )[np.newaxis]
+                for name in names
+            }
+            kwargs[stat_type]["valid"] = np.ones(
+                kwargs[stat_type]["npred_null"].shape, dtype=bool
+            )
+
+        return cls(
+            null_value=null_value,
+            lower_bound=lower_bound,
+            upper_bound=upper_bound,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_stack(cls, statistics):
+        """Stack statistics as independent groups.
+
+        Parameters
+        ----------
+        statistics : list of `_LinearAsimovStatistic`
+            Statistics sharing the same null value.
+
+        Returns
+        -------
+        statistic : `_LinearAsimovStatistic`
+            Stacked statistic.
+        """
+        kwargs = {}
+
+        for stat_type, names in cls._names.items():
+            arrays = [getattr(_, stat_type) for _ in statistics]
+            n_bins = max(_["valid"].shape[1] for _ in arrays)
+            kwargs[stat_type] = {}
+
+            for name in names + ["valid"]:
+                kwargs[stat_type][name] = np.concatenate(
+                    [
+                        np.pad(_[name], ((0, 0), (0, n_bins - _[name].shape[1])))
+                        for _ in arrays
+                    ]
+                )
+
+        return cls(
+            null_value=statistics[0].null_value,
+            lower_bound=np.concatenate([_.lower_bound for _ in statistics]),
+            upper_bound=np.concatenate([_.upper_bound for _ in statistics]),
+            **kwargs,
+        )
+
+    def ts(self, value, idx):
+        """Asimov test statistic.
+
+        Parameters
+        ----------
+        value : `~numpy.ndarray`
+            Parameter values.
+        idx : `~numpy.ndarray`
+            Group indices, with the same shape as ``value``.
+
+        Returns
+        -------
+        ts : `~numpy.ndarray`
+            Test statistic of the Asimov datasets for the given parameter values.
+        """
+        delta = (np.asarray(value) - self.null_value)[:, np.newaxis]
+        ts = np.zeros(delta.shape[0])
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            data = {name: value[idx] for name, value in self.cash.items()}
+            npred = data["npred_null"] + delta * data["npred_unit"]
+            stat = cash(npred, data["npred_null"]) - cash(npred, npred)
+            ts += np.sum(stat, axis=1, where=data["valid"])
+
+            data = {name: value[idx] for name, value in self.wstat.items()}
+            npred_signal = data["npred_null"] + delta * data["npred_unit"]
+            npred_background = data["alpha"] * get_wstat_mu_bkg(
+                n_on=data["counts"],
+                n_off=data["counts_off"],
+                alpha=data["alpha"],
+                mu_sig=npred_signal,
+            )
+            counts = np.nan_to_num(npred_signal + np.nan_to_num(npred_background))
+
+            kwargs = {"n_on": counts, "n_off": data["counts_off"]}
+            kwargs["alpha"] = data["alpha"]
+            stat_null = wstat(mu_sig=data["npred_null"], **kwargs)
+            stat = wstat(mu_sig=npred_signal, **kwargs)
+            stat = np.nan_to_num(stat_null) - np.nan_to_num(stat)
+            ts += np.sum(stat, axis=1, where=data["valid"])
+
+        return ts
@@ -10,7 +10,9 @@ from gammapy.datasets.actors import DatasetsActor
 from gammapy.datasets.flux_points import _get_reference_model
 from gammapy.maps import MapAxis
 from gammapy.modeling import Fit
+from gammapy.modeling.parameter import restore_parameters_status
 from ..flux import FluxEstimator
+from ..parameter import ParameterSensitivityEstimator, _LinearAsimovStatistic
 from .core import FluxPoints
 
 log = logging.getLogger(__name__)
@@ -86,6 +88,8 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
     -----
     - For further explanation, see :ref:`estimators`.
     - In case of failure of upper limits computation (e.g. nan), see the User Guide :ref:`how_to`.
+    - When the predicted counts are linear in the norm, the sensitivity of all energy bins
+      is solved at once once all the bins are fitted.
     """
 
     tag = "FluxPointsEstimator"
@@ -154,6 +158,9 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
             task_name="Energy bins",
         )
 
+        if "sensitivity" in self.selection_optional:
+            self._estimate_sensitivity_batched(rows)
+
         table = Table(rows, meta=meta)
         model = _get_reference_model(datasets.models[self.source], self.energy_edges)
         return FluxPoints.from_table(
@@ -203,6 +210,58 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
             )
             return self._nan_result(datasets, model, energy_min, energy_max)
 
+    def estimate_sensitivity(self, datasets, parameter):
+        """Prepare the norm sensitivity estimation for the flux point.
+
+        If the predicted counts are linear in the norm, the Asimov statistic is
+        stored so that the sensitivity of all the flux points can be solved at once.
+        Otherwise the sensitivity is estimated directly.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Datasets.
+        parameter : `~gammapy.modeling.Parameter`
+            Norm parameter.
+
+        Returns
+        -------
+        result : dict
+            Dictionary with the norm sensitivity.
+        """
+        estimator = ParameterSensitivityEstimator(
+            parameter, self.null_value, n_sigma=self.n_sigma_sensitivity
+        )
+
+        with restore_parameters_status([parameter]):
+            statistic = estimator._get_asimov_statistic(datasets)
+
+        if statistic is None:
+            return super().estimate_sensitivity(datasets, parameter)
+
+        return {
+            f"{parameter.name}_sensitivity": np.nan,
+            "_asimov_statistic": statistic,
+        }
+
+    def _estimate_sensitivity_batched(self, rows):
+        """Solve the norm sensitivity of all the flux points at once."""
+        rows_batched = [row for row in rows if "_asimov_statistic" in row]
+
+        if not rows_batched:
+            return
+
+        statistic = _LinearAsimovStatistic.from_stack(
+            [row.pop("_asimov_statistic") for row in rows_batched]
+        )
+        estimator = ParameterSensitivityEstimator(
+            self.norm.copy(), self.null_value, n_sigma=self.n_sigma_sensitivity
+        )
+        values = estimator._parameter_matching_significance_batched(statistic)
+
+        for row, value in zip(rows_batched, values):
+            row["norm_sensitivity"] = value - self.null_value
+
     def _nan_result(self, datasets, model, energy_min, energy_max):
         """NaN result."""
         energy_axis = MapAxis.from_energy_edges([energy_min, energy_max])
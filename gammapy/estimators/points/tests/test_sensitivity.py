@@ -1,9 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 from numpy.testing import assert_allclose
+import astropy.units as u
 from gammapy.datasets import SpectrumDataset, SpectrumDatasetOnOff, Datasets
 from gammapy.estimators import (
     FluxPoints,
+    FluxPointsEstimator,
     SensitivityEstimator,
     ParameterSensitivityEstimator,
 )
@@ -115,3 +117,34 @@ def test_parameter_sensitivity_estimator(spectrum_dataset):
     assert_allclose(value, 4.67553e-12, rtol=1e-2)
 
     assert_allclose(spectral_model.amplitude.value, default_value, rtol=1e-2)
+
+
+def test_flux_points_sensitivity_batched(spectrum_dataset, monkeypatch):
+    spectrum_dataset.models = SkyModel(
+        spectral_model=PowerLawSpectralModel(), name="source"
+    )
+    spectrum_dataset.fake(random_state=0)
+
+    dataset_on_off = SpectrumDatasetOnOff.from_spectrum_dataset(
+        dataset=spectrum_dataset, acceptance=1, acceptance_off=5
+    )
+    dataset_on_off.fake(
+        npred_background=spectrum_dataset.npred_background(), random_state=1
+    )
+    datasets = Datasets([spectrum_dataset, dataset_on_off.copy(name="on-off")])
+
+    estimator = FluxPointsEstimator(
+        energy_edges=[1, 2, 5, 10] * u.TeV,
+        source="source",
+        selection_optional=["sensitivity"],
+    )
+    actual = estimator.run(datasets).norm_sensitivity.data.squeeze()
+
+    # compare with the root finding on the full datasets evaluation
+    monkeypatch.setattr(
+        ParameterSensitivityEstimator, "_get_asimov_statistic", lambda *args: None
+    )
+    desired = estimator.run(datasets).norm_sensitivity.data.squeeze()
+
+    assert_allclose(actual, desired, rtol=1e-4)
+    assert_allclose(actual, [477.075121, 23.517103, 2.875392], rtol=1e-3)
@@ -284,7 +284,10 @@ def estimate_exposure_reco_energy(dataset, spectral_model=None, normalize=True):
         ref_flux = spectral_model.integral(
             energy_axis.edges[:-1], energy_axis.edges[1:]
         )
-        reco_exposure = reco_exposure / ref_flux[:, np.newaxis, np.newaxis]
+        ref_flux = ref_flux.reshape(
+            (-1,) + (1,) * len(reco_exposure.geom.data_shape[1:])
+        )
+        reco_exposure = reco_exposure / ref_flux
 
     return reco_exposure
 
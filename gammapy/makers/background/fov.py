@@ -3,9 +3,14 @@
 
 import logging
 import numpy as np
+import gammapy.utils.parallel as parallel
 from gammapy.maps import Map, RegionGeom
 from gammapy.modeling import Fit
-from gammapy.modeling.models import FoVBackgroundModel, Model
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    Model,
+    PowerLawNormSpectralModel,
+)
 from ..core import Maker
 
 __all__ = ["FoVBackgroundMaker"]
@@ -13,7 +18,136 @@ __all__ = ["FoVBackgroundMaker"]
 log = logging.getLogger(__name__)
 
 
-class FoVBackgroundMaker(Maker):
+def _fit_norm_tilt(
+    counts,
+    signal,
+    background,
+    log_energy,
+    index,
+    values,
+    free,
+    max_iterations=100,
+    tolerance=1e-8,
+):
+    """Fit norm and tilt of power law norm background models with Newton steps.
+
+    The Cash statistic of all datasets is minimised simultaneously. The data
+    of all datasets are concatenated and labelled by ``index``.
+
+    Parameters
+    ----------
+    counts, signal, background, log_energy : `~numpy.ndarray`
+        Counts, predicted signal counts, background counts for norm=1 and tilt=0,
+        and log of the energy over the reference energy of each data point.
+    index : `~numpy.ndarray`
+        Dataset index of each data point.
+    values : `~numpy.ndarray`
+        Initial values of norm and tilt, with shape (n_datasets, 2).
+    free : `~numpy.ndarray`
+        Whether norm and tilt are free, with shape (n_datasets, 2).
+    max_iterations : int, optional
+        Maximum number of Newton iterations. Default is 100.
+    tolerance : float, optional
+        Relative tolerance on the parameter steps. Default is 1e-8.
+
+    Returns
+    -------
+    values, errors : `~numpy.ndarray`
+        Best fit values and errors of norm and tilt, with shape (n_datasets, 2).
+    success : `~numpy.ndarray`
+        Whether the minimisation converged for each dataset.
+    """
+    n_datasets = len(values)
+    fixed = ~free
+
+    def bincount(weights):
+        return np.bincount(index, weights=weights, minlength=n_datasets)
+
+    def stat_sum(values):
+        norm, tilt = values[index].T
+        npred = signal + norm * background * np.exp(-tilt * log_energy)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stat = bincount(npred - counts * np.log(npred))
+
+        return np.where(np.isfinite(stat), stat, np.inf)
+
+    def gradient_hessian(values):
+        norm, tilt = values[index].T
+        model = background * np.exp(-tilt * log_energy)
+        d_norm, d_tilt = model, -norm * model * log_energy
+
+        weight = counts / (signal + norm * model) ** 2
+        residual = 1 - counts / (signal + norm * model)
+
+        gradient = np.stack(
+            [bincount(residual * d_norm), bincount(residual * d_tilt)], axis=-1
+        )
+
+        hessian = np.empty((n_datasets, 2, 2))
+        hessian[:, 0, 0] = bincount(weight * d_norm**2)
+        hessian[:, 1, 1] = bincount(weight * d_tilt**2 - residual * d_tilt * log_energy)
+        hessian[:, 0, 1] = bincount(
+            weight * d_norm * d_tilt - residual * model * log_energy
+        )
+        hessian[:, 1, 0] = hessian[:, 0, 1]
+
+        # fixed parameters are decoupled and not updated
+        gradient[fixed] = 0
+        hessian[fixed[:, :, np.newaxis] | fixed[:, np.newaxis, :]] = 0
+        hessian[:, [0, 1], [0, 1]] += fixed
+        return gradient, hessian
+
+    def inverse(hessian):
+        a, b, d = hessian[:, 0, 0], hessian[:, 0, 1], hessian[:, 1, 1]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse = np.array([[d, -b], [-b, a]]) / (a * d - b**2)
+
+        return np.moveaxis(inverse, -1, 0)
+
+    values = values.copy()
+    stat = stat_sum(values)
+    converged = np.zeros(n_datasets, dtype=bool)
+
+    for _ in range(max_iterations):
+        gradient, hessian = gradient_hessian(values)
+
+        step = -np.einsum("nij,nj->ni", inverse(hessian), gradient)
+
+        active = ~converged & np.all(np.isfinite(step), axis=1)
+
+        # halve the step until the statistic decreases
+        for _ in range(30):
+            values_new = values + step * active[:, np.newaxis]
+            stat_new = stat_sum(values_new)
+            rejected = active & ~(stat_new <= stat)
+
+            if not rejected.any():
+                break
+
+            step[rejected] /= 2
+
+        active &= ~rejected
+        values[active] = values_new[active]
+        stat[active] = stat_new[active]
+
+        size = np.abs(step) / (1 + np.abs(values))
+        converged |= active & np.all(size < tolerance, axis=1)
+
+        if converged.all():
+            break
+
+    _, hessian = gradient_hessian(values)
+    variance = np.diagonal(inverse(hessian), axis1=1, axis2=2)
+
+    with np.errstate(invalid="ignore"):
+        errors = np.sqrt(variance) * free
+    success = converged & np.all(np.isfinite(errors), axis=1)
+    return values, errors, success
+
+
+class FoVBackgroundMaker(Maker, parallel.ParallelMixin):
     """Normalize template background on the whole field-of-view.
 
     The dataset background model can be simply scaled (method="scale") or fitted
@@ -47,6 +181,14 @@ class FoVBackgroundMaker(Maker):
     min_npred_background : float, optional
         Minimum number of predicted background counts required outside the
         exclusion region. Default is 0.
+    fit : `Fit`, optional
+        Fit instance used for method="fit". Default is None.
+    n_jobs : int, optional
+        Number of processes used in parallel by `run_datasets`. If None, defaults
+        to `~gammapy.utils.parallel.N_JOBS_DEFAULT`. Default is None.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing. If None, defaults to
+        `~gammapy.utils.parallel.BACKEND_DEFAULT`. Default is None.
     """
 
     tag = "FoVBackgroundMaker"
@@ -61,6 +203,8 @@ class FoVBackgroundMaker(Maker):
         min_counts=0,
         min_npred_background=0,
         fit=None,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         self.method = method
         self.exclusion_mask = exclusion_mask
@@ -83,6 +227,8 @@ class FoVBackgroundMaker(Maker):
             fit = Fit()
 
         self.fit = fit
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
     @property
     def method(self):
@@ -201,14 +347,10 @@ class FoVBackgroundMaker(Maker):
         else:
             return True
 
-    def run(self, dataset, observation=None):
-        """Run FoV background maker.
-
-        Parameters
-        ----------
-        dataset : `~gammapy.datasets.MapDataset`
-            Input map dataset.
+    def _prepare_dataset(self, dataset):
+        """Apply the exclusion mask and add the default background model if needed.
 
+        Returns the initial fit mask, to be restored after the normalisation.
         """
         if isinstance(dataset.counts.geom, RegionGeom):
             raise TypeError(
@@ -222,7 +364,20 @@ class FoVBackgroundMaker(Maker):
             dataset.mask_fit = self.make_exclusion_mask(dataset)
 
         if dataset.background_model is None:
-            dataset = self.make_default_fov_background_model(dataset)
+            self.make_default_fov_background_model(dataset)
+
+        return mask_fit
+
+    def run(self, dataset, observation=None):
+        """Run FoV background maker.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset`
+            Input map dataset.
+
+        """
+        mask_fit = self._prepare_dataset(dataset)
 
         if self._verify_requirements(dataset) is True:
             if self.method == "fit":
@@ -287,3 +442,161 @@ class FoVBackgroundMaker(Maker):
         dataset.models[f"{dataset.name}-bkg"].spectral_model.norm.error = error
 
         return dataset
+
+    def run_datasets(self, datasets):
+        """Run FoV background maker on a collection of datasets.
+
+        The datasets are split in ``n_jobs`` batches processed in parallel. With
+        method="fit", the background models for which only the ``norm`` and
+        ``tilt`` of a `~gammapy.modeling.models.PowerLawNormSpectralModel` are
+        free are fitted jointly with a vectorised Newton minimisation of the Cash
+        statistic. Other datasets are fitted with `fit`.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets` or list of `~gammapy.datasets.MapDataset`
+            Input map datasets.
+
+        Returns
+        -------
+        datasets : `~gammapy.datasets.Datasets`
+            Datasets with normalised background models. When running in parallel,
+            these are copies of the input datasets.
+        """
+        from gammapy.datasets import Datasets
+
+        datasets = list(datasets)
+        n_jobs = min(self.n_jobs, len(datasets))
+
+        if n_jobs > 1:
+            batches = np.array_split(np.arange(len(datasets)), n_jobs)
+            results = parallel.run_multiprocessing(
+                self._run_batch,
+                zip([[datasets[idx] for idx in batch] for batch in batches]),
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=n_jobs),
+                task_name="Datasets",
+            )
+            datasets = [dataset for result in results for dataset in result]
+        else:
+            datasets = self._run_batch(datasets)
+
+        return Datasets(datasets)
+
+    def _run_batch(self, datasets):
+        """Run FoV background maker on a list of datasets in the current process."""
+        mask_fits = [self._prepare_dataset(dataset) for dataset in datasets]
+        valid = [self._verify_requirements(dataset) is True for dataset in datasets]
+        selected = [dataset for dataset, ok in zip(datasets, valid) if ok]
+
+        if self.method == "fit":
+            self._make_background_fit_batch(selected)
+        else:
+            for dataset in selected:
+                self.make_background_scale(dataset)
+
+        for dataset, mask_fit, ok in zip(datasets, mask_fits, valid):
+            if not ok:
+                dataset.mask_safe.data[...] = False
+            dataset.mask_fit = mask_fit
+
+        return datasets
+
+    @staticmethod
+    def _is_norm_tilt_model(dataset):
+        """Whether only norm and tilt of a power law norm background model are free."""
+        if dataset.stat_type != "cash":
+            return False
+
+        model = dataset.background_model
+        spectral_model = model.spectral_model
+
+        if not isinstance(spectral_model, PowerLawNormSpectralModel):
+            return False
+
+        if model.spatial_model is not None:
+            if len(model.spatial_model.parameters.free_parameters) > 0:
+                return False
+
+        parameters = spectral_model.parameters.free_parameters
+
+        if len(parameters) == 0 or spectral_model.norm.value == 0:
+            return False
+
+        for par in parameters:
+            if par.name not in ["norm", "tilt"] or par.prior is not None:
+                return False
+
+            if np.isfinite(par.min) or np.isfinite(par.max):
+                return False
+
+        return True
+
+    def _make_background_fit_batch(self, datasets):
+        """Fit the FoV background models of a list of datasets.
+
+        The datasets with only the norm and tilt free are fitted jointly,
+        the others, as well as the ones for which the minimisation did
+        not converge, are fitted with `make_background_fit`.
+        """
+        selected = [_ for _ in datasets if self._is_norm_tilt_model(_)]
+        others = [_ for _ in datasets if not self._is_norm_tilt_model(_)]
+
+        data = {
+            "counts": [],
+            "signal": [],
+            "background": [],
+            "log_energy": [],
+            "index": [],
+        }
+        values, free = [], []
+
+        for idx, dataset in enumerate(selected):
+            spectral_model = dataset.background_model.spectral_model
+            norm, tilt = spectral_model.norm.value, spectral_model.tilt.value
+
+            energy = dataset._geom.axes["energy"].center
+            log_energy = np.log(
+                (energy / spectral_model.reference.quantity).to_value("")
+            )
+            log_energy = log_energy.reshape((-1, 1, 1))
+
+            # background for norm=1 and tilt=0
+            background = dataset.npred_background().data * np.exp(tilt * log_energy)
+            background /= norm
+
+            mask = dataset.mask.data & (background > 0)
+            log_energy = np.broadcast_to(log_energy, background.shape)
+
+            data["counts"].append(dataset.counts.data[mask])
+            data["signal"].append(dataset.npred_signal().data[mask])
+            data["background"].append(background[mask])
+            data["log_energy"].append(log_energy[mask])
+            data["index"].append(np.full(mask.sum(), idx))
+
+            values.append([norm, tilt])
+            free.append(
+                [not spectral_model.norm.frozen, not spectral_model.tilt.frozen]
+            )
+
+        if selected:
+            data = {key: np.concatenate(value) for key, value in data.items()}
+            values, errors, success = _fit_norm_tilt(
+                values=np.array(values), free=np.array(free), **data
+            )
+
+            for dataset, value, error, ok in zip(selected, values, errors, success):
+                if not ok:
+                    others.append(dataset)
+                    continue
+
+                spectral_model = dataset.background_model.spectral_model
+                for par, par_value, par_error in zip(
+                    [spectral_model.norm, spectral_model.tilt], value, error
+                ):
+                    par.value = par_value
+                    if not par.frozen:
+                        par.error = par_error
+
+        for dataset in others:
+            self.make_background_fit(dataset)
@@ -2,7 +2,6 @@
 from copy import deepcopy
 import numpy as np
 from regions import PointSkyRegion
-from gammapy.data import EventList
 from gammapy.datasets import MapDatasetOnOff, SpectrumDataset
 from gammapy.makers.utils import make_counts_rad_max
 from gammapy.maps import Map
@@ -41,14 +40,16 @@ class PhaseBackgroundMaker(Maker):
 
     @staticmethod
     def _make_counts(dataset, observation, phases, phase_column_name):
-        event_lists = []
-        for interval in phases:
-            events = observation.events.select_parameter(
-                parameter=phase_column_name, values=interval, is_range=True
-            )
-            event_lists.append(events)
-
-        events = EventList.from_stack(event_lists)
+        events = observation.events
+        phase = np.asarray(events._get_column(phase_column_name))
+
+        # select row indices per interval, events in overlapping intervals
+        # are counted once per interval
+        idx = [
+            np.flatnonzero((interval[0] <= phase) & (phase < interval[1]))
+            for interval in phases
+        ]
+        events = events.select_row_subset(np.concatenate(idx))
         geom = dataset.counts.geom
         if geom.is_region and isinstance(geom.region, PointSkyRegion):
             counts = make_counts_rad_max(geom, observation.rad_max, events)
@@ -1,12 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import hashlib
 import html
 import logging
 from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
 from itertools import combinations
 import numpy as np
 from astropy import units as u
-from astropy.coordinates import Angle
-from regions import CircleSkyRegion, PixCoord, PointSkyRegion
+from astropy.coordinates import Angle, SkyCoord
+from regions import CircleSkyRegion, PixCoord, PointSkyRegion, SkyRegion
 from gammapy.datasets import SpectrumDatasetOnOff
 from gammapy.maps import RegionGeom, RegionNDMap, WcsGeom, WcsNDMap
 from ..core import Maker
@@ -42,6 +44,23 @@ def are_regions_overlapping_rad_max(regions, rad_max, offset, e_min, e_max):
     return np.any(separations[np.newaxis, :] < (2 * rad_max_at_offset))
 
 
+def _to_key(value):
+    """Convert a region, sky coordinate or quantity to a hashable key."""
+    if isinstance(value, SkyRegion):
+        params = tuple(_to_key(getattr(value, name)) for name in value._params)
+        return (value.__class__.__name__,) + params
+    elif isinstance(value, SkyCoord):
+        spherical = value.spherical
+        return (
+            value.frame.name,
+            tuple(np.ravel(spherical.lon.deg)),
+            tuple(np.ravel(spherical.lat.deg)),
+        )
+    elif isinstance(value, u.Quantity):
+        return str(value.unit), tuple(np.ravel(value.value))
+    return value
+
+
 def is_rad_max_compatible_region_geom(rad_max, geom, rtol=1e-3):
     """Check if input RegionGeom is compatible with rad_max for point-like analysis.
 
@@ -312,6 +331,9 @@ class ReflectedRegionsFinder(RegionsFinder):
     radius: 1438.3... arcsec
     """
 
+    _cache_size = 32
+    _max_batch_size = 1_000_000
+
     def __init__(
         self,
         angle_increment="0.1 rad",
@@ -331,6 +353,7 @@ class ReflectedRegionsFinder(RegionsFinder):
 
         self.max_region_number = max_region_number
         self.binsz = Angle(binsz)
+        self._cache = OrderedDict()
 
     @staticmethod
     def _region_angular_size(region, reference_geom, center_pix):
@@ -395,7 +418,12 @@ class ReflectedRegionsFinder(RegionsFinder):
                 "ReflectedRegionsFinder does not work with PointSkyRegion. Use WobbleRegionsFinder instead."
             )
 
-        regions = []
+        key = self._cache_key(region, center, exclusion_mask)
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            regions, wcs = self._cache[key]
+            return list(regions), wcs
 
         reference_geom = self._create_reference_geometry(region, center)
         center_pixel = self._get_center_pixel(center, reference_geom)
@@ -409,22 +437,118 @@ class ReflectedRegionsFinder(RegionsFinder):
             center_pix=center_pixel,
         )
 
-        angle = angle_min + self.min_distance_input
-        while angle < angle_max:
+        angles = self._find_angles(
+            region_pix=region_pix,
+            center_pixel=center_pixel,
+            excluded_pixels=excluded_pixels,
+            angle_min=angle_min,
+            angle_max=angle_max,
+        )
+
+        regions = []
+        for angle in angles:
             region_test = region_pix.rotate(center_pixel, angle)
+            regions.append(region_test.to_sky(reference_geom.wcs))
 
-            if not np.any(region_test.contains(excluded_pixels)):
-                region = region_test.to_sky(reference_geom.wcs)
-                regions.append(region)
+        self._cache[key] = (regions, reference_geom.wcs)
 
-                if len(regions) >= self.max_region_number:
-                    break
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return list(regions), reference_geom.wcs
+
+    def _find_angles(
+        self, region_pix, center_pixel, excluded_pixels, angle_min, angle_max
+    ):
+        """Rotation angles of the reflected regions.
+
+        Instead of rotating the region for every candidate angle, the excluded
+        pixels are rotated backwards for a whole batch of candidate angles and
+        tested against the unrotated region at once. Only excluded pixels
+        within the annulus swept by the region are considered.
+        """
+        angle_min = angle_min.to_value("rad")
+        angle_max = angle_max.to_value("rad")
+        angle_increment = self.angle_increment.to_value("rad")
+
+        dx = excluded_pixels.x - center_pixel.x
+        dy = excluded_pixels.y - center_pixel.y
 
-                angle += angle_min
+        bbox = region_pix.bounding_box
+        x_edges = np.array([bbox.ixmin, bbox.ixmax]) - 0.5 - center_pixel.x
+        y_edges = np.array([bbox.iymin, bbox.iymax]) - 0.5 - center_pixel.y
+
+        x_min = 0 if x_edges[0] <= 0 <= x_edges[1] else np.min(np.abs(x_edges))
+        y_min = 0 if y_edges[0] <= 0 <= y_edges[1] else np.min(np.abs(y_edges))
+        r_min = np.hypot(x_min, y_min) - 1
+        r_max = np.hypot(np.max(np.abs(x_edges)), np.max(np.abs(y_edges))) + 1
+
+        r = np.hypot(dx, dy)
+        selection = (r >= r_min) & (r <= r_max)
+        dx, dy = dx[selection], dy[selection]
+
+        # limit the size of the (angle, pixel) arrays
+        n_batch = int(np.clip(self._max_batch_size // max(dx.size, 1), 1, 1000))
+
+        angles = []
+        angle = angle_min + self.min_distance_input.to_value("rad")
+
+        while angle < angle_max:
+            # cumulative sum to reproduce the sequential increments exactly
+            steps = np.full(n_batch, angle_increment)
+            steps[0] = angle
+            candidates = np.cumsum(steps)
+            candidates = candidates[candidates < angle_max]
+
+            if dx.size:
+                cosa = np.cos(candidates)[:, np.newaxis]
+                sina = np.sin(candidates)[:, np.newaxis]
+                pixels = PixCoord(
+                    x=(center_pixel.x + cosa * dx + sina * dy).ravel(),
+                    y=(center_pixel.y - sina * dx + cosa * dy).ravel(),
+                )
+                overlap = region_pix.contains(pixels).reshape(candidates.size, -1)
+                is_free = ~np.any(overlap, axis=1)
             else:
-                angle += self.angle_increment
+                is_free = np.ones(candidates.size, dtype=bool)
+
+            if not np.any(is_free):
+                if candidates.size < n_batch:
+                    break
+                angle = candidates[-1] + angle_increment
+                continue
+
+            angle = candidates[np.argmax(is_free)]
+            angles.append(Angle(angle, "rad"))
+
+            if len(angles) >= self.max_region_number:
+                break
+
+            angle += angle_min
+
+        return angles
+
+    def _cache_key(self, region, center, exclusion_mask):
+        """Hashable key for the region finding configuration."""
+        params = (
+            self.angle_increment.rad,
+            self.min_distance.rad,
+            self.min_distance_input.rad,
+            self.max_region_number,
+            self.binsz.deg,
+        )
+
+        if exclusion_mask is None:
+            mask_key = None
+        else:
+            data = np.ascontiguousarray(exclusion_mask.data)
+            mask_key = (
+                hashlib.sha1(data.view(np.uint8)).hexdigest(),
+                data.shape,
+                exclusion_mask.geom.wcs.to_header_string(),
+            )
 
-        return regions, reference_geom.wcs
+        return params, _to_key(center), _to_key(region), mask_key
 
 
 class ReflectedRegionsBackgroundMaker(Maker):
@@ -5,7 +5,7 @@ import numpy as np
 from astropy.convolution import Ring2DKernel, Tophat2DKernel
 from astropy.coordinates import Angle
 from gammapy.maps import Map
-from gammapy.utils.array import scale_cube
+from gammapy.utils.array import _convolve_scales, _kernels_fft, scale_cube
 from ..core import Maker
 
 __all__ = ["AdaptiveRingBackgroundMaker", "RingBackgroundMaker"]
@@ -146,6 +146,56 @@ class AdaptiveRingBackgroundMaker(Maker):
 
         return acceptance, acceptance_off, counts_off
 
+    def _reduce_images(
+        self, counts_off, acceptance_off, acceptance, kernels, kernels_fft
+    ):
+        """Compute off and off acceptance image for a single energy bin.
+
+        The images are convolved with increasing ring sizes one at a time and
+        the value with the first approximate alpha < threshold is taken, so
+        that the per-kernel cubes are never allocated. The loop stops as soon
+        as all pixels are set.
+        """
+        shape = acceptance.shape
+        counts_off_image = np.tile(np.nan, shape)
+        acceptance_off_image = np.tile(np.nan, shape)
+        acceptance_image = np.tile(np.nan, shape)
+
+        images = zip(
+            _convolve_scales(counts_off, kernels, kernels_fft),
+            _convolve_scales(acceptance_off, kernels, kernels_fft),
+        )
+
+        for counts_off_kernel, acceptance_off_kernel in images:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                alpha_approx = np.where(
+                    acceptance_off_kernel > 0,
+                    acceptance / acceptance_off_kernel,
+                    np.inf,
+                )
+
+            mask = (alpha_approx <= self.threshold_alpha) & np.isnan(counts_off_image)
+            counts_off_image[mask] = counts_off_kernel[mask]
+            acceptance_off_image[mask] = acceptance_off_kernel[mask]
+            acceptance_image[mask] = acceptance[mask]
+
+            if not np.isnan(counts_off_image).any():
+                break
+
+        return acceptance_image, acceptance_off_image, counts_off_image
+
+    def _make_exclusion(self, geom):
+        if self.exclusion_mask:
+            return self.exclusion_mask.interp_to_geom(geom=geom)
+        return Map.from_geom(geom=geom, data=True, dtype=bool)
+
+    def _make_acceptance(self, background):
+        scale = background.geom.pixel_scales[0].to("deg")
+        theta = self.theta * scale
+        tophat = Tophat2DKernel(theta.value)
+        tophat.normalize("peak")
+        return background.convolve(tophat.array)
+
     def make_cubes(self, dataset):
         """Make acceptance, off acceptance, off counts cubes.
 
@@ -163,10 +213,7 @@ class AdaptiveRingBackgroundMaker(Maker):
         background = dataset.npred_background()
         kernels = self.kernels(counts)
 
-        if self.exclusion_mask:
-            exclusion = self.exclusion_mask.interp_to_geom(geom=counts.geom)
-        else:
-            exclusion = Map.from_geom(geom=counts.geom, data=True, dtype=bool)
+        exclusion = self._make_exclusion(counts.geom)
 
         cubes = {}
         cubes["counts_off"] = scale_cube(
@@ -176,11 +223,7 @@ class AdaptiveRingBackgroundMaker(Maker):
             (background.data * exclusion.data)[0, Ellipsis], kernels
         )
 
-        scale = background.geom.pixel_scales[0].to("deg")
-        theta = self.theta * scale
-        tophat = Tophat2DKernel(theta.value)
-        tophat.normalize("peak")
-        acceptance = background.convolve(tophat.array)
+        acceptance = self._make_acceptance(background)
         acceptance_data = acceptance.data[0, Ellipsis]
         cubes["acceptance"] = np.repeat(
             acceptance_data[Ellipsis, np.newaxis], len(kernels), axis=2
@@ -203,8 +246,34 @@ class AdaptiveRingBackgroundMaker(Maker):
         """
         from gammapy.datasets import MapDatasetOnOff
 
-        cubes = self.make_cubes(dataset)
-        acceptance, acceptance_off, counts_off = self._reduce_cubes(cubes, dataset)
+        counts = dataset.counts
+        background = dataset.npred_background()
+        kernels = self.kernels(counts)
+        exclusion = self._make_exclusion(counts.geom)
+
+        counts_off_data = counts.data * exclusion.data
+        acceptance_off_data = background.data * exclusion.data
+        acceptance_data = self._make_acceptance(background).data
+
+        # the kernel spectra are shared by all energy bins
+        kernels_fft = _kernels_fft(kernels, counts.data.shape[-2:])
+
+        data = np.full((3,) + counts.data.shape, np.nan)
+
+        for idx in np.ndindex(counts.data.shape[:-2]):
+            images = self._reduce_images(
+                counts_off=counts_off_data[idx],
+                acceptance_off=acceptance_off_data[idx],
+                acceptance=acceptance_data[idx],
+                kernels=kernels,
+                kernels_fft=kernels_fft,
+            )
+            for array, image in zip(data, images):
+                array[idx] = image
+
+        acceptance, acceptance_off, counts_off = [
+            counts.copy(data=array) for array in data
+        ]
 
         mask_safe = dataset.mask_safe.copy()
         not_has_off_acceptance = acceptance_off.data <= 0
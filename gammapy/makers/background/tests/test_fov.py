@@ -360,3 +360,63 @@ def test_fov_backgr_maker_spatial_model(obs_dataset, exclusion_mask):
     assert not bkg_model_spec2.norm.frozen
     assert_allclose(bkg_model_spec.norm.value, 0.830779, rtol=1e-4)
     assert_allclose(bkg_model_spec2.norm.value, 0.830779, rtol=1e-4)
+
+
+def _make_fov_test_dataset(name, seed, tilt_frozen=True):
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(
+        skydir=SkyCoord(83.633, 22.014, unit="deg"),
+        binsz=0.1,
+        width=(3, 3),
+        axes=[energy_axis],
+    )
+    dataset = MapDataset.create(geom, name=name)
+
+    random_state = np.random.RandomState(seed)
+    background = random_state.uniform(0.5, 1.5, geom.data_shape)
+    dataset.background.data = background * np.array([4, 2, 1])[:, None, None]
+    dataset.counts.data = random_state.poisson(1.2 * dataset.background.data)
+    dataset.mask_safe.data[...] = True
+
+    model = FoVBackgroundModel(dataset_name=name)
+    model.spectral_model.tilt.frozen = tilt_frozen
+    dataset.models = [model]
+    return dataset
+
+
+@pytest.mark.parametrize("tilt_frozen", [True, False])
+def test_fov_bkg_maker_run_datasets_fit(tilt_frozen):
+    fov_bkg_maker = FoVBackgroundMaker(method="fit", n_jobs=1)
+
+    datasets = [
+        _make_fov_test_dataset(f"test-{idx}", idx, tilt_frozen) for idx in range(3)
+    ]
+    result = fov_bkg_maker.run_datasets(datasets)
+
+    assert result.names == ["test-0", "test-1", "test-2"]
+
+    for idx, dataset in enumerate(result):
+        expected = fov_bkg_maker.run(
+            _make_fov_test_dataset(f"test-{idx}", idx, tilt_frozen)
+        )
+        model = dataset.background_model.spectral_model
+        model_expected = expected.background_model.spectral_model
+
+        assert_allclose(model.norm.value, model_expected.norm.value, rtol=1e-4)
+        assert_allclose(model.norm.error, model_expected.norm.error, rtol=1e-2)
+        assert_allclose(model.tilt.value, model_expected.tilt.value, atol=1e-4)
+        assert dataset.mask_fit is None
+
+
+def test_fov_bkg_maker_run_datasets_scale():
+    fov_bkg_maker = FoVBackgroundMaker(method="scale", n_jobs=2)
+
+    datasets = [_make_fov_test_dataset(f"test-{idx}", idx) for idx in range(3)]
+    result = fov_bkg_maker.run_datasets(datasets)
+
+    for idx, dataset in enumerate(result):
+        expected = fov_bkg_maker.run(_make_fov_test_dataset(f"test-{idx}", idx))
+        assert_allclose(
+            dataset.background_model.spectral_model.norm.value,
+            expected.background_model.spectral_model.norm.value,
+        )
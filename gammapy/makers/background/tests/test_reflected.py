@@ -167,6 +167,40 @@ def test_bad_on_region(exclusion_mask, on_region):
     assert len(regions) == 0
 
 
+def test_reflected_regions_finder_cache(exclusion_mask, on_region):
+    pointing = SkyCoord(83.2, 22.5, unit="deg")
+    finder = ReflectedRegionsFinder(min_distance_input="0 deg")
+
+    regions, wcs = finder.run(
+        center=pointing, region=on_region, exclusion_mask=exclusion_mask
+    )
+    assert len(regions) == 15
+    assert len(finder._cache) == 1
+
+    regions_cached, wcs_cached = finder.run(
+        center=SkyCoord(83.2, 22.5, unit="deg"),
+        region=CircleSkyRegion(on_region.center, on_region.radius),
+        exclusion_mask=exclusion_mask.copy(),
+    )
+    assert len(finder._cache) == 1
+    assert wcs_cached is wcs
+    assert regions_cached == regions
+    assert regions_cached is not regions
+
+    finder.max_region_number = 5
+    regions, _ = finder.run(
+        center=pointing, region=on_region, exclusion_mask=exclusion_mask
+    )
+    assert len(regions) == 5
+    assert len(finder._cache) == 2
+
+    mask = exclusion_mask.copy()
+    mask.data[...] = True
+    regions, _ = finder.run(center=pointing, region=on_region, exclusion_mask=mask)
+    assert len(regions) == 5
+    assert len(finder._cache) == 3
+
+
 @requires_data()
 def test_reflected_bkg_maker(on_region, reflected_bkg_maker, observations):
     datasets = []
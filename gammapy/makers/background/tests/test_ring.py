@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 from astropy.coordinates import Angle, SkyCoord
 from regions import CircleSkyRegion
@@ -147,3 +148,39 @@ def test_adaptive_ring_bkg_maker(pars, geom, observations, exclusion_mask):
     assert_allclose(
         dataset_on_off.exposure.data[0][100][100], pars["exposure"], rtol=1e-5
     )
+
+
+@pytest.mark.parametrize("method", ["fixed_width", "fixed_r_in"])
+def test_adaptive_ring_bkg_maker_energy_bins(method):
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    pos = SkyCoord(83.633, 22.014, unit="deg")
+    geom = WcsGeom.create(skydir=pos, binsz=0.04, width=(4, 4), axes=[energy_axis])
+
+    dataset = MapDataset.create(geom)
+    random_state = np.random.RandomState(0)
+    dataset.background.data = random_state.uniform(0.5, 1.5, geom.data_shape)
+    dataset.counts.data = random_state.poisson(dataset.background.data)
+    dataset.mask_safe.data[...] = True
+
+    exclusion_mask = ~geom.to_image().region_mask(
+        [CircleSkyRegion(pos, Angle(0.5, "deg"))]
+    )
+    adaptive_ring_bkg_maker = AdaptiveRingBackgroundMaker(
+        r_in="0.2 deg",
+        width="0.3 deg",
+        r_out_max="2 deg",
+        stepsize="0.2 deg",
+        exclusion_mask=exclusion_mask,
+        method=method,
+    )
+    dataset_on_off = adaptive_ring_bkg_maker.run(dataset)
+
+    for idx in range(energy_axis.nbin):
+        dataset_slice = dataset.slice_by_idx({"energy": slice(idx, idx + 1)})
+        cubes = adaptive_ring_bkg_maker.make_cubes(dataset_slice)
+        acceptance, acceptance_off, counts_off = adaptive_ring_bkg_maker._reduce_cubes(
+            cubes, dataset_slice
+        )
+        assert_allclose(dataset_on_off.counts_off.data[idx], counts_off.data[0])
+        assert_allclose(dataset_on_off.acceptance_off.data[idx], acceptance_off.data[0])
+        assert_allclose(dataset_on_off.acceptance.data[idx], acceptance.data[0])
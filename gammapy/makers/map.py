@@ -1,11 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+from collections import OrderedDict
+from copy import deepcopy
 import astropy.units as u
+from astropy.coordinates import Angle
 from astropy.table import Table
 import numpy as np
 from regions import PointSkyRegion
 from gammapy.datasets import MapDatasetMetaData
-from gammapy.irf import EDispKernelMap, PSFMap
+from gammapy.irf import EDispKernelMap, FoVAlignment, PSFMap
 from gammapy.data import Observation
 from gammapy.maps import Map
 from .core import Maker
@@ -45,6 +48,16 @@ class MapDatasetMaker(Maker):
         Maximum error on the rotation angle between AltAz and RaDec frames during background evaluation.
         Used only when the Background IRF has an AltAz alignement.
         Default is 1.0 deg.
+    cache_size : `~astropy.units.Quantity`, optional
+        Maximum memory used to cache IRF products (exposure, background, PSF and energy
+        dispersion maps) across observations, e.g. ``500 * u.MB``. Observations sharing
+        the same IRFs and geometry, and with pointings closer than ``cache_pointing_step``,
+        reuse the cached products rescaled to their livetime. The least recently used
+        products are evicted first. Default is None, which disables the cache.
+    cache_pointing_step : `~astropy.coordinates.Angle`, optional
+        Quantization step of the pointing coordinates used to identify cached IRF products.
+        Used only when ``cache_size`` is set.
+        Default is 0.01 deg.
 
     Examples
     --------
@@ -114,11 +127,22 @@ class MapDatasetMaker(Maker):
         background_interp_missing_data=True,
         background_pad_offset=True,
         fov_rotation_step=1.0 * u.deg,
+        cache_size=None,
+        cache_pointing_step=0.01 * u.deg,
     ):
         self.background_oversampling = background_oversampling
         self.background_interp_missing_data = background_interp_missing_data
         self.background_pad_offset = background_pad_offset
         self.fov_rotation_step = fov_rotation_step
+        self.cache_size = cache_size
+        self.cache_pointing_step = cache_pointing_step
+
+        if cache_size is None:
+            self._cache = None
+        else:
+            self._cache = _IRFProductCache(
+                max_size=cache_size, pointing_step=cache_pointing_step
+            )
         if selection is None:
             selection = self.available_selection
 
@@ -233,6 +257,27 @@ class MapDatasetMaker(Maker):
             use_region_center=use_region_center,
         )
 
+    def _make_exposure(self, geom, observation, use_region_center=True):
+        """Make exposure map, reusing it from the IRF product cache if enabled."""
+        if getattr(observation, "exposure", None) or isinstance(observation.aeff, Map):
+            return MapDatasetMaker.make_exposure(
+                geom, observation, use_region_center=use_region_center
+            )
+
+        def make():
+            return self.make_exposure_irf(
+                geom, observation, use_region_center=use_region_center
+            )
+
+        return self._make_cached(
+            make,
+            observation=observation,
+            geom=geom,
+            irfs=[observation.aeff],
+            time=observation.observation_live_time_duration,
+            key=("exposure", use_region_center),
+        )
+
     def make_background(self, geom, observation):
         """Make background map.
 
@@ -276,21 +321,52 @@ class MapDatasetMaker(Maker):
 
         use_region_center = getattr(self, "use_region_center", True)
 
-        if self.background_interp_missing_data:
-            bkg.interp_missing_data(axis_name="energy")
+        def make():
+            bkg = observation.bkg
+
+            if self.background_interp_missing_data:
+                # the IRF can be shared with other observations through the IRF cache
+                bkg = deepcopy(bkg)
+                bkg.interp_missing_data(axis_name="energy")
 
-        if self.background_pad_offset and bkg.has_offset_axis:
-            bkg = bkg.pad(1, mode="edge", axis_name="offset")
+            if self.background_pad_offset and bkg.has_offset_axis:
+                bkg = bkg.pad(1, mode="edge", axis_name="offset")
 
-        return make_map_background_irf(
-            pointing=observation.pointing,
-            ontime=observation.observation_time_duration,
-            bkg=bkg,
+            return make_map_background_irf(
+                pointing=observation.pointing,
+                ontime=observation.observation_time_duration,
+                bkg=bkg,
+                geom=geom,
+                time_start=observation.tstart,
+                fov_rotation_step=self.fov_rotation_step,
+                oversampling=self.background_oversampling,
+                use_region_center=use_region_center,
+            )
+
+        key = (
+            "background",
+            use_region_center,
+            self.background_interp_missing_data,
+            self.background_pad_offset,
+            self.background_oversampling,
+            str(self.fov_rotation_step),
+        )
+
+        if self._cache is not None:
+            if not bkg.has_offset_axis and bkg.fov_alignment == FoVAlignment.ALTAZ:
+                # the FoV rotation depends on the alt-az track of the observation
+                key += tuple(
+                    self._cache.pointing_key(observation.get_pointing_altaz(time))
+                    for time in [observation.tstart, observation.tstop]
+                )
+
+        return self._make_cached(
+            make,
+            observation=observation,
             geom=geom,
-            time_start=observation.tstart,
-            fov_rotation_step=self.fov_rotation_step,
-            oversampling=self.background_oversampling,
-            use_region_center=use_region_center,
+            irfs=[bkg],
+            time=observation.observation_time_duration,
+            key=key,
         )
 
     def make_edisp(self, geom, observation):
@@ -308,16 +384,31 @@ class MapDatasetMaker(Maker):
         edisp : `~gammapy.irf.EDispMap`
             Energy dispersion map.
         """
-        exposure = self.make_exposure_irf(geom.squash(axis_name="migra"), observation)
-
         use_region_center = getattr(self, "use_region_center", True)
 
-        return make_edisp_map(
-            edisp=observation.edisp,
-            pointing=observation.get_pointing_icrs(observation.tmid),
+        def make():
+            pointing = observation.get_pointing_icrs(observation.tmid)
+            exposure = make_map_exposure_true_energy(
+                pointing=pointing,
+                livetime=observation.observation_live_time_duration,
+                aeff=observation.aeff,
+                geom=geom.squash(axis_name="migra"),
+            )
+            return make_edisp_map(
+                edisp=observation.edisp,
+                pointing=pointing,
+                geom=geom,
+                exposure_map=exposure,
+                use_region_center=use_region_center,
+            )
+
+        return self._make_cached(
+            make,
+            observation=observation,
             geom=geom,
-            exposure_map=exposure,
-            use_region_center=use_region_center,
+            irfs=[observation.edisp, observation.aeff],
+            time=observation.observation_live_time_duration,
+            key=("edisp", use_region_center),
         )
 
     def make_edisp_kernel(self, geom, observation):
@@ -346,16 +437,31 @@ class MapDatasetMaker(Maker):
             interp_map = edisp.edisp_map.interp_to_geom(geom)
             return EDispKernelMap(edisp_kernel_map=interp_map, exposure_map=exposure)
 
-        exposure = self.make_exposure_irf(geom.squash(axis_name="energy"), observation)
-
         use_region_center = getattr(self, "use_region_center", True)
 
-        return make_edisp_kernel_map(
-            edisp=observation.edisp,
-            pointing=observation.get_pointing_icrs(observation.tmid),
+        def make():
+            pointing = observation.get_pointing_icrs(observation.tmid)
+            exposure = make_map_exposure_true_energy(
+                pointing=pointing,
+                livetime=observation.observation_live_time_duration,
+                aeff=observation.aeff,
+                geom=geom.squash(axis_name="energy"),
+            )
+            return make_edisp_kernel_map(
+                edisp=observation.edisp,
+                pointing=pointing,
+                geom=geom,
+                exposure_map=exposure,
+                use_region_center=use_region_center,
+            )
+
+        return self._make_cached(
+            make,
+            observation=observation,
             geom=geom,
-            exposure_map=exposure,
-            use_region_center=use_region_center,
+            irfs=[observation.edisp, observation.aeff],
+            time=observation.observation_live_time_duration,
+            key=("edisp_kernel", use_region_center),
         )
 
     def make_psf(self, geom, observation):
@@ -384,15 +490,69 @@ class MapDatasetMaker(Maker):
                 exposure_map = None
             return psf.__class__(psf.psf_map.interp_to_geom(geom), exposure_map)
 
-        exposure = self.make_exposure_irf(geom.squash(axis_name="rad"), observation)
+        def make():
+            pointing = observation.get_pointing_icrs(observation.tmid)
+            exposure = make_map_exposure_true_energy(
+                pointing=pointing,
+                livetime=observation.observation_live_time_duration,
+                aeff=observation.aeff,
+                geom=geom.squash(axis_name="rad"),
+            )
+            return make_psf_map(
+                psf=psf,
+                pointing=pointing,
+                geom=geom,
+                exposure_map=exposure,
+            )
 
-        return make_psf_map(
-            psf=psf,
-            pointing=observation.get_pointing_icrs(observation.tmid),
+        return self._make_cached(
+            make,
+            observation=observation,
             geom=geom,
-            exposure_map=exposure,
+            irfs=[psf, observation.aeff],
+            time=observation.observation_live_time_duration,
+            key=("psf",),
         )
 
+    def _make_cached(self, make, observation, geom, irfs, time, key):
+        """Make an IRF product, reusing it from the IRF product cache if enabled.
+
+        Parameters
+        ----------
+        make : callable
+            Function computing the product.
+        observation : `~gammapy.data.Observation`
+            Observation container.
+        geom : `~gammapy.maps.Geom`
+            Reference geometry.
+        irfs : list
+            IRFs the product is computed from.
+        time : `~astropy.units.Quantity`
+            Time the product scales with.
+        key : tuple
+            Additional parameters identifying the product.
+
+        Returns
+        -------
+        product : `~gammapy.maps.Map` or `~gammapy.irf.IRFMap`
+            IRF product.
+        """
+        if self._cache is None:
+            return make()
+
+        key = self._cache.make_key(
+            key=key,
+            irfs=irfs,
+            geom=geom,
+            pointing=observation.get_pointing_icrs(observation.tmid),
+        )
+        return self._cache.get(key=key, make=make, time=time, irfs=irfs)
+
+    def clear_cache(self):
+        """Clear the IRF product cache."""
+        if self._cache is not None:
+            self._cache.clear()
+
     @staticmethod
     def make_meta_table(observation):
         """Make information meta table.
@@ -461,7 +621,7 @@ class MapDatasetMaker(Maker):
         kwargs["counts"] = counts
 
         if "exposure" in self.selection:
-            exposure = self.make_exposure(dataset.exposure.geom, observation)
+            exposure = self._make_exposure(dataset.exposure.geom, observation)
             kwargs["exposure"] = exposure
 
         if "background" in self.selection:
@@ -484,3 +644,137 @@ class MapDatasetMaker(Maker):
             kwargs["edisp"] = edisp
 
         return dataset.__class__(name=dataset.name, **kwargs)
+
+
+class _IRFProductCache:
+    """Least recently used cache of IRF products with a memory limit.
+
+    Products are identified by the IRF objects they are computed from, the
+    geometry and the quantized pointing position. They are stored with the
+    time they were computed for, and rescaled to the time of the requesting
+    observation.
+
+    IRFs are identified by identity, so that observations sharing IRFs through
+    `~gammapy.utils.fits.IRF_CACHE` share their products. The IRFs must not be
+    modified in place while products computed from them are cached.
+
+    Parameters
+    ----------
+    max_size : `~astropy.units.Quantity`
+        Maximum memory used by the cached products.
+    pointing_step : `~astropy.coordinates.Angle`
+        Quantization step of the pointing coordinates.
+    """
+
+    max_geoms = 16
+    """Number of recently used geometries products can be matched against."""
+
+    def __init__(self, max_size, pointing_step):
+        self.max_size = u.Quantity(max_size, "byte").to_value("byte")
+        self.pointing_step = Angle(pointing_step)
+        self.clear()
+
+    def clear(self):
+        """Remove all products from the cache."""
+        self._products = OrderedDict()
+        self._geoms = OrderedDict()
+        self._n_geoms = 0
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def pointing_key(self, pointing):
+        """Quantized pointing coordinates."""
+        step = self.pointing_step.to_value("deg")
+        lon = pointing.spherical.lon.wrap_at("360d").deg
+        lat = pointing.spherical.lat.deg
+        return int(np.round(lon / step)), int(np.round(lat / step))
+
+    def geom_key(self, geom):
+        """Key of the geometry among the recently used geometries."""
+        for key, other in self._geoms.items():
+            try:
+                is_equal = geom is other or geom == other
+            except NotImplementedError:
+                is_equal = False
+
+            if is_equal:
+                self._geoms.move_to_end(key)
+                return key
+
+        key = self._n_geoms
+        self._n_geoms += 1
+        self._geoms[key] = geom
+
+        if len(self._geoms) > self.max_geoms:
+            self._geoms.popitem(last=False)
+
+        return key
+
+    def make_key(self, key, irfs, geom, pointing):
+        """Make product cache key."""
+        irf_keys = tuple(id(irf) for irf in irfs)
+        return key + irf_keys + (self.geom_key(geom),) + self.pointing_key(pointing)
+
+    @staticmethod
+    def _nbytes(product):
+        if isinstance(product, Map):
+            return product.data.nbytes
+
+        nbytes = product._irf_map.data.nbytes
+        if product.exposure_map is not None:
+            nbytes += product.exposure_map.data.nbytes
+        return nbytes
+
+    @staticmethod
+    def _rescale(product, factor):
+        product = product.copy()
+
+        if isinstance(product, Map):
+            product.data *= factor
+        elif product.exposure_map is not None:
+            product.exposure_map.data *= factor
+
+        return product
+
+    def get(self, key, make, time, irfs):
+        """Get product from the cache, or make it and add it to the cache.
+
+        Parameters
+        ----------
+        key : tuple
+            Product cache key.
+        make : callable
+            Function computing the product.
+        time : `~astropy.units.Quantity`
+            Time the product scales with.
+        irfs : list of `~gammapy.irf.IRF`
+            IRFs the product is computed from. They are kept with the cached
+            product, so that their ids are not reused.
+
+        Returns
+        -------
+        product : `~gammapy.maps.Map` or `~gammapy.irf.IRFMap`
+            IRF product.
+        """
+        if key in self._products:
+            self.hits += 1
+            self._products.move_to_end(key)
+            product, time_ref, _ = self._products[key]
+            factor = (time / time_ref).to_value("")
+            return self._rescale(product, factor)
+
+        self.misses += 1
+        product = make()
+
+        nbytes = self._nbytes(product)
+
+        if nbytes <= self.max_size and time > 0:
+            self._products[key] = (self._rescale(product, 1), time, irfs)
+            self.size += nbytes
+
+            while self.size > self.max_size:
+                _, (evicted, _, _) = self._products.popitem(last=False)
+                self.size -= self._nbytes(evicted)
+
+        return product
@@ -1,8 +1,21 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import io
+import itertools
 import logging
+import numpy as np
 from astropy.coordinates import Angle
+from astropy.table import Table
 import gammapy.utils.parallel as parallel
-from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, SpectrumDataset
+from gammapy.data import Observations
+from gammapy.datasets import (
+    DATASET_REGISTRY,
+    Datasets,
+    MapDataset,
+    MapDatasetOnOff,
+    SpectrumDataset,
+)
+from gammapy.modeling.models import Models
+from gammapy.utils.scripts import make_path
 from .core import Maker
 from .safe import SafeMaskMaker
 
@@ -40,9 +53,27 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
     parallel_backend : {'multiprocessing', 'ray'}, optional
         Which backend to use for multiprocessing.
         Default is None.
+    stack_batch_size : int, optional
+        Number of observations reduced and stacked together in a single task, used only
+        if ``stack_datasets`` is True. Each task stacks its observations into a partial
+        dataset, so that the memory used per process does not depend on the number of
+        observations. The partial datasets are then merged pairwise.
+        Default is None, which stacks every observation dataset in the main process.
+    stack_path : str or `~pathlib.Path`, optional
+        Directory where the partial datasets are written, used only if
+        ``stack_batch_size`` is set. Default is None, which keeps them in memory.
+    checkpoint_path : str or `~pathlib.Path`, optional
+        Directory where each reduced dataset is written as soon as it is completed.
+        The status of every observation is recorded in a manifest table in this
+        directory. When running again, the datasets of completed observations are
+        read back instead of being reduced again. Observations that fail are
+        recorded in the manifest and reported, instead of aborting the run.
+        Cannot be used together with ``stack_batch_size``.
+        Default is None.
     """
 
     tag = "DatasetsMaker"
+    manifest_filename = "manifest.ecsv"
 
     def __init__(
         self,
@@ -52,6 +83,9 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         cutout_mode="trim",
         cutout_width=None,
         parallel_backend=None,
+        stack_batch_size=None,
+        stack_path=None,
+        checkpoint_path=None,
     ):
         self.log = logging.getLogger(__name__)
         self.makers = makers
@@ -72,6 +106,21 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
         self.stack_datasets = stack_datasets
+        self.stack_batch_size = stack_batch_size
+
+        if stack_path is not None:
+            stack_path = make_path(stack_path)
+
+        self.stack_path = stack_path
+
+        if checkpoint_path is not None:
+            if stack_batch_size is not None:
+                raise ValueError(
+                    "checkpoint_path cannot be used together with stack_batch_size"
+                )
+            checkpoint_path = make_path(checkpoint_path)
+
+        self.checkpoint_path = checkpoint_path
 
         self._datasets = []
         self._error = False
@@ -123,11 +172,312 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
 
         return dataset_obs
 
+    def make_stacked_dataset(self, datasets, observations, filename=None):
+        """Make datasets for several observations and stack them.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.MapDataset`
+            Reference datasets.
+        observations : list of `Observation`
+            Observations.
+        filename : `~pathlib.Path`, optional
+            If given, the stacked dataset is written to this file.
+            Default is None.
+
+        Returns
+        -------
+        stacked : `~gammapy.datasets.MapDataset` or `~pathlib.Path`
+            Stacked dataset, or the file it was written to.
+        """
+        geoms = self._dataset.geoms
+        stacked = self._dataset.__class__.from_geoms(**geoms, name=self._dataset.name)
+
+        for dataset, observation in zip(datasets, observations):
+            dataset_obs = self.make_dataset(dataset, observation)
+            stacked.stack(self._to_stack_type(dataset_obs))
+
+        if filename is None:
+            return stacked
+
+        self._write_dataset(stacked, filename)
+        return filename
+
+    def _to_stack_type(self, dataset):
+        if type(self._dataset) is MapDataset and type(dataset) is MapDatasetOnOff:
+            dataset = dataset.to_map_dataset(name=dataset.name)
+        return dataset
+
+    @staticmethod
+    def _write_dataset(dataset, filename):
+        # use the GADF serialisation for all dataset types
+        dataset.to_hdulist().writeto(str(filename), overwrite=True)
+
+    def _read_stacked(self, stacked):
+        if self.stack_path is None:
+            return stacked
+
+        dataset = self._dataset.__class__.read(
+            stacked, format="gadf", name=self._dataset.name
+        )
+        stacked.unlink()
+        return dataset
+
+    @staticmethod
+    def _stack_partial(dataset, other):
+        # the IRF maps of a partial stack are already weighted by the safe masks
+        # of each observation, stacking them again with the safe mask of the
+        # partial stack would drop contributions at the mask edges
+        psf, edisp = other.psf, other.edisp
+        other.psf, other.edisp = None, None
+        dataset.stack(other)
+
+        if dataset.psf and psf:
+            dataset.psf.stack(psf)
+
+        if dataset.edisp and edisp:
+            dataset.edisp.stack(edisp)
+
+    def _merge_stacked(self, stacked, other):
+        dataset = self._read_stacked(stacked)
+        self._stack_partial(dataset, self._read_stacked(other))
+
+        if self.stack_path is None:
+            return dataset
+
+        self._write_dataset(dataset, stacked)
+        return stacked
+
+    def _run_stacked_batches(self, datasets, observations):
+        """Stack batches of observations in parallel and merge them pairwise."""
+        n_obs = len(observations)
+        n_batches = int(np.ceil(n_obs / self.stack_batch_size))
+        edges = np.linspace(0, n_obs, n_batches + 1).astype(int)
+
+        if self.stack_path is not None:
+            self.stack_path.mkdir(parents=True, exist_ok=True)
+
+        n_jobs = min(self.n_jobs, n_batches)
+        observations_iter = iter(
+            self._iter_observations(
+                observations, n_jobs, prefetch=getattr(observations, "prefetch", None)
+            )
+        )
+
+        inputs = []
+        for idx, (start, stop) in enumerate(zip(edges[:-1], edges[1:])):
+            filename = None
+            if self.stack_path is not None:
+                filename = self.stack_path / f"stacked_{self._dataset.name}_{idx}.fits"
+
+            if n_jobs == 1:
+                # consumed lazily, in order, by the single process
+                observations_batch = itertools.islice(observations_iter, stop - start)
+            else:
+                observations_batch = list(observations)[start:stop]
+
+            inputs.append((list(datasets)[start:stop], observations_batch, filename))
+
+        stacked = parallel.run_multiprocessing(
+            self.make_stacked_dataset,
+            inputs,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            task_name="Data reduction",
+        )
+
+        while len(stacked) > 1:
+            merged = [
+                self._merge_stacked(*pair) for pair in zip(stacked[::2], stacked[1::2])
+            ]
+            stacked = merged + stacked[2 * len(merged) :]
+
+        self._stack_partial(self._dataset, self._read_stacked(stacked[0]))
+        return Datasets([self._dataset])
+
+    def _make_dataset_checkpoint(self, dataset, observation):
+        """Make single dataset and write it to the checkpoint directory.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset`
+            Reference dataset.
+        observation : `Observation`
+            Observation.
+
+        Returns
+        -------
+        record : dict
+            Manifest record of the observation.
+        dataset_obs : `~gammapy.datasets.MapDataset`
+            Dataset, None if the data reduction failed.
+        """
+        obs_id = str(observation.obs_id)
+        record = {
+            "OBS_ID": obs_id,
+            "STATUS": "done",
+            "TYPE": "",
+            "NAME": "",
+            "FILENAME": "",
+            "ERROR": "",
+        }
+
+        try:
+            dataset_obs = self.make_dataset(dataset, observation)
+            filename = f"dataset_{obs_id}.fits"
+            self._write_checkpoint(dataset_obs, self.checkpoint_path / filename)
+        except Exception as error:
+            log.warning(f"Data reduction failed for observation {obs_id}: {error}")
+            record["STATUS"] = "failed"
+            record["ERROR"] = f"{error.__class__.__name__}: {error}"
+            return record, None
+
+        record["TYPE"] = dataset_obs.tag
+        record["NAME"] = dataset_obs.name
+        record["FILENAME"] = filename
+        return record, dataset_obs
+
+    @staticmethod
+    def _models_filename(filename):
+        return filename.with_name(f"{filename.stem}_models.yaml")
+
+    def _write_checkpoint(self, dataset, filename):
+        """Write dataset and its models to the checkpoint directory."""
+        self._write_dataset(dataset, filename)
+
+        # the models, e.g. the background norm adjusted by the `FoVBackgroundMaker`,
+        # are not part of the GADF serialisation
+        models_filename = self._models_filename(filename)
+
+        if dataset.models is not None:
+            dataset.models.write(
+                models_filename, overwrite=True, write_covariance=False
+            )
+        else:
+            models_filename.unlink(missing_ok=True)
+
+    def _read_checkpoint(self, row):
+        """Read dataset and its models from the checkpoint directory."""
+        filename = self.checkpoint_path / row["FILENAME"]
+        dataset = DATASET_REGISTRY.get_cls(row["TYPE"]).read(
+            filename, format="gadf", name=row["NAME"]
+        )
+
+        models_filename = self._models_filename(filename)
+
+        if models_filename.exists():
+            dataset.models = Models.read(models_filename)
+
+        return dataset
+
+    def _write_manifest_record(self, record):
+        """Append a record to the manifest table."""
+        # a record must fit on a single line of the table
+        record = {name: " ".join(value.splitlines()) for name, value in record.items()}
+        table = Table(rows=[record], names=list(record), dtype=len(record) * [str])
+        filename = self.checkpoint_path / self.manifest_filename
+
+        if not filename.exists():
+            table.write(filename, format="ascii.ecsv")
+            return
+
+        buffer = io.StringIO()
+        table.write(buffer, format="ascii.ecsv")
+        row = buffer.getvalue().splitlines()[-1]
+
+        with filename.open("a") as f:
+            f.write(row + "\n")
+
+    def read_manifest(self):
+        """Read the manifest table of the checkpoint directory.
+
+        Returns
+        -------
+        manifest : `~astropy.table.Table`
+            Manifest table, with the last record of each observation.
+        """
+        filename = self.checkpoint_path / self.manifest_filename
+
+        if not filename.exists():
+            return Table(
+                names=["OBS_ID", "STATUS", "TYPE", "NAME", "FILENAME", "ERROR"],
+                dtype=6 * [str],
+            )
+
+        table = Table.read(filename, format="ascii.ecsv")
+        table = table[::-1]
+        _, idx = np.unique(table["OBS_ID"], return_index=True)
+        return table[np.sort(idx)][::-1]
+
+    def _checkpoint_callback(self, result):
+        record, dataset = result
+        self._write_manifest_record(record)
+
+        if dataset is not None:
+            self.callback(dataset)
+
+    def _run_checkpoint(self, datasets, observations):
+        """Run data reduction, reusing and writing datasets to the checkpoint directory."""
+        self.checkpoint_path.mkdir(parents=True, exist_ok=True)
+
+        manifest = self.read_manifest()
+        completed = {row["OBS_ID"]: row for row in manifest if row["STATUS"] == "done"}
+
+        datasets_remaining, observations_remaining = [], []
+        for dataset, observation in zip(datasets, observations):
+            row = completed.get(str(observation.obs_id))
+
+            if row is None:
+                datasets_remaining.append(dataset)
+                observations_remaining.append(observation)
+                continue
+
+            log.info(f"Reading dataset for observation {observation.obs_id}")
+            dataset_obs = self._read_checkpoint(row)
+            self.callback(dataset_obs)
+
+        n_jobs = min(self.n_jobs, max(len(observations_remaining), 1))
+        observations_iter = self._iter_observations(
+            observations_remaining,
+            n_jobs,
+            prefetch=getattr(observations, "prefetch", None),
+        )
+
+        parallel.run_multiprocessing(
+            self._make_dataset_checkpoint,
+            zip(datasets_remaining, observations_iter),
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            method="apply_async",
+            method_kwargs=dict(
+                callback=self._checkpoint_callback,
+                error_callback=self.error_callback,
+            ),
+            task_name="Data reduction",
+        )
+
+        manifest = self.read_manifest()
+        failed = manifest["OBS_ID"][manifest["STATUS"] == "failed"]
+
+        if len(failed) > 0:
+            log.warning(
+                f"Data reduction failed for {len(failed)} observation(s): "
+                f"{list(failed)}, see {self.checkpoint_path / self.manifest_filename}"
+            )
+
+    @staticmethod
+    def _iter_observations(observations, n_jobs, prefetch=None):
+        """Observations to iterate over, read ahead if running in a single process."""
+        if n_jobs == 1 and prefetch:
+            if not isinstance(observations, Observations):
+                observations = Observations(observations)
+            return observations.in_memory_generator(prefetch=prefetch)
+
+        return observations
+
     def callback(self, dataset):
         if self.stack_datasets:
-            if type(self._dataset) is MapDataset and type(dataset) is MapDatasetOnOff:
-                dataset = dataset.to_map_dataset(name=dataset.name)
-            self._dataset.stack(dataset)
+            self._dataset.stack(self._to_stack_type(dataset))
         else:
             self._datasets.append(dataset)
 
@@ -167,20 +517,31 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         else:
             datasets = len(observations) * [dataset]
 
-        n_jobs = min(self.n_jobs, len(observations))
+        if self.stack_datasets and self.stack_batch_size is not None:
+            return self._run_stacked_batches(datasets, observations)
 
-        parallel.run_multiprocessing(
-            self.make_dataset,
-            zip(datasets, observations),
-            backend=self.parallel_backend,
-            pool_kwargs=dict(processes=n_jobs),
-            method="apply_async",
-            method_kwargs=dict(
-                callback=self.callback,
-                error_callback=self.error_callback,
-            ),
-            task_name="Data reduction",
-        )
+        self._datasets = []
+
+        if self.checkpoint_path is not None:
+            self._run_checkpoint(datasets, observations)
+        else:
+            n_jobs = min(self.n_jobs, len(observations))
+            observations_iter = self._iter_observations(
+                observations, n_jobs, prefetch=getattr(observations, "prefetch", None)
+            )
+
+            parallel.run_multiprocessing(
+                self.make_dataset,
+                zip(datasets, observations_iter),
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=n_jobs),
+                method="apply_async",
+                method_kwargs=dict(
+                    callback=self.callback,
+                    error_callback=self.error_callback,
+                ),
+                task_name="Data reduction",
+            )
 
         if self._error:
             raise RuntimeError("Execution of a sub-process failed")
@@ -191,4 +552,10 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         lookup = {
             d.meta_table["OBS_ID"][0]: idx for idx, d in enumerate(self._datasets)
         }
-        return Datasets([self._datasets[lookup[obs.obs_id]] for obs in observations])
+        return Datasets(
+            [
+                self._datasets[lookup[obs.obs_id]]
+                for obs in observations
+                if obs.obs_id in lookup
+            ]
+        )
@@ -4,7 +4,7 @@ import numpy as np
 from astropy import units as u
 from astropy.coordinates import Angle
 from gammapy.irf import EDispKernelMap
-from gammapy.maps import Map
+from gammapy.maps import Map, WcsGeom
 from gammapy.modeling.models import TemplateSpectralModel
 from .core import Maker
 
@@ -14,6 +14,16 @@ __all__ = ["SafeMaskMaker"]
 log = logging.getLogger(__name__)
 
 
+def _group_by_irf(irfs):
+    """Group indices of a list of IRFs by shared IRF instance."""
+    groups = {}
+
+    for idx, irf in enumerate(irfs):
+        groups.setdefault(id(irf), (irf, []))[1].append(idx)
+
+    return list(groups.values())
+
+
 class SafeMaskMaker(Maker):
     """Make safe data range mask for a given observation.
 
@@ -110,13 +120,35 @@ class SafeMaskMaker(Maker):
         mask_safe : `~numpy.ndarray`
             Maximum offset mask.
         """
-        if observation is None:
-            raise ValueError("Method 'offset-max' requires an observation object.")
+        return self._make_masks_offset_max([dataset], [observation])[0]
 
-        separation = dataset._geom.separation(
-            observation.get_pointing_icrs(observation.tmid)
-        )
-        return separation < self.offset_max
+    def _make_masks_offset_max(self, datasets, observations):
+        """Maximum offset masks.
+
+        The sky coordinates of the pixels are computed once for all datasets
+        sharing the same geometry.
+        """
+        masks, skycoords = [], {}
+
+        for dataset, observation in zip(datasets, observations):
+            if observation is None:
+                raise ValueError("Method 'offset-max' requires an observation object.")
+
+            geom = dataset._geom
+            pointing = observation.get_pointing_icrs(observation.tmid)
+
+            if not isinstance(geom, WcsGeom) or not geom.is_regular:
+                masks.append(geom.separation(pointing) < self.offset_max)
+                continue
+
+            key = (geom.wcs.to_header_string(), geom.data_shape[-2:])
+
+            if key not in skycoords:
+                skycoords[key] = geom.to_image().get_coord().skycoord
+
+            masks.append(pointing.separation(skycoords[key]) < self.offset_max)
+
+        return masks
 
     @staticmethod
     def make_mask_energy_aeff_default(dataset, observation):
@@ -134,6 +166,14 @@ class SafeMaskMaker(Maker):
         mask_safe : `~numpy.ndarray`
             Safe data range mask.
         """
+        energy_min, energy_max = SafeMaskMaker._get_energy_range_aeff_default(
+            observation
+        )
+        return dataset._geom.energy_mask(energy_min=energy_min, energy_max=energy_max)
+
+    @staticmethod
+    def _get_energy_range_aeff_default(observation):
+        """Default safe energy range stored in the effective area."""
         if observation is None:
             raise ValueError("Method 'aeff-default' requires an observation object.")
 
@@ -155,7 +195,7 @@ class SafeMaskMaker(Maker):
                 f"No default lower safe energy threshold defined for obs {observation.obs_id}"
             )
 
-        return dataset._geom.energy_mask(energy_min=energy_min, energy_max=energy_max)
+        return energy_min, energy_max
 
     def _get_offset(self, observation):
         offset = self.fixed_offset
@@ -195,25 +235,47 @@ class SafeMaskMaker(Maker):
             Safe data range mask.
         """
 
-        if self.fixed_offset is not None and observation is None:
+        energy_min = self._get_energy_min_aeff_max([dataset], [observation])[0]
+
+        if energy_min is None:
+            return Map.from_geom(dataset._geom, data=False, dtype="bool")
+
+        return dataset._geom.energy_mask(energy_min=energy_min)
+
+    def _check_fixed_offset(self, observations):
+        if self.fixed_offset is not None and None in observations:
             raise ValueError(
-                f"{observation} argument is mandatory with {self.fixed_offset}"
+                f"observation argument is mandatory with {self.fixed_offset}"
             )
 
-        geom, exposure = dataset._geom, dataset.exposure
+    def _get_energy_min_aeff_max(self, datasets, observations):
+        """Lower energy thresholds from the effective area maximum value.
+
+        The threshold is None if the effective area is zero. With DL3 irfs,
+        the effective area is evaluated once for all observations sharing it.
+        """
+        self._check_fixed_offset(observations)
+
+        energy_min = [None] * len(datasets)
 
         if self.irfs == "DL3":
-            offset = self._get_offset(observation)
+            offsets = [self._get_offset(obs) for obs in observations]
+
+            for aeff, indices in _group_by_irf([obs.aeff for obs in observations]):
+                offset = u.Quantity([offsets[idx] for idx in indices])
+                edges = aeff.axes["energy_true"].edges
+                values = aeff.evaluate(offset=offset[:, np.newaxis], energy_true=edges)
+                valid = (
+                    values > self.aeff_percent * values.max(axis=1, keepdims=True) / 100
+                )
 
-            values = observation.aeff.evaluate(
-                offset=offset, energy_true=observation.aeff.axes["energy_true"].edges
-            )
-            valid = observation.aeff.axes["energy_true"].edges[
-                values > self.aeff_percent * np.max(values) / 100
-            ]
-            energy_min = np.min(valid)
+                for idx, is_valid in zip(indices, valid):
+                    energy_min[idx] = np.min(edges[is_valid])
 
-        else:
+            return energy_min
+
+        for idx, (dataset, observation) in enumerate(zip(datasets, observations)):
+            geom, exposure = dataset._geom, dataset.exposure
             position = self._get_position(observation, geom)
 
             aeff = exposure.get_spectrum(position) / exposure.meta["livetime"]
@@ -223,23 +285,23 @@ class SafeMaskMaker(Maker):
                     f"No safe energy band can be defined for the dataset '{dataset.name}': "
                     "setting `mask_safe` to all False."
                 )
-                return Map.from_geom(geom, data=False, dtype="bool")
+                continue
 
             model = TemplateSpectralModel.from_region_map(aeff)
 
             energy_true = model.energy
-            energy_min = energy_true[np.where(model.values > 0)[0][0]]
+            energy_min[idx] = energy_true[np.where(model.values > 0)[0][0]]
             energy_max = energy_true[-1]
 
             aeff_thres = (self.aeff_percent / 100) * aeff.quantity.max()
             inversion = model.inverse(
-                aeff_thres, energy_min=energy_min, energy_max=energy_max
+                aeff_thres, energy_min=energy_min[idx], energy_max=energy_max
             )
 
             if not np.isnan(inversion[0]):
-                energy_min = inversion[0]
+                energy_min[idx] = inversion[0]
 
-        return geom.energy_mask(energy_min=energy_min)
+        return energy_min
 
     def make_mask_energy_edisp_bias(self, dataset, observation=None):
         """Make safe energy mask from energy dispersion bias.
@@ -257,24 +319,48 @@ class SafeMaskMaker(Maker):
             Safe data range mask.
         """
 
-        if self.fixed_offset is not None and observation is None:
-            raise ValueError(
-                f"{observation} argument is mandatory with {self.fixed_offset}"
-            )
+        energy_min = self._get_energy_min_edisp_bias([dataset], [observation])[0]
+        return dataset._geom.energy_mask(energy_min=energy_min)
+
+    def _get_energy_min_edisp_bias(self, datasets, observations):
+        """Lower energy thresholds from the energy dispersion bias.
+
+        With DL3 irfs, the energy dispersion kernel is computed once per shared
+        energy dispersion and offset.
+        """
+        self._check_fixed_offset(observations)
 
-        edisp, geom = dataset.edisp, dataset._geom
+        energy_min = [None] * len(datasets)
 
         if self.irfs == "DL3":
-            offset = self._get_offset(observation)
-            edisp = observation.edisp.to_edisp_kernel(offset)
-        else:
+            for edisp, indices in _group_by_irf([obs.edisp for obs in observations]):
+                thresholds = {}
+
+                for idx in indices:
+                    offset = self._get_offset(observations[idx])
+                    key = offset.to_value("deg")
+
+                    if key not in thresholds:
+                        kernel = edisp.to_edisp_kernel(offset)
+                        thresholds[key] = kernel.get_bias_energy(
+                            self.bias_percent / 100
+                        )[0]
+
+                    energy_min[idx] = thresholds[key]
+
+            return energy_min
+
+        for idx, (dataset, observation) in enumerate(zip(datasets, observations)):
+            edisp, geom = dataset.edisp, dataset._geom
+
             kwargs = dict()
             kwargs["position"] = self._get_position(observation, geom)
             if not isinstance(edisp, EDispKernelMap):
                 kwargs["energy_axis"] = dataset._geom.axes["energy"]
             edisp = edisp.get_edisp_kernel(**kwargs)
-        energy_min = edisp.get_bias_energy(self.bias_percent / 100)[0]
-        return geom.energy_mask(energy_min=energy_min)
+            energy_min[idx] = edisp.get_bias_energy(self.bias_percent / 100)[0]
+
+        return energy_min
 
     def make_mask_energy_bkg_peak(self, dataset, observation=None):
         """Make safe energy mask based on the binned background.
@@ -298,19 +384,38 @@ class SafeMaskMaker(Maker):
         mask_safe : `~numpy.ndarray`
             Safe data range mask.
         """
-        geom = dataset._geom
+        energy_min = self._get_energy_min_bkg_peak([dataset], [observation])[0]
+        return dataset._geom.energy_mask(energy_min=energy_min)
+
+    def _get_energy_min_bkg_peak(self, datasets, observations):
+        """Lower energy thresholds from the background peak.
+
+        With DL3 irfs, the background spectrum is computed once per shared
+        background model.
+        """
+        energy_min = [None] * len(datasets)
+
         if self.irfs == "DL3":
-            bkg = observation.bkg.to_2d()
-            background_spectrum = np.ravel(
-                bkg.integral(axis_name="offset", offset=bkg.axes["offset"].bounds[1])
-            )
-            energy_axis = bkg.axes["energy"]
-        else:
+            for bkg, indices in _group_by_irf([obs.bkg for obs in observations]):
+                bkg = bkg.to_2d()
+                background_spectrum = np.ravel(
+                    bkg.integral(
+                        axis_name="offset", offset=bkg.axes["offset"].bounds[1]
+                    )
+                )
+                idx_peak = np.argmax(background_spectrum.data, axis=0).item()
+
+                for idx in indices:
+                    energy_min[idx] = bkg.axes["energy"].edges[idx_peak]
+
+            return energy_min
+
+        for idx, dataset in enumerate(datasets):
             background_spectrum = dataset.npred_background().get_spectrum()
-            energy_axis = geom.axes["energy"]
+            idx_peak = np.argmax(background_spectrum.data, axis=0).item()
+            energy_min[idx] = dataset._geom.axes["energy"].edges[idx_peak]
 
-        idx = np.argmax(background_spectrum.data, axis=0).item()
-        return geom.energy_mask(energy_min=energy_axis.edges[idx])
+        return energy_min
 
     @staticmethod
     def make_mask_bkg_invalid(dataset):
@@ -334,6 +439,100 @@ class SafeMaskMaker(Maker):
 
         return mask
 
+    def make_masks(self, datasets, observations=None):
+        """Make safe data range masks for a list of datasets.
+
+        The IRF based energy thresholds are evaluated once for all observations
+        sharing the same IRF and combined into a single energy mask per dataset.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.MapDataset` or `~gammapy.datasets.SpectrumDataset`
+            Datasets to compute masks for.
+        observations : list of `~gammapy.data.Observation`, optional
+            Observations to compute masks for, one per dataset. Default is None.
+
+        Returns
+        -------
+        masks : list of `~gammapy.maps.Map`
+            Safe data range masks. The input datasets are not modified.
+        """
+        datasets = list(datasets)
+
+        if observations is None:
+            observations = [None] * len(datasets)
+
+        observations = list(observations)
+
+        if len(observations) != len(datasets):
+            raise ValueError(
+                f"Number of observations ({len(observations)}) does not match "
+                f"number of datasets ({len(datasets)})."
+            )
+
+        if self.irfs == "DL3" and None in observations:
+            raise ValueError("observation argument is mandatory with DL3 irfs")
+
+        masks = []
+
+        for dataset in datasets:
+            if dataset.mask_safe:
+                mask_safe = dataset.mask_safe.data.copy()
+            else:
+                mask_safe = np.ones(dataset._geom.data_shape, dtype=bool)
+
+            if dataset.background is not None:
+                # apply it first so only clipped values are removed for "bkg-peak"
+                mask_safe &= self.make_mask_bkg_invalid(dataset)
+
+            masks.append(mask_safe)
+
+        if "offset-max" in self.methods:
+            for mask, mask_offset in zip(
+                masks, self._make_masks_offset_max(datasets, observations)
+            ):
+                mask &= mask_offset
+
+        energy_min = [[] for _ in datasets]
+        energy_max = [[] for _ in datasets]
+
+        if "aeff-default" in self.methods:
+            for idx, observation in enumerate(observations):
+                e_min, e_max = self._get_energy_range_aeff_default(observation)
+                energy_min[idx].append(e_min)
+                energy_max[idx].append(e_max)
+
+        methods = [
+            ("aeff-max", self._get_energy_min_aeff_max),
+            ("edisp-bias", self._get_energy_min_edisp_bias),
+            ("bkg-peak", self._get_energy_min_bkg_peak),
+        ]
+
+        for method, get_energy_min in methods:
+            if method in self.methods:
+                values = get_energy_min(datasets, observations)
+                for idx, value in enumerate(values):
+                    # a missing aeff-max threshold masks the whole dataset
+                    if value is None and method == "aeff-max":
+                        masks[idx][...] = False
+                    energy_min[idx].append(value)
+
+        for dataset, mask, e_min, e_max in zip(datasets, masks, energy_min, energy_max):
+            e_min = [_ for _ in e_min if _ is not None]
+            e_max = [_ for _ in e_max if _ is not None]
+
+            if e_min or e_max:
+                # masks of the lower thresholds combine into a single mask
+                mask &= dataset._geom.energy_mask(
+                    energy_min=max(e_min) if e_min else None,
+                    energy_max=min(e_max) if e_max else None,
+                ).data
+
+        return [
+            Map.from_geom(dataset._geom, data=mask, dtype=bool)
+            for dataset, mask in zip(datasets, masks)
+        ]
+
     def run(self, dataset, observation=None):
         """Make safe data range mask.
 
@@ -349,34 +548,28 @@ class SafeMaskMaker(Maker):
         dataset : `Dataset`
             Dataset with defined safe range mask.
         """
+        dataset.mask_safe = self.make_masks([dataset], [observation])[0]
+        return dataset
 
-        if self.irfs == "DL3":
-            if observation is None:
-                raise ValueError("observation argument is mandatory with DL3 irfs")
-
-        if dataset.mask_safe:
-            mask_safe = dataset.mask_safe.data
-        else:
-            mask_safe = np.ones(dataset._geom.data_shape, dtype=bool)
-
-        if dataset.background is not None:
-            # apply it first so only clipped values are removed for "bkg-peak"
-            mask_safe &= self.make_mask_bkg_invalid(dataset)
-
-        if "offset-max" in self.methods:
-            mask_safe &= self.make_mask_offset_max(dataset, observation)
-
-        if "aeff-default" in self.methods:
-            mask_safe &= self.make_mask_energy_aeff_default(dataset, observation)
+    def run_datasets(self, datasets, observations=None):
+        """Make safe data range masks for a list of datasets.
 
-        if "aeff-max" in self.methods:
-            mask_safe &= self.make_mask_energy_aeff_max(dataset, observation)
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.MapDataset` or `~gammapy.datasets.SpectrumDataset`
+            Datasets to compute masks for.
+        observations : list of `~gammapy.data.Observation`, optional
+            Observations to compute masks for, one per dataset. Default is None.
 
-        if "edisp-bias" in self.methods:
-            mask_safe &= self.make_mask_energy_edisp_bias(dataset, observation)
+        Returns
+        -------
+        datasets : list of `Dataset`
+            Datasets with defined safe range masks.
+        """
+        datasets = list(datasets)
+        masks = self.make_masks(datasets, observations)
 
-        if "bkg-peak" in self.methods:
-            mask_safe &= self.make_mask_energy_bkg_peak(dataset, observation)
+        for dataset, mask in zip(datasets, masks):
+            dataset.mask_safe = mask
 
-        dataset.mask_safe = Map.from_geom(dataset._geom, data=mask_safe, dtype=bool)
-        return dataset
+        return datasets
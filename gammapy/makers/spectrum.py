@@ -60,7 +60,7 @@ class SpectrumDatasetMaker(MapDatasetMaker):
         exposure : `~gammapy.maps.RegionNDMap`
             Exposure map.
         """
-        exposure = super().make_exposure(
+        exposure = super()._make_exposure(
             geom, observation, use_region_center=self.use_region_center
         )
 
@@ -91,6 +91,9 @@ class SpectrumDatasetMaker(MapDatasetMaker):
 
         return exposure
 
+    def _make_exposure(self, geom, observation):
+        return self.make_exposure(geom, observation)
+
     @staticmethod
     def make_counts(geom, observation):
         """Make counts map.
@@ -18,9 +18,17 @@ from gammapy.data import (
 )
 from gammapy.datasets import MapDataset, MapDatasetMetaData
 from gammapy.datasets.map import RAD_AXIS_DEFAULT
-from gammapy.irf import Background2D, EDispKernelMap, EDispMap, PSFMap
+from gammapy.irf import (
+    Background2D,
+    EDispKernelMap,
+    EDispMap,
+    EffectiveAreaTable2D,
+    EnergyDispersion2D,
+    PSFMap,
+)
 from gammapy.makers import FoVBackgroundMaker, MapDatasetMaker, SafeMaskMaker
 from gammapy.maps import HpxGeom, Map, MapAxis, WcsGeom
+from gammapy.utils.fits import HDULocation, _IRFCache
 from gammapy.utils.testing import requires_data, requires_dependency
 from gammapy.utils.scripts import make_path
 
@@ -626,3 +634,155 @@ def test_map_dataset_maker_swgo():
     assert dataset.psf.psf_map.data.shape == (40, 500, 180, 1)
     assert dataset.edisp.edisp_map.data.shape == (40, 30, 180, 1)
     assert dataset.background.data.shape == (30, 180, 1)
+
+
+def test_map_dataset_maker_cache():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=10, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=5)
+    offset_axis = MapAxis.from_bounds(0, 5, nbin=5, unit="deg", name="offset")
+    migra_axis = MapAxis.from_bounds(0.2, 5, nbin=50, node_type="edges", name="migra")
+
+    bkg = Background2D(
+        axes=[energy_axis, offset_axis],
+        data=np.exp(-offset_axis.center.value) * np.ones((5, 1)),
+        unit="s-1 MeV-1 sr-1",
+    )
+    irfs = {
+        "aeff": EffectiveAreaTable2D(
+            axes=[energy_axis_true, offset_axis],
+            data=np.exp(-offset_axis.center.value) * np.ones((10, 1)),
+            unit="km2",
+        ),
+        "edisp": EnergyDispersion2D.from_gauss(
+            energy_axis_true, migra_axis, offset_axis, bias=0, sigma=0.2
+        ),
+        "bkg": bkg,
+    }
+
+    pointing = SkyCoord(83.6, 22.0, unit="deg")
+    observations = [
+        Observation.create(
+            pointing=FixedPointingInfo(fixed_icrs=position),
+            livetime=livetime,
+            irfs=irfs,
+            tstart=0 * u.h,
+        )
+        for position, livetime in [
+            (pointing, 1 * u.h),
+            (pointing.directional_offset_by(0 * u.deg, 0.001 * u.deg), 2 * u.h),
+            (pointing.directional_offset_by(0 * u.deg, 0.5 * u.deg), 1 * u.h),
+        ]
+    ]
+
+    geom = WcsGeom.create(
+        skydir=pointing, binsz=0.1, width=2, frame="icrs", axes=[energy_axis]
+    )
+    empty = MapDataset.create(
+        geom, energy_axis_true=energy_axis_true, migra_axis=migra_axis
+    )
+
+    maker = MapDatasetMaker(selection=["exposure", "background", "edisp"])
+    maker_cache = MapDatasetMaker(
+        selection=["exposure", "background", "edisp"], cache_size=100 * u.MB
+    )
+
+    for obs in observations:
+        dataset = maker.run(empty, obs)
+        dataset_cache = maker_cache.run(empty, obs)
+
+        assert_allclose(dataset_cache.exposure.data, dataset.exposure.data, rtol=1e-3)
+        assert_allclose(
+            dataset_cache.background.data, dataset.background.data, rtol=1e-3
+        )
+        assert_allclose(
+            dataset_cache.edisp.exposure_map.data,
+            dataset.edisp.exposure_map.data,
+            rtol=1e-3,
+        )
+
+    assert maker_cache._cache.hits == 3
+    assert maker_cache._cache.misses == 6
+
+    cache = maker_cache._cache
+    geom_key = cache.geom_key(empty.exposure.geom)
+    assert cache.geom_key(empty.exposure.geom.copy()) == geom_key
+
+    for width in range(1, 2 * cache.max_geoms):
+        cache.geom_key(WcsGeom.create(skydir=pointing, binsz=0.1, width=width))
+
+    assert len(cache._geoms) == cache.max_geoms
+
+    exposure = MapDatasetMaker.make_exposure(empty.exposure.geom, observations[0])
+    assert_allclose(
+        exposure.data, maker_cache.run(empty, observations[0]).exposure.data, rtol=1e-3
+    )
+
+    maker_cache.clear_cache()
+    assert maker_cache._cache.size == 0
+
+    maker_small = MapDatasetMaker(selection=["exposure"], cache_size=1 * u.kB)
+    maker_small.run(empty, observations[0])
+    assert maker_small._cache.size == 0
+
+
+def test_map_dataset_maker_shared_irf(tmp_path, monkeypatch):
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=5)
+    energy_axis_true = energy_axis.copy(name="energy_true")
+    offset_axis = MapAxis.from_bounds(0, 5, nbin=4, unit="deg", name="offset")
+    aeff = EffectiveAreaTable2D(
+        axes=[energy_axis_true, offset_axis], data=np.ones((5, 4)), unit="km2"
+    )
+
+    data = np.ones((5, 4))
+    data[2] = 0
+    bkg = Background2D(
+        axes=[energy_axis, offset_axis], data=data, unit="s-1 MeV-1 sr-1"
+    )
+    bkg.write(tmp_path / "bkg.fits")
+
+    monkeypatch.setattr("gammapy.utils.fits.IRF_CACHE", _IRFCache(max_size="1 MB"))
+
+    location = HDULocation(
+        hdu_class="bkg_2d",
+        base_dir=tmp_path,
+        file_dir=".",
+        file_name="bkg.fits",
+        hdu_name="BACKGROUND",
+    )
+    observations = [
+        Observation.create(
+            pointing=FixedPointingInfo(fixed_icrs=SkyCoord(83.6, 22.0, unit="deg")),
+            livetime=1 * u.h,
+            irfs={"aeff": aeff, "bkg": location},
+            tstart=0 * u.h,
+            obs_id=obs_id,
+        )
+        for obs_id in [1, 2]
+    ]
+
+    assert observations[0].bkg is observations[1].bkg
+
+    geom = WcsGeom.create(
+        skydir=(83.6, 22.0), binsz=0.1, width=1, frame="icrs", axes=[energy_axis]
+    )
+    empty = MapDataset.create(geom)
+
+    maker_interp = MapDatasetMaker(selection=["background"])
+    maker = MapDatasetMaker(
+        selection=["background"], background_interp_missing_data=False
+    )
+
+    dataset_interp = maker_interp.run(empty, observations[0])
+    dataset = maker.run(empty, observations[1])
+
+    observation = observations[1].copy(
+        in_memory=True, bkg=Background2D.read(location.path())
+    )
+    reference = maker.run(empty, observation)
+
+    assert_allclose(dataset.background.data, reference.background.data)
+    assert np.all(dataset_interp.background.data[2] > 1e3 * dataset.background.data[2])
+    assert_allclose(observations[1].bkg.data[2], 0)
+    assert not observations[1].bkg.data.flags.writeable
@@ -1,14 +1,24 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import Angle, SkyCoord
+from astropy.table import Table
 from regions import CircleSkyRegion, PointSkyRegion
-from gammapy.data import DataStore, Observation
+from gammapy.data import (
+    DataStore,
+    EventList,
+    FixedPointingInfo,
+    Observation,
+    Observations,
+)
 from gammapy.datasets import MapDataset, SpectrumDataset
+from gammapy.irf import Background2D, EffectiveAreaTable2D
 from gammapy.makers import (
     DatasetsMaker,
+    Maker,
     FoVBackgroundMaker,
     MapDatasetMaker,
     ReflectedRegionsBackgroundMaker,
@@ -222,6 +232,36 @@ def test_datasets_maker_map(pars, observations_cta, makers_map, map_dataset):
         assert_allclose(exposure.data.mean(), 2.436063e09, rtol=3e-3)
 
 
+@requires_data()
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("use_stack_path", [False, True])
+def test_datasets_maker_map_stack_batches(
+    n_jobs, use_stack_path, observations_cta, makers_map, map_dataset, tmp_path
+):
+    makers = DatasetsMaker(
+        makers_map,
+        stack_datasets=True,
+        cutout_mode="partial",
+        n_jobs=n_jobs,
+        parallel_backend="multiprocessing",
+        stack_batch_size=2,
+        stack_path=tmp_path if use_stack_path else None,
+    )
+
+    datasets = makers.run(map_dataset, observations_cta)
+    assert len(datasets) == 1
+
+    counts = datasets[0].counts
+    assert counts.unit == ""
+    assert_allclose(counts.data.sum(), 46716, rtol=1e-5)
+
+    exposure = datasets[0].exposure
+    assert exposure.unit == "m2 s"
+    assert_allclose(exposure.data.mean(), 1.350841e09, rtol=3e-3)
+
+    assert len(list(tmp_path.iterdir())) == 0
+
+
 @requires_data()
 def test_failure_datasets_maker_map(
     observations_cta_with_issue, makers_map, map_dataset
@@ -239,6 +279,190 @@ def test_failure_datasets_maker_map(
         makers.run(map_dataset, observations_cta_with_issue)
 
 
+@pytest.fixture()
+def observations_synthetic():
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=5)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "100 TeV", nbin=5, name="energy_true"
+    )
+    offset_axis = MapAxis.from_bounds(0, 5, nbin=5, unit="deg", name="offset")
+    irfs = {
+        "aeff": EffectiveAreaTable2D(
+            axes=[energy_axis_true, offset_axis], data=np.ones((5, 5)), unit="km2"
+        ),
+        "bkg": Background2D(
+            axes=[energy_axis, offset_axis],
+            data=5e-6 * np.ones((5, 5)),
+            unit="s-1 MeV-1 sr-1",
+        ),
+    }
+
+    rng = np.random.default_rng(0)
+    pointing = SkyCoord(83.6, 22.0, unit="deg")
+    observations = []
+
+    for obs_id in [1, 2, 3]:
+        observation = Observation.create(
+            pointing=FixedPointingInfo(fixed_icrs=pointing),
+            livetime=1 * u.h,
+            irfs=irfs,
+            tstart=0 * u.h,
+            obs_id=obs_id,
+        )
+        table = Table()
+        table["RA"] = pointing.ra + rng.uniform(-1, 1, 1000) * u.deg
+        table["DEC"] = pointing.dec + rng.uniform(-1, 1, 1000) * u.deg
+        table["ENERGY"] = 10 ** rng.uniform(-1, 2, 1000) * u.TeV
+        table["TIME"] = rng.uniform(0, 3600, 1000) * u.s
+        observation.events = EventList(table)
+        observations.append(observation)
+
+    return observations
+
+
+@pytest.fixture()
+def map_dataset_synthetic():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = WcsGeom.create(
+        skydir=(83.6, 22.0), binsz=0.2, width=2, frame="icrs", axes=[energy_axis]
+    )
+    return MapDataset.create(geom, name="synthetic")
+
+
+class FailingMaker(Maker):
+    tag = "FailingMaker"
+
+    def run(self, dataset, observation):
+        if observation.obs_id == 2:
+            raise ValueError("Invalid observation\nsee details")
+        return dataset
+
+
+@pytest.mark.parametrize("stack_datasets", [False, True])
+def test_datasets_maker_checkpoint_models(
+    observations_synthetic, map_dataset_synthetic, stack_datasets, tmp_path
+):
+    makers = [
+        MapDatasetMaker(selection=["counts", "background", "exposure"]),
+        FoVBackgroundMaker(),
+    ]
+    datasets = DatasetsMaker(makers, stack_datasets=stack_datasets).run(
+        map_dataset_synthetic.copy(name="synthetic"), observations_synthetic
+    )
+
+    if not stack_datasets:
+        assert_allclose(datasets[0].models[0].spectral_model.norm.value, 2, rtol=0.2)
+
+    maker = DatasetsMaker(
+        makers, stack_datasets=stack_datasets, checkpoint_path=tmp_path
+    )
+    maker.run(map_dataset_synthetic.copy(name="synthetic"), observations_synthetic)
+
+    maker.make_dataset = None
+    datasets_resumed = maker.run(
+        map_dataset_synthetic.copy(name="synthetic"), observations_synthetic
+    )
+
+    assert len(datasets_resumed) == len(datasets)
+
+    for dataset, dataset_resumed in zip(datasets, datasets_resumed):
+        assert_allclose(
+            dataset_resumed.npred_background().data,
+            dataset.npred_background().data,
+        )
+
+
+def test_datasets_maker_checkpoint_failure(
+    observations_synthetic, map_dataset_synthetic, tmp_path
+):
+    maker = DatasetsMaker(
+        [MapDatasetMaker(selection=["counts"]), FailingMaker()],
+        stack_datasets=False,
+        checkpoint_path=tmp_path,
+    )
+
+    for _ in range(2):
+        datasets = maker.run(map_dataset_synthetic, observations_synthetic)
+        assert len(datasets) == 2
+
+        manifest = maker.read_manifest()
+        manifest.add_index("OBS_ID")
+        assert list(manifest.loc[["1", "2", "3"]]["STATUS"]) == [
+            "done",
+            "failed",
+            "done",
+        ]
+        error = manifest.loc["2"]["ERROR"]
+        assert error == "ValueError: Invalid observation see details"
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"stack_batch_size": 2}, {"checkpoint_path": "checkpoint"}]
+)
+def test_datasets_maker_prefetch(
+    observations_synthetic, map_dataset_synthetic, kwargs, tmp_path, monkeypatch
+):
+    if "checkpoint_path" in kwargs:
+        kwargs = {"checkpoint_path": tmp_path / kwargs["checkpoint_path"]}
+
+    makers = [MapDatasetMaker(selection=["counts", "background", "exposure"])]
+    stacked = DatasetsMaker(makers).run(
+        map_dataset_synthetic.copy(name="synthetic"), observations_synthetic
+    )
+
+    calls = []
+    in_memory_generator = Observations.in_memory_generator
+
+    def spy(self, prefetch=None):
+        calls.append(prefetch)
+        return in_memory_generator(self, prefetch=prefetch)
+
+    monkeypatch.setattr(Observations, "in_memory_generator", spy)
+
+    observations = Observations(observations_synthetic, prefetch=2)
+    stacked_prefetch = DatasetsMaker(makers, n_jobs=1, **kwargs).run(
+        map_dataset_synthetic.copy(name="synthetic"), observations
+    )
+
+    assert len(calls) == 1
+    assert_allclose(stacked_prefetch[0].counts.data, stacked[0].counts.data)
+    assert_allclose(
+        stacked_prefetch[0].background.data, stacked[0].background.data, rtol=1e-6
+    )
+
+
+@requires_data()
+def test_datasets_maker_map_checkpoint(
+    observations_cta_with_issue, makers_map, map_dataset, tmp_path
+):
+    makers = DatasetsMaker(
+        makers_map,
+        stack_datasets=False,
+        cutout_mode="partial",
+        n_jobs=2,
+        parallel_backend="multiprocessing",
+        checkpoint_path=tmp_path,
+    )
+
+    datasets = makers.run(map_dataset, observations_cta_with_issue)
+    assert len(datasets) == 2
+
+    manifest = makers.read_manifest()
+    assert len(manifest) == 3
+
+    done = manifest[manifest["STATUS"] == "done"]
+    assert len(done) == 2
+    assert (tmp_path / done["FILENAME"][0]).exists()
+
+    makers.make_dataset = None
+    datasets_resumed = makers.run(map_dataset, observations_cta_with_issue[:2])
+
+    assert datasets_resumed.names == datasets.names
+    assert_allclose(
+        datasets_resumed[0].counts.data.sum(), datasets[0].counts.data.sum()
+    )
+
+
 @requires_data()
 @requires_dependency("ray")
 def test_datasets_maker_map_ray(observations_cta, makers_map, map_dataset):
@@ -331,6 +555,18 @@ def test_datasets_maker_spectrum(observations_hess, makers_spectrum, spectrum_da
     assert_allclose(exposure.data.mean(), 3.94257338e08, rtol=3e-3)
 
 
+@requires_data()
+def test_datasets_maker_spectrum_prefetch(makers_spectrum, spectrum_dataset):
+    datastore = DataStore.from_dir("$GAMMAPY_DATA/hess-dl3-dr1/")
+    observations = datastore.get_observations([23523, 23526], prefetch=2)
+
+    makers = DatasetsMaker(makers_spectrum, stack_datasets=False, n_jobs=1)
+    datasets = makers.run(spectrum_dataset, observations)
+
+    assert [_.meta_table["OBS_ID"][0] for _ in datasets] == [23523, 23526]
+    assert_allclose(datasets[0].counts.data.sum(), 192, rtol=1e-5)
+
+
 @requires_data()
 def test_datasets_maker_spectrum_large_region(
     observations_hess, makers_spectrum_large_region, spectrum_dataset
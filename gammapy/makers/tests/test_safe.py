@@ -308,3 +308,33 @@ def test_safe_mask_maker_bkg_invalid(observations_hess_dl3):
 
     dataset = safe_mask_maker_nonan.run(dataset, obs)
     assert_allclose(dataset.mask_safe, mask_nonan)
+
+
+@requires_data()
+@pytest.mark.parametrize("irfs", ["DL3", "DL4"])
+def test_safe_mask_maker_make_masks(dataset, shifted_dataset, observations, irfs):
+    safe_mask_maker = SafeMaskMaker(
+        methods=["aeff-default", "aeff-max", "edisp-bias", "offset-max", "bkg-peak"],
+        irfs=irfs,
+        fixed_offset=0.5 * u.deg,
+    )
+
+    datasets = [dataset, shifted_dataset]
+    masks = safe_mask_maker.make_masks(datasets, observations)
+
+    for mask, dataset, observation in zip(masks, datasets, observations):
+        expected = safe_mask_maker.make_mask_bkg_invalid(dataset)
+        expected &= safe_mask_maker.make_mask_offset_max(dataset, observation)
+
+        for make_mask in [
+            safe_mask_maker.make_mask_energy_aeff_default,
+            safe_mask_maker.make_mask_energy_aeff_max,
+            safe_mask_maker.make_mask_energy_edisp_bias,
+            safe_mask_maker.make_mask_energy_bkg_peak,
+        ]:
+            expected &= make_mask(dataset, observation).data
+
+        assert_allclose(mask.data, expected)
+
+    with pytest.raises(ValueError):
+        safe_mask_maker.make_masks(datasets, observations[:1])
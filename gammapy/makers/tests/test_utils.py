@@ -16,6 +16,7 @@ from gammapy.irf import (
 )
 from gammapy.makers import WobbleRegionsFinder
 from gammapy.makers.utils import (
+    _compute_rotation_time_steps,
     _map_spectrum_weight,
     guess_instrument_fov,
     make_counts_off_rad_max,
@@ -414,6 +415,62 @@ def test_make_map_background_irf_altaz_align(fixed_pointing_info):
     )
 
 
+def test_make_map_background_irf_rotation_steps(monkeypatch):
+    location = EarthLocation(lon="-70d18m58.84s", lat="-24d41m0.34s", height="2000m")
+    pointing = FixedPointingInfo(
+        fixed_icrs=SkyCoord(83.6, 22, unit="deg"), location=location
+    )
+    time_start = Time("2020-01-01T03:00:00")
+    time_stop = time_start + 2 * u.h
+
+    times = _compute_rotation_time_steps(time_start, time_stop, 10 * u.deg, pointing)
+    assert len(times) == 5
+    assert_allclose((times[-1] - time_stop).to_value("s"), 0, atol=1e-6)
+
+    axis = MapAxis.from_edges([0.1, 1, 10], name="energy", unit="TeV", interp="log")
+    geom = WcsGeom.create(
+        npix=(10, 10), binsz=0.1, axes=[axis], skydir=pointing.fixed_icrs
+    )
+    bkg = bkg_3d_custom("asymmetric", "ALTAZ")
+
+    bkg_map = make_map_background_irf(
+        pointing=pointing,
+        ontime=time_stop - time_start,
+        bkg=bkg,
+        geom=geom,
+        time_start=time_start,
+        fov_rotation_step=10 * u.deg,
+    )
+
+    # evaluate each time interval separately without FoV rotation
+    data = np.zeros(geom.data_shape)
+    for start, stop in zip(times[:-1], times[1:]):
+        data += make_map_background_irf(
+            pointing=pointing,
+            ontime=stop - start,
+            bkg=bkg,
+            geom=geom,
+            time_start=start,
+            fov_rotation_step=360 * u.deg,
+        ).data
+
+    assert_allclose(bkg_map.data, data, rtol=1e-6)
+
+    # evaluate the time intervals in chunks of three
+    monkeypatch.setattr(
+        "gammapy.makers.utils.MAX_CHUNK_SIZE", 3 * np.prod(geom.data_shape)
+    )
+    bkg_map_chunked = make_map_background_irf(
+        pointing=pointing,
+        ontime=time_stop - time_start,
+        bkg=bkg,
+        geom=geom,
+        time_start=time_start,
+        fov_rotation_step=10 * u.deg,
+    )
+    assert_allclose(bkg_map_chunked.data, bkg_map.data, rtol=1e-10)
+
+
 def test_make_edisp_kernel_map():
     migra = MapAxis.from_edges(np.linspace(0.5, 1.5, 50), unit="", name="migra")
     etrue = MapAxis.from_energy_bounds(0.5, 2, 6, unit="TeV", name="energy_true")
@@ -591,6 +648,22 @@ class TestTheta2Table:
                 energy_edges=[1.2, 11, 20] * u.TeV,
             )
 
+    def test_make_theta_squared_table_parallel(self):
+        position = SkyCoord(ra=0, dec=0, unit="deg", frame="icrs")
+        axis = MapAxis.from_bounds(0, 0.2, nbin=4, interp="lin", unit="deg2")
+
+        theta2_table = make_theta_squared_table(
+            observations=self.observations,
+            position=position.galactic,
+            theta_squared_axis=axis,
+            n_jobs=2,
+        )
+        assert_allclose(theta2_table["counts"], [4, 0, 0, 0])
+        assert_allclose(theta2_table["counts_off"], [2, 0, 0, 0])
+        assert_allclose(theta2_table["acceptance"], [2, 2, 2, 2])
+        assert_allclose(theta2_table["alpha"], [1, 1, 1, 1])
+        assert_allclose(theta2_table.meta["ON_RA"], 0 * u.deg, atol=1e-10 * u.deg)
+
 
 @requires_data()
 def test_guess_instrument_fov(observations):
@@ -653,3 +726,62 @@ def test_make_effective_livetime_map():
     assert_allclose(obs_time_offset, [0, 0.242814], rtol=1e-3)
 
     assert obs_time.unit == u.hr
+
+
+def test_make_observation_and_effective_livetime_map_parallel():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        0.1 * u.TeV, 100 * u.TeV, nbin=3, name="energy_true"
+    )
+    offset_axis = MapAxis.from_bounds(0, 5, nbin=10, unit="deg", name="offset")
+    aeff = EffectiveAreaTable2D(
+        axes=[energy_axis_true, offset_axis],
+        data=np.ones((3, 10)),
+        unit="m2",
+    )
+
+    source_pos = SkyCoord(83.6, 22.0, unit="deg")
+    observations = [
+        Observation.create(
+            pointing=FixedPointingInfo(
+                fixed_icrs=source_pos.directional_offset_by(angle, 1 * u.deg)
+            ),
+            livetime=1 * u.h,
+            irfs={"aeff": aeff},
+            tstart=0 * u.h,
+            obs_id=idx,
+        )
+        for idx, angle in enumerate([0, 90, 180, 270] * u.deg)
+    ]
+    geom = WcsGeom.create(
+        skydir=source_pos,
+        binsz=0.1,
+        width=(6, 6),
+        frame="galactic",
+        axes=[energy_axis_true],
+    )
+
+    obs_time = make_observation_time_map(observations, geom, offset_max=1.5 * u.deg)
+    obs_time_parallel = make_observation_time_map(
+        observations, geom, offset_max=1.5 * u.deg, n_jobs=2
+    )
+    assert obs_time.unit == u.h
+    assert_allclose(obs_time.get_by_coord(source_pos), 4)
+    assert_allclose(obs_time.data, obs_time_parallel.data)
+
+    livetime = make_effective_livetime_map(observations, geom, offset_max=1.5 * u.deg)
+    livetime_parallel = make_effective_livetime_map(
+        observations, geom, offset_max=1.5 * u.deg, n_jobs=2
+    )
+    assert livetime.unit == u.hr
+    assert_allclose(
+        livetime.get_by_coord((source_pos, energy_axis_true.center)), 4, rtol=1e-5
+    )
+    assert_allclose(livetime.data, livetime_parallel.data, rtol=1e-6)
+
+    obs_time = make_observation_time_map([], geom)
+    assert obs_time.geom == geom.to_image()
+    assert_allclose(obs_time.data, 0)
+
+    livetime = make_effective_livetime_map([], geom)
+    assert livetime.geom == geom
+    assert_allclose(livetime.data, 0)
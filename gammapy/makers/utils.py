@@ -1,11 +1,13 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import warnings
+from itertools import repeat
 import numpy as np
 import astropy.units as u
-from astropy.coordinates import Angle
+from astropy.coordinates import Angle, SkyCoord, angular_separation
 from astropy.table import Table
 from astropy.time import Time
+import gammapy.utils.parallel as parallel
 from gammapy.data import FixedPointingInfo
 from gammapy.irf import BackgroundIRF, EDispMap, FoVAlignment, PSFMap
 from gammapy.maps import Map, RegionNDMap
@@ -31,11 +33,29 @@ log = logging.getLogger(__name__)
 
 MINIMUM_TIME_STEP = 1 * u.s  # Minimum time step used to handle FoV rotations
 EARTH_ANGULAR_VELOCITY = 360 * u.deg / u.day
+ROTATION_RATE_TIME_STEP = 10 * u.s  # Time step used to sample the FoV rotation rate
+MAX_CHUNK_SIZE = 10_000_000  # Maximum number of values computed at once
 
 
 def _get_fov_coords(pointing, irf, geom, use_region_center=True, obstime=None):
     # TODO: create dedicated coordinate handling see #5041
     coords = {}
+
+    if not use_region_center:
+        region_coord, weights = geom.get_wcs_coord_and_weights()
+        sky_coord = region_coord.skycoord
+
+    else:
+        image_geom = geom.to_image()
+        map_coord = image_geom.get_coord()
+        sky_coord = map_coord.skycoord
+
+    time_shape = ()
+    if obstime is not None and not obstime.isscalar:
+        # evaluate all times at once along additional leading axes
+        time_shape = obstime.shape
+        obstime = obstime.reshape(time_shape + (1,) * sky_coord.ndim)
+
     if isinstance(pointing, FixedPointingInfo):
         # for backwards compatibility, obstime should be required
         if obstime is None:
@@ -50,15 +70,6 @@ def _get_fov_coords(pointing, irf, geom, use_region_center=True, obstime=None):
     else:
         pointing_icrs = pointing
 
-    if not use_region_center:
-        region_coord, weights = geom.get_wcs_coord_and_weights()
-        sky_coord = region_coord.skycoord
-
-    else:
-        image_geom = geom.to_image()
-        map_coord = image_geom.get_coord()
-        sky_coord = map_coord.skycoord
-
     if irf.has_offset_axis:
         coords["offset"] = sky_coord.separation(pointing_icrs)
     else:
@@ -94,6 +105,12 @@ def _get_fov_coords(pointing, irf, geom, use_region_center=True, obstime=None):
 
         coords["fov_lon"] = fov_lon
         coords["fov_lat"] = fov_lat
+
+    if time_shape:
+        shape = time_shape + sky_coord.shape
+        for key, value in coords.items():
+            coords[key] = np.broadcast_to(value, shape, subok=True)
+
     return coords
 
 
@@ -122,22 +139,31 @@ def _compute_rotation_time_steps(time_start, time_stop, fov_rotation, pointing_a
         Times associated with the requested rotation.
     """
 
-    def _time_step(rotation, pnt_altaz):
-        denom = (
-            EARTH_ANGULAR_VELOCITY
-            * np.cos(pnt_altaz.location.lat.rad)
-            * np.abs(np.cos(pnt_altaz.az.rad))
-        )
-        return rotation * np.cos(pnt_altaz.alt.rad) / denom
+    # evaluate the rotation rate at once on a regular time grid
+    duration = (time_stop - time_start).to_value("s")
+    n_grid = int(np.ceil(duration / ROTATION_RATE_TIME_STEP.to_value("s"))) + 1
+    offsets = np.linspace(0, duration, max(n_grid, 2))
+    pnt_altaz = pointing_altaz.get_altaz(time_start + offsets * u.s)
+
+    rate = (
+        EARTH_ANGULAR_VELOCITY.to_value("deg s-1")
+        * np.cos(pnt_altaz.location.lat.rad)
+        * np.abs(np.cos(pnt_altaz.az.rad))
+        / np.cos(pnt_altaz.alt.rad)
+    )
 
-    time = time_start
+    rotation = fov_rotation.to_value("deg")
+    minimum_time_step = MINIMUM_TIME_STEP.to_value("s")
+
+    time = 0.0
     times = [time]
-    while time < time_stop:
-        time_step = _time_step(fov_rotation, pointing_altaz.get_altaz(time))
-        time_step = max(time_step, MINIMUM_TIME_STEP)
-        time = min(time + time_step, time_stop)
+    while time < duration:
+        with np.errstate(divide="ignore"):
+            time_step = rotation / np.interp(time, offsets, rate)
+        time_step = max(time_step, minimum_time_step)
+        time = min(time + time_step, duration)
         times.append(time)
-    return Time(times)
+    return time_start + u.Quantity(times, "s")
 
 
 def make_map_exposure_true_energy(
@@ -227,12 +253,13 @@ def _map_spectrum_weight(map, spectrum=None):
     return map * weights.reshape(shape.astype(int))
 
 
-def _integrate_bkg(
-    pointing, bkg, geom, time_start, time_stop, d_omega, use_region_center
-):
+def _integrate_bkg(pointing, bkg, geom, times, d_omega, use_region_center):
     """
     Integrate the background IRF on a given geometry.
 
+    The time intervals are evaluated in chunks, the FoV coordinates at the
+    center of each interval of a chunk are stacked along an additional axis.
+
     Parameters
     ----------
     pointing :  `~gammapy.data.FixedPointingInfo` or `~astropy.coordinates.SkyCoord`
@@ -241,10 +268,8 @@ def _integrate_bkg(
         Background rate model.
     geom : `~gammapy.maps.WcsGeom`
         Reference geometry.
-    time_start : `~astropy.time.Time`
-        Observation time start.
-    time_stop : `~astropy.time.Time`
-        Observation time stop.
+    times : `~astropy.time.Time`
+        Edges of the observation time intervals.
     d_omega : 'astropy.units.Quantity'
         Solid angle of the image geometry.
     use_region_center : bool, optional
@@ -254,21 +279,37 @@ def _integrate_bkg(
     Returns
     -------
     evaluated_bkg : `numpy.ndarray`
-        Background IRF evaluated on the provided geometry
+        Background IRF evaluated on the provided geometry, summed over the time intervals.
 
     """
-    duration = time_stop - time_start
-    coords = _get_fov_coords(
-        pointing=pointing,
-        irf=bkg,
-        geom=geom,
-        use_region_center=use_region_center,
-        obstime=time_start + duration * 0.5,
-    )
-    coords["energy"] = broadcast_axis_values_to_geom(geom, "energy", False)
+    durations = (times[1:] - times[:-1]).to(u.s)
+    obstime = times[:-1] + durations * 0.5
+    energy = broadcast_axis_values_to_geom(geom, "energy", False)
+
+    n_chunk = max(MAX_CHUNK_SIZE // max(energy.size * d_omega.size, 1), 1)
+    data = 0
+
+    for idx in range(0, len(durations), n_chunk):
+        chunk = slice(idx, idx + n_chunk)
+        coords = _get_fov_coords(
+            pointing=pointing,
+            irf=bkg,
+            geom=geom,
+            use_region_center=use_region_center,
+            obstime=obstime[chunk],
+        )
 
-    bkg_de = bkg.integrate_log_log(**coords, axis_name="energy")
-    return (bkg_de * d_omega * duration).to_value("")
+        spatial_shape = next(iter(coords.values())).shape[1:]
+        shape = np.broadcast_shapes(energy.shape, spatial_shape)
+        coords["energy"] = energy.reshape((-1,) + (1,) * (1 + len(spatial_shape)))
+
+        bkg_de = bkg.integrate_log_log(**coords, axis_name="energy")
+
+        weights = durations[chunk].reshape((-1,) + (1,) * len(spatial_shape))
+        bkg_dt = np.sum(bkg_de * weights, axis=1).reshape((-1,) + shape[1:])
+        data = data + (bkg_dt * d_omega).to_value("")
+
+    return data
 
 
 def make_map_background_irf(
@@ -350,16 +391,10 @@ def make_map_background_irf(
         image_geom = geom.to_image()
         d_omega = image_geom.solid_angle()
 
-    data = np.zeros(geom.data_shape)
-    for start, stop in zip(times[:-1], times[1:]):
-        npred = _integrate_bkg(
-            pointing, bkg, geom, start, stop, d_omega, use_region_center
-        )
+    data = _integrate_bkg(pointing, bkg, geom, times, d_omega, use_region_center)
 
-        if not use_region_center:
-            region_coord, weights = geom.get_wcs_coord_and_weights()
-            npred = np.sum(weights * npred, axis=2, keepdims=True)
-        data += npred
+    if not use_region_center:
+        data = np.sum(weights * data, axis=2, keepdims=True)
 
     bkg_map = Map.from_geom(geom, data=data)
 
@@ -511,8 +546,32 @@ def make_edisp_kernel_map(
     return edisp_map.to_edisp_kernel_map(geom.axes["energy"])
 
 
+def _get_theta_squared_events(observation, energy_edges=None):
+    """Event coordinates, pointing position and livetime of an observation."""
+    events = observation.events
+
+    if energy_edges is not None:
+        events = events.select_energy(energy_range=energy_edges)
+
+    lon, lat = events.get_lonlat(frame="icrs")
+    pointing = observation.get_pointing_icrs(observation.tmid)
+    return {
+        "ra": np.deg2rad(lon),
+        "dec": np.deg2rad(lat),
+        "pointing_ra": pointing.ra.rad,
+        "pointing_dec": pointing.dec.rad,
+        "livetime": observation.observation_live_time_duration.to_value("s"),
+    }
+
+
 def make_theta_squared_table(
-    observations, theta_squared_axis, position, position_off=None, energy_edges=None
+    observations,
+    theta_squared_axis,
+    position,
+    position_off=None,
+    energy_edges=None,
+    n_jobs=None,
+    parallel_backend=None,
 ):
     """Make theta squared distribution in the same FoV for a list of `~gammapy.data.Observation` objects.
 
@@ -523,6 +582,9 @@ def make_theta_squared_table(
     The ON and OFF regions are assumed to be of the same size, so the normalisation
     factor between both region alpha = 1.
 
+    The event coordinates of all observations are concatenated, so that the
+    separations and histograms are computed once for all observations.
+
     Parameters
     ----------
     observations: `~gammapy.data.Observations`
@@ -538,6 +600,12 @@ def make_theta_squared_table(
         Edges of the energy bin where the theta squared distribution
         is evaluated. For now, only one interval is accepted.
         Default is None.
+    n_jobs : int, optional
+        Number of processes used in parallel to read the events. If None,
+        defaults to `~gammapy.utils.parallel.N_JOBS_DEFAULT`. Default is None.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing. If None, defaults to
+        `~gammapy.utils.parallel.BACKEND_DEFAULT`. Default is None.
 
     Returns
     -------
@@ -557,11 +625,6 @@ def make_theta_squared_table(
     table["acceptance"] = 0.0
     table["acceptance_off"] = 0.0
 
-    alpha_tot = np.zeros(len(table))
-    livetime_tot = 0
-
-    create_off = position_off is None
-
     if energy_edges is not None:
         if len(energy_edges) == 2:
             table.meta["Energy_filter"] = energy_edges
@@ -570,45 +633,70 @@ def make_theta_squared_table(
                 f"Only  supports one energy interval but {len(energy_edges) - 1} passed."
             )
 
-    for observation in observations:
-        events = observation.events
-        if energy_edges is not None:
-            events = events.select_energy(energy_range=energy_edges)
-
-        event_position = events.radec
-        pointing = observation.get_pointing_icrs(observation.tmid)
-
-        separation = position.separation(event_position)
-        counts, _ = np.histogram(separation**2, theta_squared_axis.edges)
-        table["counts"] += counts
-
-        if create_off:
-            # Estimate the position of the mirror position
-            pos_angle = pointing.position_angle(position)
-            sep_angle = pointing.separation(position)
-            position_off = pointing.directional_offset_by(
-                pos_angle + Angle(np.pi, "rad"), sep_angle
-            )
-
-        # Angular distance of the events from the mirror position
-        separation_off = position_off.separation(event_position)
+    if n_jobs is None:
+        n_jobs = parallel.N_JOBS_DEFAULT
 
-        # Extract the ON and OFF theta2 distribution from the two positions.
-        counts_off, _ = np.histogram(separation_off**2, theta_squared_axis.edges)
-        table["counts_off"] += counts_off
+    results = parallel.run_multiprocessing(
+        _get_theta_squared_events,
+        zip(observations, repeat(energy_edges)),
+        backend=parallel_backend,
+        pool_kwargs=dict(processes=n_jobs),
+        task_name="Observations",
+    )
 
-        # Normalisation between ON and OFF is one
-        acceptance = np.ones(theta_squared_axis.nbin)
-        acceptance_off = np.ones(theta_squared_axis.nbin)
+    n_events = [len(result["ra"]) for result in results]
+    index = np.repeat(np.arange(len(results)), n_events)
+    ra = np.concatenate([result["ra"] for result in results])
+    dec = np.concatenate([result["dec"] for result in results])
 
-        table["acceptance"] += acceptance
-        table["acceptance_off"] += acceptance_off
-        alpha = acceptance / acceptance_off
-        alpha_tot += alpha * observation.observation_live_time_duration.to_value("s")
-        livetime_tot += observation.observation_live_time_duration.to_value("s")
+    position = position.icrs
 
-    alpha_tot /= livetime_tot
-    table["alpha"] = alpha_tot
+    if position_off is None:
+        # Estimate the mirror positions w.r.t. the pointing positions
+        pointing = SkyCoord(
+            [result["pointing_ra"] for result in results],
+            [result["pointing_dec"] for result in results],
+            unit="rad",
+            frame="icrs",
+        )
+        pos_angle = pointing.position_angle(position)
+        sep_angle = pointing.separation(position)
+        position_off = pointing.directional_offset_by(
+            pos_angle + Angle(np.pi, "rad"), sep_angle
+        )
+        ra_off, dec_off = position_off.ra.rad[index], position_off.dec.rad[index]
+    else:
+        position_off = position_off.icrs
+        ra_off, dec_off = position_off.ra.rad, position_off.dec.rad
+
+    # Angular distance of the events from the on and off positions
+    separation = angular_separation(position.ra.rad, position.dec.rad, ra, dec)
+    separation_off = angular_separation(ra_off, dec_off, ra, dec)
+
+    # Fill the on and off histograms with a single bincount
+    nbin = theta_squared_axis.nbin
+    edges = theta_squared_axis.edges.to_value("deg2")
+    theta2 = np.rad2deg(np.concatenate([separation, separation_off])) ** 2
+
+    idx = np.searchsorted(edges, theta2, side="right") - 1
+    # the last bin includes its upper edge, as in `~numpy.histogram`
+    idx[theta2 == edges[-1]] = nbin - 1
+    valid = (idx >= 0) & (idx < nbin)
+    idx[len(ra) :] += nbin
+
+    counts = np.bincount(idx[valid], minlength=2 * nbin)
+    table["counts"] += counts[:nbin]
+    table["counts_off"] += counts[nbin:]
+
+    # Normalisation between ON and OFF is one
+    livetime = np.array([result["livetime"] for result in results])
+    acceptance = np.ones(theta_squared_axis.nbin)
+    acceptance_off = np.ones(theta_squared_axis.nbin)
+
+    table["acceptance"] += len(results) * acceptance
+    table["acceptance_off"] += len(results) * acceptance_off
+    alpha = acceptance / acceptance_off
+    table["alpha"] = np.sum(alpha * livetime[:, np.newaxis], axis=0) / livetime.sum()
 
     stat = WStatCountsStatistic(table["counts"], table["counts_off"], table["alpha"])
     table["excess"] = stat.n_sig
@@ -616,8 +704,8 @@ def make_theta_squared_table(
     table["excess_errn"] = stat.compute_errn()
     table["excess_errp"] = stat.compute_errp()
 
-    table.meta["ON_RA"] = position.icrs.ra
-    table.meta["ON_DEC"] = position.icrs.dec
+    table.meta["ON_RA"] = position.ra
+    table.meta["ON_DEC"] = position.dec
     return table
 
 
@@ -682,7 +770,50 @@ def make_counts_off_rad_max(geom_off, rad_max, events):
     return counts_off
 
 
-def make_observation_time_map(observations, geom, offset_max=None):
+def _split_observations(observations, n_jobs):
+    """Split observations in at most ``n_jobs`` batches."""
+    n_batches = max(min(n_jobs, len(observations)), 1)
+    return [
+        [observations[idx] for idx in batch]
+        for batch in np.array_split(np.arange(len(observations)), n_batches)
+    ]
+
+
+def _make_observation_time_batch(observations, lon, lat, offset_max):
+    """Observation time in hours summed over a batch of observations.
+
+    The offsets of all pixels are computed for chunks of observations at once.
+    """
+    data = np.zeros(lon.shape)
+
+    if len(observations) == 0:
+        return data
+
+    pointings = [obs.get_pointing_icrs(obs.tmid) for obs in observations]
+    lon_pnt = u.Quantity([_.ra for _ in pointings]).to_value("rad")
+    lat_pnt = u.Quantity([_.dec for _ in pointings]).to_value("rad")
+    livetime = u.Quantity([obs.observation_live_time_duration for obs in observations])
+    livetime = livetime.to_value("h")
+
+    n_chunk = max(MAX_CHUNK_SIZE // max(lon.size, 1), 1)
+
+    for idx in range(0, len(observations), n_chunk):
+        chunk = slice(idx, idx + n_chunk)
+        offset = angular_separation(
+            lon_pnt[chunk, np.newaxis],
+            lat_pnt[chunk, np.newaxis],
+            lon.ravel(),
+            lat.ravel(),
+        )
+        mask = offset < offset_max.to_value("rad")
+        data += (livetime[chunk] @ mask).reshape(lon.shape)
+
+    return data
+
+
+def make_observation_time_map(
+    observations, geom, offset_max=None, n_jobs=None, parallel_backend=None
+):
     """
     Compute the total observation time on the target geometry
     for a list of observations.
@@ -696,6 +827,12 @@ def make_observation_time_map(observations, geom, offset_max=None):
     offset_max : `~astropy.units.quantity.Quantity`, optional
         The maximum offset FoV. Default is None.
         If None, it will be taken from the IRFs.
+    n_jobs : int, optional
+        Number of processes used in parallel. If None, defaults to
+        `~gammapy.utils.parallel.N_JOBS_DEFAULT`. Default is None.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing. If None, defaults to
+        `~gammapy.utils.parallel.BACKEND_DEFAULT`. Default is None.
 
     Returns
     -------
@@ -704,42 +841,45 @@ def make_observation_time_map(observations, geom, offset_max=None):
     """
     geom = geom.to_image()
     stacked = Map.from_geom(geom, unit=u.h)
-    for obs in observations:
-        if offset_max is None:
-            offset_max = guess_instrument_fov(obs)
-        coords = geom.get_coord(sparse=True)
-        offset = coords.skycoord.separation(obs.get_pointing_icrs(obs.tmid))
-        mask = offset < offset_max
-        c1 = coords.apply_mask(mask)
-        weights = np.ones(c1.shape) * obs.observation_live_time_duration
-        stacked.fill_by_coord(coords=c1, weights=weights)
-    return stacked
 
+    observations = list(observations)
 
-def make_effective_livetime_map(observations, geom, offset_max=None):
-    """
-    Compute the acceptance corrected livetime map
-    for a list of observations.
+    if not observations:
+        return stacked
 
-    Parameters
-    ----------
-    observations : `~gammapy.data.Observations`
-        Observations container containing list of observations.
-    geom : `~gammapy.maps.Geom`
-        Reference geometry.
-    offset_max : `~astropy.units.quantity.Quantity`, optional
-        The maximum offset FoV. Default is None.
+    if offset_max is None:
+        offset_max = guess_instrument_fov(observations[0])
 
-    Returns
-    -------
-     exposure : `~gammapy.maps.Map`
-        Effective livetime.
-    """
+    if n_jobs is None:
+        n_jobs = parallel.N_JOBS_DEFAULT
+
+    skycoord = geom.get_coord().skycoord.icrs
+    lon, lat = skycoord.ra.rad, skycoord.dec.rad
 
+    results = parallel.run_multiprocessing(
+        _make_observation_time_batch,
+        zip(
+            _split_observations(observations, n_jobs),
+            repeat(lon),
+            repeat(lat),
+            repeat(Angle(offset_max)),
+        ),
+        backend=parallel_backend,
+        pool_kwargs=dict(processes=n_jobs),
+        task_name="Observations",
+    )
+
+    for data in results:
+        stacked.data += data
+
+    return stacked
+
+
+def _make_effective_livetime_batch(observations, geom, offset_max):
+    """Effective livetime summed over a batch of observations."""
     livetime = Map.from_geom(geom, unit=u.hr)
+
     for obs in observations:
-        if offset_max is None:
-            offset_max = guess_instrument_fov(obs)
         geom_obs = geom.cutout(
             position=obs.get_pointing_icrs(obs.tmid), width=2.0 * offset_max
         )
@@ -761,6 +901,65 @@ def make_effective_livetime_map(observations, geom, offset_max=None):
         on_axis = on_axis.reshape((on_axis.shape[0], 1, 1))
         lv_obs = exposure * mask / on_axis
         livetime.stack(lv_obs)
+
+    return livetime
+
+
+def make_effective_livetime_map(
+    observations, geom, offset_max=None, n_jobs=None, parallel_backend=None
+):
+    """
+    Compute the acceptance corrected livetime map
+    for a list of observations.
+
+    Parameters
+    ----------
+    observations : `~gammapy.data.Observations`
+        Observations container containing list of observations.
+    geom : `~gammapy.maps.Geom`
+        Reference geometry.
+    offset_max : `~astropy.units.quantity.Quantity`, optional
+        The maximum offset FoV. Default is None.
+    n_jobs : int, optional
+        Number of processes used in parallel. If None, defaults to
+        `~gammapy.utils.parallel.N_JOBS_DEFAULT`. Default is None.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing. If None, defaults to
+        `~gammapy.utils.parallel.BACKEND_DEFAULT`. Default is None.
+
+    Returns
+    -------
+     exposure : `~gammapy.maps.Map`
+        Effective livetime.
+    """
+    livetime = Map.from_geom(geom, unit=u.hr)
+
+    observations = list(observations)
+
+    if not observations:
+        return livetime
+
+    if offset_max is None:
+        offset_max = guess_instrument_fov(observations[0])
+
+    if n_jobs is None:
+        n_jobs = parallel.N_JOBS_DEFAULT
+
+    results = parallel.run_multiprocessing(
+        _make_effective_livetime_batch,
+        zip(
+            _split_observations(observations, n_jobs),
+            repeat(geom),
+            repeat(offset_max),
+        ),
+        backend=parallel_backend,
+        pool_kwargs=dict(processes=n_jobs),
+        task_name="Observations",
+    )
+
+    for result in results:
+        livetime.data += result.data
+
     return livetime
 
 
@@ -3,7 +3,7 @@
 import copy
 import numpy as np
 from astropy import units as u
-from astropy.coordinates import SkyCoord
+from astropy.coordinates import Angle, SkyCoord
 from astropy.io import fits
 from astropy.units import Quantity
 from gammapy.utils.array import is_power2
@@ -637,6 +637,86 @@ class HpxGeom(Geom):
         coord = self.to_image().get_coord()
         return center.separation(coord.skycoord)
 
+    def get_disc_neighbours(self, radius):
+        """Compute the neighbour pixels within a given radius of each pixel.
+
+        A pixel is a neighbour if its center lies within the given radius
+        from the center of the reference pixel. Pixels outside of a
+        partial-sky geometry are ignored. The search is done per group of
+        pixels, using a single disc query for all pixels of a coarser
+        HEALPix super-pixel.
+
+        Parameters
+        ----------
+        radius : `~astropy.coordinates.Angle` or str
+            Disc radius.
+
+        Returns
+        -------
+        neighbours : `~scipy.sparse.csr_matrix`
+            Sparse matrix of shape (npix, npix), where npix is the number of
+            pixels of the image geometry. The row ``i`` stores the local indices
+            of the neighbours of pixel ``i``, with the separation in radians as
+            value, including explicit zeros for the pixel itself.
+        """
+        import healpy as hp
+        from scipy.sparse import csr_matrix
+
+        if not self.is_regular:
+            raise NotImplementedError(
+                "Disc neighbours are not supported for irregular geometries."
+            )
+
+        geom = self.to_image()
+        nside, npix = geom.nside.item(), geom.npix.item()
+        radius = Angle(radius).rad
+
+        ipix = np.arange(npix) if geom._ipix is None else geom._ipix
+        vec = np.stack(hp.pix2vec(nside, ipix, nest=geom.nest), axis=-1)
+
+        # group pixels by super-pixels of roughly the size of the disc
+        nside_tile = nside
+        while nside_tile > 1 and (
+            nside // nside_tile < 8 or hp.nside2resol(nside_tile) < radius
+        ):
+            nside_tile //= 2
+
+        ipix_nest = ipix if geom.nest else hp.ring2nest(nside, ipix)
+        tiles = ipix_nest // (nside // nside_tile) ** 2
+        radius_tile = radius + hp.max_pixrad(nside_tile)
+
+        rows, cols, separation = [], [], []
+
+        order = np.argsort(tiles, kind="stable")
+        tiles_unique, idx_start = np.unique(tiles[order], return_index=True)
+
+        for tile, idx in zip(tiles_unique, np.split(order, idx_start[1:])):
+            vec_tile = hp.pix2vec(nside_tile, tile, nest=True)
+            ipix_nb = hp.query_disc(
+                nside, vec_tile, radius_tile, inclusive=True, nest=geom.nest
+            )
+
+            if geom._ipix is not None:
+                idx_nb = np.searchsorted(geom._ipix, ipix_nb)
+                valid = idx_nb < npix
+                valid[valid] = geom._ipix[idx_nb[valid]] == ipix_nb[valid]
+                idx_nb = idx_nb[valid]
+            else:
+                idx_nb = ipix_nb
+
+            cos_sep = np.clip(vec[idx] @ vec[idx_nb].T, -1, 1)
+            i, j = np.where(cos_sep >= np.cos(radius))
+            rows.append(idx[i])
+            cols.append(idx_nb[j])
+            separation.append(np.arccos(cos_sep[i, j]))
+
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        separation = np.concatenate(separation)
+
+        order = np.lexsort((cols, rows))
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=npix))])
+        return csr_matrix((separation[order], cols[order], indptr), shape=(npix, npix))
+
     def to_swapped(self):
         """Geometry copy with swapped ORDERING (NEST->RING or vice versa).
 
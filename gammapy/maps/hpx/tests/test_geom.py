@@ -856,3 +856,21 @@ def test_hpx_geom_separation():
 def test_check_nside():
     with pytest.raises(ValueError):
         HpxGeom.create(nside=3)
+
+
+@pytest.mark.parametrize("nest", [True, False])
+def test_hpx_geom_get_disc_neighbours(nest):
+    geom = HpxGeom.create(nside=256, frame="galactic", nest=nest, region="DISK(0,0,2)")
+    neighbours = geom.get_disc_neighbours("0.5 deg")
+
+    assert neighbours.shape == (geom.npix.item(), geom.npix.item())
+    assert_allclose(neighbours.diagonal(), 0, atol=1e-6)
+
+    skycoord = geom.get_coord().skycoord
+
+    for idx in [0, 100, 200]:
+        separation = skycoord[idx].separation(skycoord).rad
+        row = neighbours[idx]
+        expected = np.flatnonzero(separation <= np.radians(0.5))
+        assert_allclose(np.sort(row.indices), expected)
+        assert_allclose(row.toarray()[0, expected], separation[expected], atol=1e-6)
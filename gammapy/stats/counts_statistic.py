@@ -1,10 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import abc
+import copy
 import html
 import numpy as np
 from scipy.special import lambertw
 from scipy.stats import chi2
-from gammapy.utils.roots import find_roots
+from gammapy.utils.roots import find_roots_bracketed
 from .fit_statistics import cash, wstat
 
 __all__ = ["WStatCountsStatistic", "CashCountsStatistic"]
@@ -100,6 +101,17 @@ class CountsStatistic(abc.ABC):
         info_dict["p_value"] = self.p_value
         return info_dict
 
+    def _ravel(self):
+        """Copy with all the arrays broadcast to a common shape and flattened."""
+        stat = copy.copy(self)
+        names = list(vars(self))
+        arrays = np.broadcast_arrays(*[getattr(self, name) for name in names])
+
+        for name, array in zip(names, arrays):
+            setattr(stat, name, array.ravel())
+
+        return stat
+
     def compute_errn(self, n_sigma=1.0):
         """Compute downward excess uncertainties.
 
@@ -110,25 +122,18 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
         """
-        errn = np.zeros_like(self.n_sig, dtype="float")
-        min_range = self.n_sig - 2 * n_sigma * (self.error + 1)
-
-        it = np.nditer(errn, flags=["multi_index"])
-        while not it.finished:
-            roots, res = find_roots(
-                self._stat_fcn,
-                min_range[it.multi_index],
-                self.n_sig[it.multi_index],
-                nbin=1,
-                args=(self.stat_max[it.multi_index] + n_sigma**2, it.multi_index),
-            )
-            if np.isnan(roots[0]):
-                errn[it.multi_index] = self.n_on[it.multi_index]
-            else:
-                errn[it.multi_index] = self.n_sig[it.multi_index] - roots[0]
-            it.iternext()
-
-        return errn
+        stat = self._ravel()
+        index = np.arange(stat.n_sig.size)
+        min_range = stat.n_sig - 2 * n_sigma * (stat.error + 1)
+
+        roots = find_roots_bracketed(
+            stat._stat_fcn,
+            min_range,
+            stat.n_sig,
+            args=(stat.stat_max + n_sigma**2, index),
+        )
+        errn = np.where(np.isnan(roots), stat.n_on, stat.n_sig - roots)
+        return errn.reshape(np.shape(self.n_sig))
 
     def compute_errp(self, n_sigma=1):
         """Compute upward excess uncertainties.
@@ -140,22 +145,17 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the uncertainty expressed in number of sigma. Default is 1.
         """
-        errp = np.zeros_like(self.n_on, dtype="float")
-        max_range = self.n_sig + 2 * n_sigma * (self.error + 1)
-
-        it = np.nditer(errp, flags=["multi_index"])
-        while not it.finished:
-            roots, res = find_roots(
-                self._stat_fcn,
-                self.n_sig[it.multi_index],
-                max_range[it.multi_index],
-                nbin=1,
-                args=(self.stat_max[it.multi_index] + n_sigma**2, it.multi_index),
-            )
-            errp[it.multi_index] = roots[0]
-            it.iternext()
-
-        return errp - self.n_sig
+        stat = self._ravel()
+        index = np.arange(stat.n_sig.size)
+        max_range = stat.n_sig + 2 * n_sigma * (stat.error + 1)
+
+        roots = find_roots_bracketed(
+            stat._stat_fcn,
+            stat.n_sig,
+            max_range,
+            args=(stat.stat_max + n_sigma**2, index),
+        )
+        return (roots - stat.n_sig).reshape(np.shape(self.n_sig))
 
     def compute_upper_limit(self, n_sigma=3):
         """Compute upper limit on the signal.
@@ -168,25 +168,20 @@ class CountsStatistic(abc.ABC):
         n_sigma : float
             Confidence level of the upper limit expressed in number of sigma. Default is 3.
         """
-        ul = np.zeros_like(self.n_on, dtype="float")
-
-        min_range = self.n_sig
-        max_range = min_range + 2 * n_sigma * (self.error + 1)
-        it = np.nditer(ul, flags=["multi_index"])
-
-        while not it.finished:
-            ts_ref = self._stat_fcn(min_range[it.multi_index], 0.0, it.multi_index)
-
-            roots, res = find_roots(
-                self._stat_fcn,
-                min_range[it.multi_index],
-                max_range[it.multi_index],
-                nbin=1,
-                args=(ts_ref + n_sigma**2, it.multi_index),
-            )
-            ul[it.multi_index] = roots[0]
-            it.iternext()
-        return ul
+        stat = self._ravel()
+        index = np.arange(stat.n_sig.size)
+
+        min_range = stat.n_sig
+        max_range = min_range + 2 * n_sigma * (stat.error + 1)
+        ts_ref = stat._stat_fcn(min_range, 0.0, index)
+
+        ul = find_roots_bracketed(
+            stat._stat_fcn,
+            min_range,
+            max_range,
+            args=(ts_ref + n_sigma**2, index),
+        )
+        return ul.reshape(np.shape(self.n_sig))
 
     @abc.abstractmethod
     def _n_sig_matching_significance_fcn(self):
@@ -207,26 +202,31 @@ class CountsStatistic(abc.ABC):
         n_sig : `numpy.ndarray`
             Excess.
         """
-        n_sig = np.zeros_like(self.n_bkg, dtype="float")
-        it = np.nditer(n_sig, flags=["multi_index"])
-
-        while not it.finished:
-            lower_bound = np.sqrt(self.n_bkg[it.multi_index]) * significance
-            # find upper bounds for secant method as in scipy
-            eps = 1e-4
-            upper_bound = lower_bound * (1 + eps)
-            upper_bound += eps if upper_bound >= 0 else -eps
-            roots, res = find_roots(
-                self._n_sig_matching_significance_fcn,
-                lower_bound=lower_bound,
-                upper_bound=upper_bound,
-                args=(significance, it.multi_index),
-                nbin=1,
-                method="secant",
+        stat = self._ravel()
+        index = np.arange(stat.n_bkg.size)
+        fcn = stat._n_sig_matching_significance_fcn
+
+        if significance >= 0:
+            lower_bound = np.zeros(index.size)
+            upper_bound = np.sqrt(stat.n_bkg) * significance + 1
+
+            # expand the upper bounds until the significance is reached
+            idx = index
+            for _ in range(100):
+                idx = idx[fcn(upper_bound[idx], significance, idx) < 0]
+                if idx.size == 0:
+                    break
+                upper_bound[idx] *= 2
+        else:
+            # the lowest significance is reached for zero counts
+            lower_bound = -stat.n_bkg.astype(float)
+            upper_bound = np.zeros(index.size)
+
+        with np.errstate(invalid="ignore"):
+            n_sig = find_roots_bracketed(
+                fcn, lower_bound, upper_bound, args=(significance, index)
             )
-            n_sig[it.multi_index] = roots[0]  # return NaN if fail
-            it.iternext()
-        return n_sig
+        return n_sig.reshape(np.shape(self.n_bkg))
 
     @abc.abstractmethod
     def sum(self, axis=None):
@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Utility functions to deal with arrays and quantities."""
 import numpy as np
+import scipy.fft
 import scipy.ndimage
 import scipy.signal
 from astropy.convolution import Gaussian2DKernel
@@ -165,6 +166,90 @@ def _fftconvolve_wrap(kernel, data):
         )
 
 
+def _kernels_fft(kernels, shape):
+    """Compute the FFT of a set of kernels on a common padded shape.
+
+    The padded shape is large enough to compute the linear convolution of
+    an image of the given shape with any of the kernels, so that the FFT of
+    the image has to be computed only once for all kernels.
+
+    Parameters
+    ----------
+    kernels : list of `~astropy.convolution.Kernel`
+        List of convolution kernels.
+    shape : tuple of int
+        Shape of the images to convolve.
+
+    Returns
+    -------
+    fft_shape : tuple of int
+        Padded shape used for the FFT.
+    kernels_fft : list of `~numpy.ndarray`
+        FFT of the kernels. The entry is None for Gaussian kernels, which are
+        applied with `~scipy.ndimage.gaussian_filter` instead.
+    """
+    arrays = [_.array for _ in kernels if not isinstance(_, Gaussian2DKernel)]
+
+    if not arrays:
+        return None, [None] * len(kernels)
+
+    kernel_shape = np.max([_.shape for _ in arrays], axis=0)
+    fft_shape = tuple(
+        scipy.fft.next_fast_len(int(n + m - 1), real=True)
+        for n, m in zip(shape, kernel_shape)
+    )
+
+    kernels_fft = []
+
+    for kernel in kernels:
+        if isinstance(kernel, Gaussian2DKernel):
+            kernels_fft.append(None)
+        else:
+            kernels_fft.append(scipy.fft.rfftn(kernel.array, fft_shape))
+
+    return fft_shape, kernels_fft
+
+
+def _convolve_scales(data, kernels, kernels_fft=None):
+    """Convolve data with a set of kernels, one kernel at a time.
+
+    The FFT of the data is computed once and multiplied with the spectrum
+    of each kernel. The result for each kernel is identical to
+    ``scipy.signal.fftconvolve(data, kernel.array, mode="same")``.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        Input 2D data.
+    kernels : list of `~astropy.convolution.Kernel`
+        List of convolution kernels.
+    kernels_fft : tuple, optional
+        Precomputed kernel spectra as returned by `_kernels_fft`. Default is None.
+
+    Yields
+    ------
+    image : `~numpy.ndarray`
+        Data convolved with the next kernel.
+    """
+    if kernels_fft is None:
+        kernels_fft = _kernels_fft(kernels, data.shape)
+
+    fft_shape, spectra = kernels_fft
+    data_fft = None
+
+    for kernel, spectrum in zip(kernels, spectra):
+        if spectrum is None:
+            yield _fftconvolve_wrap(kernel, data)
+            continue
+
+        if data_fft is None:
+            data_fft = scipy.fft.rfftn(data.astype(np.float32), fft_shape)
+
+        full = scipy.fft.irfftn(data_fft * spectrum, fft_shape)
+        iy, ix = [(n - 1) // 2 for n in kernel.array.shape]
+        yield full[iy : iy + data.shape[0], ix : ix + data.shape[1]]
+
+
 def scale_cube(data, kernels):
     """
     Compute scale space cube.
@@ -184,4 +269,4 @@ def scale_cube(data, kernels):
     cube : `~numpy.ndarray`
         Array of the shape (len(kernels), data.shape).
     """
-    return np.dstack([_fftconvolve_wrap(kernel, data) for kernel in kernels])
+    return np.dstack(list(_convolve_scales(data, kernels)))
@@ -2,6 +2,9 @@
 import html
 import logging
 import sys
+import threading
+from collections import OrderedDict
+import numpy as np
 import astropy.units as u
 from astropy.coordinates import AltAz, Angle, EarthLocation, SkyCoord
 from astropy.io import fits
@@ -10,7 +13,118 @@ from .scripts import make_path
 
 log = logging.getLogger(__name__)
 
-__all__ = ["earth_location_from_dict", "LazyFitsData", "HDULocation"]
+__all__ = ["earth_location_from_dict", "LazyFitsData", "HDULocation", "IRF_CACHE"]
+
+
+class _IRFCache:
+    """Least recently used cache of IRFs read from FITS files, with a memory limit.
+
+    IRFs are identified by the resolved file path, the HDU name and the
+    modification time of the file. Observations pointing to the same IRF HDU
+    share a single IRF object, whose data are set read-only.
+
+    Parameters
+    ----------
+    max_size : `~astropy.units.Quantity` or str
+        Maximum memory used by the data of the cached IRFs. A size of zero
+        disables the cache.
+    """
+
+    def __init__(self, max_size):
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.clear()
+
+    @property
+    def max_size(self):
+        """Maximum memory used by the cached IRFs as a `~astropy.units.Quantity`."""
+        return self._max_size * u.byte
+
+    @max_size.setter
+    def max_size(self, value):
+        self._max_size = u.Quantity(value, "byte").to_value("byte")
+
+        if hasattr(self, "_irfs"):
+            with self._lock:
+                self._evict()
+
+    def __len__(self):
+        return len(self._irfs)
+
+    def clear(self):
+        """Remove all IRFs from the cache and reset the statistics."""
+        with self._lock:
+            self._irfs = OrderedDict()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    @staticmethod
+    def make_key(filename, hdu):
+        """Make IRF cache key."""
+        path = make_path(filename).resolve()
+        return path.as_posix(), str(hdu).upper(), path.stat().st_mtime_ns
+
+    @staticmethod
+    def _nbytes(irf):
+        return np.asarray(irf.data).nbytes
+
+    def _evict(self):
+        while self.size > self._max_size and self._irfs:
+            _, evicted = self._irfs.popitem(last=False)
+            self.size -= self._nbytes(evicted)
+
+    def get(self, filename, hdu, read):
+        """Get IRF from the cache, or read it and add it to the cache.
+
+        Parameters
+        ----------
+        filename : `~pathlib.Path` or str
+            Filename.
+        hdu : str
+            HDU name.
+        read : callable
+            Function reading the IRF.
+
+        Returns
+        -------
+        irf : `~gammapy.irf.IRF`
+            IRF.
+        """
+        if self._max_size <= 0:
+            return read()
+
+        key = self.make_key(filename, hdu)
+
+        with self._lock:
+            if key in self._irfs:
+                self.hits += 1
+                self._irfs.move_to_end(key)
+                return self._irfs[key]
+
+            self.misses += 1
+
+        irf = read()
+        nbytes = self._nbytes(irf)
+
+        if nbytes > self._max_size or not isinstance(irf.data, np.ndarray):
+            return irf
+
+        irf.data.flags.writeable = False
+
+        with self._lock:
+            if key in self._irfs:
+                return self._irfs[key]
+
+            self._irfs[key] = irf
+            self.size += nbytes
+            self._evict()
+
+        return irf
+
+
+IRF_CACHE = _IRFCache(max_size="1 GB")
+"""Process-wide cache of the IRFs loaded with `HDULocation.load`."""
 
 
 class HDULocation:
@@ -33,6 +147,7 @@ class HDULocation:
         hdu_name=None,
         cache=True,
         format=None,
+        events_cache_dir=None,
     ):
         self.hdu_class = hdu_class
         self.base_dir = base_dir
@@ -41,6 +156,7 @@ class HDULocation:
         self.hdu_name = hdu_name
         self.cache = cache
         self.format = format
+        self.events_cache_dir = events_cache_dir
 
     def _repr_html_(self):
         try:
@@ -79,7 +195,12 @@ class HDULocation:
         return hdu_list[self.hdu_name]
 
     def load(self):
-        """Load HDU as appropriate class."""
+        """Load HDU as appropriate class.
+
+        IRFs are shared between the HDU locations pointing to the same file and HDU
+        through `~gammapy.utils.fits.IRF_CACHE`. Events are read through the on-disk
+        cache in ``events_cache_dir``, if set.
+        """
         from gammapy.irf import IRF_REGISTRY
 
         hdu_class = self.hdu_class
@@ -89,7 +210,9 @@ class HDULocation:
         if hdu_class == "events":
             from gammapy.data import EventList
 
-            return EventList.read(filename, hdu=hdu)
+            return EventList.read(
+                filename, hdu=hdu, lazy=True, cache_dir=self.events_cache_dir
+            )
         elif hdu_class == "gti":
             from gammapy.data.gti import GTI
 
@@ -112,7 +235,9 @@ class HDULocation:
         else:
             cls = IRF_REGISTRY.get_cls(hdu_class)
 
-            return cls.read(filename, hdu=hdu)
+            return IRF_CACHE.get(
+                filename, hdu, read=lambda: cls.read(filename, hdu=hdu)
+            )
 
 
 class LazyFitsData(object):
@@ -1,7 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Multiprocessing and multithreading setup."""
 import importlib
+import itertools
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from gammapy.utils.pbar import progress_bar
 
@@ -9,6 +12,7 @@ log = logging.getLogger(__name__)
 
 __all__ = [
     "multiprocessing_manager",
+    "prefetch_generator",
     "run_multiprocessing",
     "BACKEND_DEFAULT",
     "N_JOBS_DEFAULT",
@@ -330,6 +334,51 @@ def run_pool_async(pool, func, inputs, method_kwargs=None, task_name=""):
     return results
 
 
+def prefetch_generator(func, inputs, max_in_flight=2, n_threads=None):
+    """Apply a function to the inputs in a thread pool, ahead of consumption.
+
+    At most ``max_in_flight`` results are computed or kept in memory ahead of
+    the one being consumed. The results are yielded in the order of the inputs.
+
+    Parameters
+    ----------
+    func : function
+        Function to run, called with a single input.
+    inputs : iterable
+        Inputs to pass to the function.
+    max_in_flight : int, optional
+        Maximum number of tasks submitted ahead of consumption. Default is 2.
+    n_threads : int, optional
+        Number of threads. Default is None, which uses ``max_in_flight``.
+
+    Yields
+    ------
+    result : object
+        Result of the function for each input.
+    """
+    if max_in_flight < 1:
+        raise ValueError(f"max_in_flight must be positive, got {max_in_flight}")
+
+    inputs = iter(inputs)
+    futures = deque()
+
+    with ThreadPoolExecutor(max_workers=n_threads or max_in_flight) as executor:
+        try:
+            for value in itertools.islice(inputs, max_in_flight):
+                futures.append(executor.submit(func, value))
+
+            while futures:
+                future = futures.popleft()
+
+                for value in itertools.islice(inputs, 1):
+                    futures.append(executor.submit(func, value))
+
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
 POOL_METHODS = {
     PoolMethodEnum.starmap: run_pool_star_map,
     PoolMethodEnum.apply_async: run_pool_async,
@@ -139,3 +139,109 @@ def find_roots(
         except (RuntimeError, ValueError):
             continue
     return roots * unit, results
+
+
+def find_roots_bracketed(
+    f,
+    lower_bound,
+    upper_bound,
+    args=(),
+    xtol=2e-12,
+    rtol=4 * np.finfo(float).eps,
+    maxiter=100,
+):
+    """Find the root of a scalar function element-wise over arrays of brackets.
+
+    All the elements are solved at once with a vectorized implementation of
+    Chandrupatla's method, which combines bisection and inverse quadratic
+    interpolation. At each iteration the function is evaluated only for the
+    elements that did not converge yet.
+
+    Parameters
+    ----------
+    f : callable
+        Function to find the roots of, called as ``f(x, *args)`` with ``x`` a 1D
+        array. It should return an array of the same shape as ``x``.
+    lower_bound : `~numpy.ndarray`
+        Lower bounds of the brackets.
+    upper_bound : `~numpy.ndarray`
+        Upper bounds of the brackets.
+    args : tuple, optional
+        Extra arguments passed to the function. Arrays are broadcast to the shape
+        of the bounds, flattened, and restricted to the elements being solved.
+        Default is ().
+    xtol : float, optional
+        Absolute tolerance for termination. Default is 2e-12.
+    rtol : float, optional
+        Relative tolerance for termination. Default is four times the machine
+        precision.
+    maxiter : int, optional
+        Maximum number of iterations. Default is 100.
+
+    Returns
+    -------
+    roots : `~numpy.ndarray`
+        The function roots, with the shape of the bounds. NaN is returned where
+        the function does not change sign over the bracket or the solver did
+        not converge.
+    """
+    lower_bound, upper_bound = np.broadcast_arrays(
+        np.asarray(lower_bound, dtype=float), np.asarray(upper_bound, dtype=float)
+    )
+    shape = lower_bound.shape
+
+    args = [
+        np.broadcast_to(arg, shape).ravel() if np.ndim(arg) else arg for arg in args
+    ]
+
+    def evaluate(x, idx):
+        values = f(x, *[arg[idx] if np.ndim(arg) else arg for arg in args])
+        return np.broadcast_to(np.asarray(values, dtype=float), x.shape)
+
+    x1, x2 = lower_bound.ravel(), upper_bound.ravel()
+    idx = np.arange(x1.size)
+    f1, f2 = evaluate(x1, idx), evaluate(x2, idx)
+
+    roots = np.full(x1.size, np.nan)
+    roots[f2 == 0] = x2[f2 == 0]
+    roots[f1 == 0] = x1[f1 == 0]
+
+    valid = np.sign(f1) * np.sign(f2) < 0
+    idx, x1, x2, f1, f2 = idx[valid], x1[valid], x2[valid], f1[valid], f2[valid]
+    x3, f3 = x2, f2
+    t = np.full(idx.size, 0.5)
+
+    for _ in range(maxiter):
+        if idx.size == 0:
+            break
+
+        xt = x1 + t * (x2 - x1)
+        ft = evaluate(xt, idx)
+
+        same_sign = np.sign(ft) == np.sign(f1)
+        x3, f3 = np.where(same_sign, x1, x2), np.where(same_sign, f1, f2)
+        x2, f2 = np.where(same_sign, x2, x1), np.where(same_sign, f2, f1)
+        x1, f1 = xt, ft
+
+        best = np.abs(f1) < np.abs(f2)
+        xm, fm = np.where(best, x1, x2), np.where(best, f1, f2)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            tl = (xtol + rtol * np.abs(xm)) / np.abs(x2 - x1)
+            xi = (x1 - x2) / (x3 - x2)
+            phi = (f1 - f2) / (f3 - f2)
+            t = f1 / (f2 - f1) * f3 / (f2 - f3) + (x3 - x1) / (x2 - x1) * f1 / (
+                f3 - f1
+            ) * f2 / (f3 - f2)
+
+        use_iqi = (phi**2 < xi) & ((1 - phi) ** 2 < 1 - xi) & np.isfinite(t)
+        t = np.clip(np.where(use_iqi, t, 0.5), tl, 1 - tl)
+
+        converged = (tl > 0.5) | (fm == 0)
+        roots[idx[converged]] = xm[converged]
+
+        keep = ~converged & np.isfinite(ft)
+        idx, x1, x2, x3 = idx[keep], x1[keep], x2[keep], x3[keep]
+        f1, f2, f3, t = f1[keep], f2[keep], f3[keep], t[keep]
+
+    return roots.reshape(shape)
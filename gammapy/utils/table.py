@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Table helper utilities."""
 
+import zlib
 import numpy as np
 from astropy.table import Table
 from astropy.units import Quantity
@@ -95,3 +96,113 @@ def table_row_to_dict(row, make_quantity=True):
             val = Quantity(val, unit=col.unit)
         data[name] = val
     return data
+
+
+def _columns_checksum(table, colnames):
+    """Checksum of the length, units and content of table columns."""
+    checksum = zlib.crc32(str(len(table)).encode())
+
+    for name in colnames:
+        column = table.columns.get(name)
+
+        if column is None:
+            continue
+
+        data = np.ascontiguousarray(column)
+        meta = f"{name} {column.unit} {data.dtype.str} {data.shape}"
+        checksum = zlib.crc32(meta.encode(), checksum)
+
+        if data.dtype.hasobject:
+            data = str(data.tolist()).encode()
+
+        checksum = zlib.crc32(data, checksum)
+
+        mask = getattr(column, "mask", None)
+
+        if mask is not None:
+            checksum = zlib.crc32(np.ascontiguousarray(mask), checksum)
+
+    return checksum
+
+
+def _columns_key(columns):
+    """Identity, length and data buffer address of columns.
+
+    Computing the key does not depend on the number of rows, but in-place
+    edits of single values leave it unchanged.
+    """
+    key = []
+
+    for column in columns:
+        data = np.asarray(column)
+        key.append((id(column), len(data), data.__array_interface__["data"][0]))
+
+    return tuple(key)
+
+
+def _cached_from_column_buffers(cache, name, columns, compute):
+    """Get a quantity derived from columns, cached until the columns are replaced.
+
+    The cache is invalidated when a column is replaced, resized or moved to
+    another data buffer. In-place edits of single values are not detected and
+    require the cached entry to be dropped explicitly.
+
+    Parameters
+    ----------
+    cache : dict
+        Dictionary the quantity is cached in.
+    name : str
+        Name of the cached quantity.
+    columns : list
+        Columns the quantity is derived from.
+    compute : callable
+        Function computing the quantity.
+
+    Returns
+    -------
+    value : object
+        Cached quantity.
+    """
+    key = _columns_key(columns)
+    cached = cache.get(name)
+
+    if cached is not None and cached[0] == key:
+        return cached[2]
+
+    value = compute()
+    # keep a reference to the columns, so that their ids are not reused
+    cache[name] = (key, columns, value)
+    return value
+
+
+def _cached_from_columns(table, name, colnames, compute):
+    """Get a quantity derived from table columns, cached until the columns change.
+
+    The cache is stored in the table instance and invalidated by any change of
+    the content of the columns, including in-place edits of single values.
+
+    Parameters
+    ----------
+    table : `~astropy.table.Table`
+        Table.
+    name : str
+        Name of the cached quantity.
+    colnames : list of str
+        Names of the columns the quantity is derived from.
+    compute : callable
+        Function computing the quantity.
+
+    Returns
+    -------
+    value : object
+        Cached quantity.
+    """
+    checksum = _columns_checksum(table, colnames)
+    cached = table.__dict__.get(name)
+
+    if cached is not None and cached[0] == checksum:
+        return cached[1]
+
+    value = compute()
+    table.__dict__[name] = (checksum, value)
+    return value
@@ -1,6 +1,9 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from gammapy.utils.array import array_stats_str, shape_2N
+import scipy.signal
+from numpy.testing import assert_allclose
+from astropy.convolution import Gaussian2DKernel, Ring2DKernel, Tophat2DKernel
+from gammapy.utils.array import array_stats_str, scale_cube, shape_2N
 
 
 def test_array_stats_str():
@@ -15,3 +18,19 @@ def test_shape_2N():
     shape = (34, 89, 120, 444)
     expected_shape = (40, 96, 128, 448)
     assert expected_shape == shape_2N(shape=shape, N=3)
+
+
+def test_scale_cube():
+    data = np.zeros((21, 30))
+    data[10, 12] = 1
+
+    kernels = [Tophat2DKernel(2), Ring2DKernel(3, 2), Gaussian2DKernel(1)]
+    cube = scale_cube(data, kernels)
+
+    assert cube.shape == (21, 30, 3)
+
+    for idx, kernel in enumerate(kernels[:2]):
+        desired = scipy.signal.fftconvolve(data, kernel.array, mode="same")
+        assert_allclose(cube[:, :, idx], desired, atol=1e-6)
+
+    assert_allclose(cube[:, :, 2].sum(), kernels[2].array.sum(), rtol=1e-3)
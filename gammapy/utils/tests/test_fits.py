@@ -2,9 +2,17 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
+import astropy.units as u
 from astropy.io import fits
 from astropy.table import Column, Table
-from gammapy.utils.fits import earth_location_from_dict, earth_location_to_dict
+from gammapy.irf import EffectiveAreaTable2D
+from gammapy.maps import MapAxis
+from gammapy.utils.fits import (
+    HDULocation,
+    _IRFCache,
+    earth_location_from_dict,
+    earth_location_to_dict,
+)
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import requires_data
 
@@ -73,3 +81,38 @@ def test_earth_location_to_dict(header):
     assert_allclose(loc_dict["GEOLON"], 16.50022, rtol=1e-4)
     assert_allclose(loc_dict["GEOLAT"], -23.271777, rtol=1e-4)
     assert_allclose(loc_dict["ALTITUDE"], 1834.999999, rtol=1e-4)
+
+
+def test_irf_cache(tmp_path, monkeypatch):
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    offset_axis = MapAxis.from_bounds(0, 2, nbin=2, unit="deg", name="offset")
+    aeff = EffectiveAreaTable2D(
+        axes=[energy_axis_true, offset_axis], data=np.ones((3, 2)), unit="m2"
+    )
+    aeff.write(tmp_path / "aeff.fits")
+
+    cache = _IRFCache(max_size=1 * u.kB)
+    monkeypatch.setattr("gammapy.utils.fits.IRF_CACHE", cache)
+
+    location = HDULocation(
+        hdu_class="aeff_2d",
+        base_dir=tmp_path,
+        file_dir=".",
+        file_name="aeff.fits",
+        hdu_name="EFFECTIVE AREA",
+    )
+    irf, other = location.load(), location.load()
+
+    assert irf is other
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.size == 48
+
+    with pytest.raises(ValueError):
+        irf.data[0, 0] = 2
+
+    cache.max_size = 10 * u.byte
+    assert len(cache) == 0
+    assert location.load() is not irf
@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import threading
 import pytest
 import astropy.units as u
 import gammapy.utils.parallel as parallel
@@ -146,3 +147,26 @@ def test_multiprocessing_manager():
     with parallel.multiprocessing_manager(backend="ray", pool_kwargs=dict(processes=3)):
         assert fpe.parallel_backend == "multiprocessing"
         assert fpe.n_jobs == 2
+
+
+def test_prefetch_generator():
+    lock = threading.Lock()
+    state = {"submitted": 0, "max_in_flight": 0}
+
+    def func(x):
+        with lock:
+            state["submitted"] += 1
+        return x**2
+
+    results = []
+    for result in parallel.prefetch_generator(func, range(10), max_in_flight=3):
+        with lock:
+            in_flight = state["submitted"] - len(results) - 1
+            state["max_in_flight"] = max(state["max_in_flight"], in_flight)
+        results.append(result)
+
+    assert results == [_**2 for _ in range(10)]
+    assert state["max_in_flight"] <= 3
+
+    with pytest.raises(ValueError):
+        list(parallel.prefetch_generator(func, range(10), max_in_flight=0))
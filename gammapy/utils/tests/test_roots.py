@@ -4,7 +4,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
-from gammapy.utils.roots import find_roots
+from gammapy.utils.roots import find_roots, find_roots_bracketed
 
 
 class TestFindRoots:
@@ -48,3 +48,19 @@ class TestFindRoots:
                 upper_bound=self.upper_bound,
                 method="xfail",
             )
+
+
+def test_find_roots_bracketed():
+    def f(x, a):
+        return x**3 - a
+
+    a = np.array([[1, 8, 27], [0, -8, 1e6]])
+    roots = find_roots_bracketed(f, -10, [[3, 3, 3], [1, 3, 1e3]], args=(a,))
+    assert roots.shape == (2, 3)
+    assert_allclose(roots, [[1, 2, 3], [0, -2, 100]], rtol=1e-12, atol=1e-10)
+
+    roots = find_roots_bracketed(f, [0, 4, 0], 3, args=(-1,))
+    assert np.all(np.isnan(roots))
+
+    roots = find_roots_bracketed(np.cos, 0, 3)
+    assert_allclose(roots, np.pi / 2)